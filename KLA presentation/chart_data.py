@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Shared Chart Data for the KLA Presentation Decks
+Numbers drawn by both the matplotlib PNG builders and the native PowerPoint charts,
+kept in one place so the two renderings cannot drift apart
+"""
+
+# Deposition-rate project results (visual supplements, Slide 9): baseline vs optimized
+RESULTS_SUMMARY = [
+    {
+        'title': 'Deposition Rate Improvement',
+        'ylabel': 'Deposition Rate (μm/hour)',
+        'metric': 'rate',
+        'values': [1.0, 1.4],
+        'format': '0.0',
+        'change': '+40%',
+        'fill': 'lightgreen',
+        'accent': 'green',
+        'ylim': 1.6,
+        'change_y': 1.2,
+    },
+    {
+        'title': 'Process Variability Reduction',
+        'ylabel': 'Process Variability (%RSD)',
+        # Values and change come from monte_carlo.process_capability on the recipes
+        'metric': 'rsd',
+        'format': '0.00"%"',
+        'fill': 'lightblue',
+        'accent': 'blue',
+        'ylim': 6,
+        'change_y': 4.5,
+    },
+    {
+        'title': 'Defect Density Reduction',
+        'ylabel': 'Defect Density (relative)',
+        # Values and change come from process_model.defect_density on the recipes
+        'metric': 'defects',
+        'format': '0',
+        'fill': 'lightyellow',
+        'accent': 'orange',
+        'ylim': 120,
+        'change_y': 90,
+    },
+    {
+        'title': 'Manufacturing Cost Reduction',
+        'ylabel': 'Cost per Wafer (relative)',
+        # Values and change come from process_model.wafer_cost on the recipes
+        'metric': 'cost',
+        'format': '0',
+        'fill': 'lightsteelblue',
+        'accent': 'blue',
+        'ylim': 120,
+        'change_y': 92,
+    },
+]
+RESULTS_CATEGORIES = ['Baseline', 'Optimized']
+BASELINE_FILL = 'lightcoral'
+
+# Film quality validation scores out of 10 (visual supplements, Slide 10)
+VALIDATION_METRICS = ['Thickness\nUniformity', 'Surface\nQuality', 'Crystal\nStructure',
+                      'Defect\nDensity', 'Process\nStability', 'Adhesion']
+VALIDATION_SCORES = {
+    'Baseline': [6, 7, 8, 5, 6, 7],
+    'Optimized': [8, 8, 8, 8, 9, 8],
+}
+
+# Thermal calibration project results (thermal and editable decks)
+IMPACT_METRICS = ['Yield\nImprovement', 'Film\nUniformity', 'Process\nEfficiency', 'Cost\nSavings']
+IMPACT_BEFORE = [72, 78, 65, 60]
+IMPACT_AFTER = [100, 90, 88, 85]
+IMPACT_IMPROVEMENTS = [28, 12, 23, 25]
+IMPACT_COLORS = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99']
+
+# Data center cooling project (portfolio site): facility energy split in percent
+COOLING_ENERGY_LABELS = ['Cooling Energy', 'IT Load']
+COOLING_ENERGY_SPLIT = {
+    'Traditional Air-Cooled System': [50, 50],
+    'Target: Liquid-Cooled Hybrid': [30, 70],
+}
+COOLING_ENERGY_COLORS = ['#ff6600', '#00cc66']
+# Air vs liquid cooling results, in each metric's own units
+COOLING_METRICS = ['Cooling Performance', 'Hotspot Reduction', 'Inlet Temp (°C)', 'PUE']
+COOLING_RESULTS = {
+    'Air Cooling': [0, 0, 35, 1.5],
+    'Liquid Cooling': [27, 32, 20, 1.1],
+}
+
+# Bayesian optimization run behind the Slide 8 results table and convergence chart
+SLIDE8_OPTIMIZATION = {
+    'init_points': 10,
+    'n_iter': 15,
+    'acquisition': 'ei',
+}
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Chart Engine for the KLA Presentation Scripts
+Shared styles, figure templates and a batch renderer for the matplotlib chart
+scripts. Builders run in parallel worker processes on the headless Agg backend,
+each PNG is sized for the box it is placed in and optimized after rendering,
+and charts whose rendered PNG is already cached are skipped
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+import shutil
+import filecmp
+import hashlib
+import inspect
+import functools
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import font_manager
+from matplotlib.patches import FancyBboxPatch
+from chart_rng import BASE_SEED
+from optimize_pngs import optimize_png, MIN_PSNR
+
+CACHE_DIR = '.chart_cache'
+# Palette-quantize and recompress every freshly rendered PNG before caching it
+OPTIMIZE_PNGS = True
+
+# Pixels per inch of placed image for each output target. A 13.33" slide shown
+# on a 1920-px projector needs 144; 'print' is for PDF handouts and posters.
+OUTPUT_PROFILES = {
+    'screen': 150,
+    'projector': 144,
+    'print': 300,
+}
+DEFAULT_PROFILE = 'screen'
+
+# Named chart styles. A builder renders inside its style, so charts from decks
+# with different looks can share one process without leaking rcParams.
+STYLES = {
+    'default': {'sheets': [], 'palette': None},
+    'deck': {'sheets': ['seaborn-v0_8'], 'palette': 'husl'},
+    'supplement': {'sheets': ['seaborn-v0_8-whitegrid'], 'palette': 'husl'},
+}
+
+# Scripts whose charts the batch entry point renders by default
+CHART_SCRIPTS = [
+    'create_thermal_presentation',
+    'create_presentation',
+    'create_visual_supplements',
+    'create_slide8_code_visual',
+    'create_slide4_visual',
+    'create_slide4_radial_clean',
+    'create_experience_snapshot',
+    'update_experience_snapshot',
+    'fix_experience_snapshot',
+]
+
+# Every @cached_chart builder, in definition order, for the batch entry point
+CHART_REGISTRY = []
+
+_palettes = {}
+_fonts_warm = False
+
+
+def style_context(name):
+    """rc context for one of the named STYLES (seaborn palettes are built once per process)"""
+    style = STYLES[name]
+    sheets = list(style['sheets'])
+    if style['palette']:
+        if style['palette'] not in _palettes:
+            import seaborn as sns
+            _palettes[style['palette']] = sns.color_palette(style['palette'])
+        sheets.append({'axes.prop_cycle': matplotlib.cycler(color=_palettes[style['palette']])})
+    return plt.style.context(sheets, after_reset=True)
+
+
+def warm_fonts():
+    """Resolve and load the chart fonts once so later charts in the process reuse them"""
+    global _fonts_warm
+    if _fonts_warm:
+        return
+    for weight in ('normal', 'semibold', 'bold'):
+        for slant in ('normal', 'italic'):
+            path = font_manager.findfont(font_manager.FontProperties(weight=weight, style=slant))
+            font_manager.get_font(path)
+    _fonts_warm = True
+
+
+def diagram_canvas(figsize, xlim=None, ylim=None, equal=False):
+    """Blank white figure with hidden axes for box-and-arrow diagrams.
+
+    Data limits default to the figure size in inches, so one data unit is one inch.
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.set_xlim(*(xlim or (0, figsize[0])))
+    ax.set_ylim(*(ylim or (0, figsize[1])))
+    if equal:
+        ax.set_aspect('equal')
+    ax.axis('off')
+    fig.patch.set_facecolor('white')
+    return fig, ax
+
+
+def experience_card(ax, position, size, title, items, color, text_color='white',
+                    header_height=0.8, items_offset=0.45, line_spacing=0.26):
+    """Tinted card with a solid title header and a left-aligned list of bullet lines"""
+    x, y = position
+    w, h = size
+    ax.add_patch(FancyBboxPatch((x-w/2, y-h/2), w, h, boxstyle="round,pad=0.2",
+                                facecolor=color, alpha=0.15, edgecolor=color, linewidth=3))
+
+    header_y = y + h/2 - header_height - 0.05
+    ax.add_patch(FancyBboxPatch((x-w/2+0.15, header_y), w-0.3, header_height,
+                                boxstyle="round,pad=0.1", facecolor=color, alpha=0.95))
+    ax.text(x, header_y + header_height/2, title, ha='center', va='center',
+            fontsize=13, fontweight='bold', color=text_color)
+
+    item_y = y + h/2 - header_height - items_offset
+    for item in items:
+        ax.text(x-w/2+0.4, item_y, item, ha='left', va='top',
+                fontsize=11, color=color, fontweight='600')
+        item_y -= line_spacing
+
+
+def alignment_panel(ax, center, y, height, width, title, columns, column_x,
+                    title_offset=0.7, points_offset=0.2, point_spacing=0.35, color='#1f4e79'):
+    """Full-width summary panel with a heading and columns of checklist points"""
+    ax.add_patch(FancyBboxPatch((center - width/2, y - height/2), width, height,
+                                boxstyle="round,pad=0.3", facecolor=color, alpha=0.12,
+                                edgecolor=color, linewidth=3))
+    ax.text(center, y + title_offset, title, ha='center', va='center',
+            fontsize=16, fontweight='bold', color=color)
+    for x, points in zip(column_x, columns):
+        point_y = y + points_offset
+        for point in points:
+            ax.text(x, point_y, point, ha='left', va='center',
+                    fontsize=12, color=color, fontweight='600')
+            point_y -= point_spacing
+
+
+def output_dpi(profile=None):
+    """Resolution of the active output profile (``CHART_PROFILE`` env var, else screen)"""
+    profile = profile or os.environ.get('CHART_PROFILE', DEFAULT_PROFILE)
+    if profile not in OUTPUT_PROFILES:
+        raise ValueError(f"Unknown chart profile '{profile}', expected one of {sorted(OUTPUT_PROFILES)}")
+    return OUTPUT_PROFILES[profile]
+
+
+def save_chart(path, width, height=None, profile=None, fig=None, **savefig_kwargs):
+    """Save a figure with just enough pixels for a ``width`` x ``height`` inch box.
+
+    The figure keeps its figsize, so fonts and layout are unchanged; only the
+    save DPI is chosen so the tight-cropped PNG covers the placed box at the
+    profile's resolution. Extra keyword arguments go to ``savefig``.
+    """
+    fig = fig or plt.gcf()
+    savefig_kwargs.setdefault('bbox_inches', 'tight')
+    pad = savefig_kwargs.get('pad_inches', matplotlib.rcParams['savefig.pad_inches'])
+
+    if savefig_kwargs['bbox_inches'] == 'tight':
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer())
+        image_w, image_h = bbox.width + 2 * pad, bbox.height + 2 * pad
+    else:
+        image_w, image_h = fig.get_size_inches()
+
+    # PowerPoint stretches the picture to the box, so cover the tighter axis
+    scale = width / image_w
+    if height is not None:
+        scale = max(scale, height / image_h)
+    dpi = max(1, round(output_dpi(profile) * scale))
+    fig.savefig(path, dpi=dpi, **savefig_kwargs)
+    return path
+
+
+def _feed(digest, value):
+    """Feed a chart input into the hash, byte-exact for numpy arrays"""
+    if isinstance(value, np.ndarray):
+        digest.update(f'ndarray{value.dtype}{value.shape}'.encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'{')
+        for key in sorted(value, key=repr):
+            _feed(digest, key)
+            _feed(digest, value[key])
+        digest.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'[')
+        for item in value:
+            _feed(digest, item)
+        digest.update(b']')
+    elif callable(value) or inspect.ismodule(value):
+        digest.update(inspect.getsource(value).encode())
+    else:
+        digest.update(repr(value).encode())
+
+
+def chart_key(chart_function, args=(), kwargs=None, depends=()):
+    """Content hash of everything that determines a chart's pixels.
+
+    Covers the builder's source, its arguments, any extra inputs it reads
+    (``depends``: data objects, helper functions or whole modules), the
+    active matplotlib style (rcParams, which include the seaborn palette), the
+    output profile resolution, the synthetic-data seed, the PNG optimizer
+    settings and the matplotlib version.
+    """
+    digest = hashlib.sha256()
+    digest.update(inspect.getsource(chart_function).encode())
+    _feed(digest, list(args))
+    _feed(digest, kwargs or {})
+    _feed(digest, list(depends))
+    style = {k: v for k, v in matplotlib.rcParams.items() if not k.startswith('backend')}
+    digest.update(repr(sorted(style.items())).encode())
+    digest.update(f'{output_dpi()}dpi seed{BASE_SEED}'.encode())
+    digest.update(f'optimize{OPTIMIZE_PNGS} psnr{MIN_PSNR}'.encode())
+    digest.update(matplotlib.__version__.encode())
+    return digest.hexdigest()
+
+
+def cached_chart(chart_function=None, depends=(), style='default'):
+    """Decorator that renders a builder in its named style and caches its PNG.
+
+    The builder must return the path it saved. On a cache hit the stored PNG is
+    copied back to that path (if it is missing or different) and the builder is
+    not called. Use ``@cached_chart(depends=[DATA, helper, module])`` for inputs
+    that live outside the function body and ``style=`` to pick one of STYLES.
+    """
+    if chart_function is None:
+        return functools.partial(cached_chart, depends=depends, style=style)
+
+    @functools.wraps(chart_function)
+    def wrapper(*args, **kwargs):
+        with style_context(style):
+            return _render_cached(chart_function, args, kwargs, depends)
+
+    wrapper.uncached = chart_function
+    CHART_REGISTRY.append(wrapper)
+    return wrapper
+
+
+def _render_cached(chart_function, args, kwargs, depends):
+    """Return the cached PNG for this call, rendering and storing it on a miss"""
+    key = chart_key(chart_function, args, kwargs, depends)
+    cached_png = os.path.join(CACHE_DIR, key + '.png')
+    index_file = os.path.join(CACHE_DIR, key + '.json')
+
+    if os.path.exists(cached_png) and os.path.exists(index_file):
+        with open(index_file) as f:
+            path = json.load(f)['path']
+        if not os.path.exists(path) or not filecmp.cmp(path, cached_png, shallow=False):
+            shutil.copyfile(cached_png, path)
+        print(f"  {chart_function.__name__}: cached -> {path}")
+        return path
+
+    path = chart_function(*args, **kwargs)
+    if OPTIMIZE_PNGS and path.lower().endswith('.png'):
+        optimize_png(path)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    shutil.copyfile(path, cached_png)
+    with open(index_file, 'w') as f:
+        json.dump({'path': path, 'chart': chart_function.__name__}, f)
+    return path
+
+
+def _init_worker():
+    """Pin every worker to the non-interactive backend and load fonts once per worker"""
+    matplotlib.use('Agg')
+    warm_fonts()
+
+
+def _run_chart(chart_function):
+    """Run one chart builder, trapping its errors so one broken chart cannot sink the batch"""
+    start = time.perf_counter()
+    try:
+        path = chart_function()
+        error = None
+    except Exception:
+        path = None
+        error = traceback.format_exc()
+    return path, error, time.perf_counter() - start
+
+
+def render_charts(chart_functions, max_workers=None):
+    """Render chart builders in parallel and return their output paths in input order.
+
+    Each builder must be a module-level function that saves its figure to a fixed
+    file name and returns that path. A builder that raises is reported and
+    yields ``None`` in its slot; the others still complete.
+    """
+    chart_functions = list(chart_functions)
+    max_workers = max_workers or min(len(chart_functions), os.cpu_count() or 1)
+    start = time.perf_counter()
+
+    if max_workers <= 1:
+        warm_fonts()
+        results = [_run_chart(chart_function) for chart_function in chart_functions]
+    else:
+        # Hand each worker runs of charts rather than one chart per round trip
+        chunksize = max(1, len(chart_functions) // (max_workers * 2))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+            results = list(pool.map(_run_chart, chart_functions, chunksize=chunksize))
+
+    paths = []
+    for chart_function, (path, error, elapsed) in zip(chart_functions, results):
+        if error:
+            print(f"Error rendering {chart_function.__name__}:\n{error}")
+        else:
+            print(f"  {chart_function.__name__:<40} {elapsed:5.2f}s  -> {path}")
+        paths.append(path)
+
+    # Builders sharing an output file race in the pool and can cache each other's PNG
+    rendered = [path for path in paths if path is not None]
+    for path in sorted({path for path in rendered if rendered.count(path) > 1}):
+        owners = [f.__name__ for f, p in zip(chart_functions, paths) if p == path]
+        print(f"Warning: {', '.join(owners)} all write {path}; give each builder its own file")
+
+    print(f"Rendered {sum(p is not None for p in paths)}/{len(paths)} charts "
+          f"in {time.perf_counter() - start:.2f}s using {max_workers} worker(s)")
+    return paths
+
+
+def render_scripts(scripts=None, max_workers=None):
+    """Import the chart scripts once and render every registered chart in one batch"""
+    for script in scripts or CHART_SCRIPTS:
+        importlib.import_module(os.path.splitext(os.path.basename(script))[0])
+    return render_charts(CHART_REGISTRY, max_workers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the charts of every presentation script in one batch")
+    parser.add_argument('scripts', nargs='*', help=f"chart scripts (default: {', '.join(CHART_SCRIPTS)})")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="worker processes")
+    parser.add_argument('--profile', choices=sorted(OUTPUT_PROFILES), help="output resolution profile")
+    args = parser.parse_args()
+
+    if args.profile:
+        os.environ['CHART_PROFILE'] = args.profile
+    # The scripts register with the importable module, not with this __main__ copy
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    engine = importlib.import_module('chart_engine')
+    paths = engine.render_scripts(args.scripts, args.jobs)
+    sys.exit(0 if all(paths) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Bayesian Optimization Convergence Animation
+Exports the running-best curve building up over the iterations as GIF, APNG or MP4.
+Frames are drawn with blitting (only the newest points and the moving artists are
+redrawn on top of a cached background) and streamed to the encoder as they are
+drawn, each frame cropped to the pixels that actually changed
+"""
+
+import os
+import sys
+import math
+import zlib
+import struct
+import shutil
+import argparse
+import subprocess
+import time
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
+from PIL import Image, GifImagePlugin
+from chart_engine import style_context
+from gp_optimizer import slide8_runs
+from chart_rng import chart_rng
+
+# Iterations beyond this are plotted as a plain line, markers would only blur together
+MARKER_LIMIT = 200
+
+
+def running_best(values):
+    """Best value found up to and including each iteration"""
+    return np.maximum.accumulate(np.asarray(values, dtype=float))
+
+
+def _best_vertices(best):
+    """Indices where the running-best line bends; the rest lie on flat stretches"""
+    bends = np.ones(len(best), bool)
+    flat = best[1:] == best[:-1]
+    bends[1:-1] = ~(flat[:-1] & flat[1:])
+    return np.flatnonzero(bends)
+
+
+def _frame_stops(iterations, frames):
+    """Number of iterations shown in each frame, ending with all of them"""
+    return np.unique(np.linspace(0, iterations, frames + 1).round().astype(int)[1:])
+
+
+def _chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+class _ApngStream:
+    """Writes an animated PNG one (sub-rectangle) frame at a time"""
+
+    def __init__(self, path, size, frames, final_frame=None):
+        self.file = open(path, 'wb')
+        self.sequence = 0
+        self.frames_written = 0
+        width, height = size
+        self.file.write(b'\x89PNG\r\n\x1a\n')
+        self.file.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        self.file.write(_chunk(b'acTL', struct.pack('>II', frames, 0)))
+
+    def _next_sequence(self):
+        self.sequence += 1
+        return self.sequence - 1
+
+    def write(self, pixels, x, y, delay):
+        height, width = pixels.shape[:2]
+        # 'Up' filter: flat chart regions become runs of zeros for deflate
+        filtered = pixels.copy()
+        filtered[1:] -= pixels[:-1]
+        rows = np.empty((height, width * 3 + 1), np.uint8)
+        rows[:, 0] = 2
+        rows[:, 1:] = filtered.reshape(height, -1)
+        data = zlib.compress(rows.tobytes(), 6)
+
+        # The delay fraction is two 16-bit fields; holds past 65.5 s drop to hundredths
+        numerator, denominator = round(delay), 1000
+        if numerator > 0xFFFF:
+            numerator, denominator = min(round(delay / 10), 0xFFFF), 100
+        self.file.write(_chunk(b'fcTL', struct.pack('>IIIIIHHBB', self._next_sequence(), width, height,
+                                                     x, y, numerator, denominator, 0, 0)))
+        if self.frames_written == 0:
+            self.file.write(_chunk(b'IDAT', data))
+        else:
+            self.file.write(_chunk(b'fdAT', struct.pack('>I', self._next_sequence()) + data))
+        self.frames_written += 1
+
+    def close(self):
+        self.file.write(_chunk(b'IEND', b''))
+        self.file.close()
+
+
+class _GifStream:
+    """Writes a looping GIF one (sub-rectangle) frame at a time.
+
+    Every frame is mapped onto one global palette of the finished chart's 256
+    most frequent colours, so flat fills and text stay exact and no per-frame
+    colour tables are needed.
+    """
+
+    def __init__(self, path, size, frames, final_frame):
+        self.file = open(path, 'wb')
+        image = Image.fromarray(final_frame)
+        counts = sorted(image.getcolors(image.width * image.height), reverse=True)[:256]
+        self.colors = np.array([color for _, color in counts], np.int32)
+        self.known = np.empty(0, np.uint32)
+        self.known_indices = np.empty(0, np.uint8)
+        colors = self.colors.flatten().tolist()
+        colors += [0] * (768 - len(colors))
+        width, height = size
+        self.file.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0xF7, 0, 0) + bytes(colors))
+        # Loop forever
+        self.file.write(b'!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00')
+
+    def _indices(self, pixels):
+        """Nearest palette entry for every pixel, exact where the colour is in the palette"""
+        packed = (pixels[..., 0].astype(np.uint32) << 16) | (pixels[..., 1].astype(np.uint32) << 8) | pixels[..., 2]
+        unique, inverse = np.unique(packed, return_inverse=True)
+        # Colours repeat from frame to frame; only search the palette for new ones
+        new = unique[~np.isin(unique, self.known)]
+        if len(new):
+            rgb = np.stack([new >> 16, (new >> 8) & 255, new & 255], axis=1).astype(np.int32)
+            nearest = np.argmin(((rgb[:, None, :] - self.colors[None, :, :]) ** 2).sum(axis=2), axis=1)
+            self.known = np.concatenate([self.known, new])
+            self.known_indices = np.concatenate([self.known_indices, nearest.astype(np.uint8)])
+            order = np.argsort(self.known)
+            self.known, self.known_indices = self.known[order], self.known_indices[order]
+        indices = self.known_indices[np.searchsorted(self.known, unique)]
+        return indices[inverse.reshape(packed.shape)]
+
+    def write(self, pixels, x, y, delay):
+        frame = Image.fromarray(self._indices(pixels), 'P')
+        # GIF delays are in hundredths of a second
+        self.file.write(b''.join(GifImagePlugin.getdata(frame, offset=(x, y), duration=max(20, delay))))
+
+    def close(self):
+        self.file.write(b';')
+        self.file.close()
+
+
+class _FfmpegStream:
+    """Pipes raw frames into ffmpeg for H.264 MP4 output"""
+
+    def __init__(self, path, size, frames, final_frame=None, rate=25):
+        executable = shutil.which(matplotlib.rcParams['animation.ffmpeg_path'])
+        if executable is None:
+            raise RuntimeError("ffmpeg not found; install it or export a .gif/.png animation instead")
+        width, height = size
+        self.rate = rate
+        self.canvas = np.zeros((height, width, 3), np.uint8)
+        self.process = subprocess.Popen(
+            [executable, '-y', '-loglevel', 'error',
+             '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}',
+             '-framerate', str(rate), '-i', '-',
+             # H.264 needs even dimensions
+             '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+             '-c:v', 'libx264', '-pix_fmt', 'yuv420p', path],
+            stdin=subprocess.PIPE)
+
+    def write(self, pixels, x, y, delay):
+        height, width = pixels.shape[:2]
+        self.canvas[y:y + height, x:x + width] = pixels
+        data = self.canvas.tobytes()
+        for _ in range(max(1, round(delay * self.rate / 1000))):
+            self.process.stdin.write(data)
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError("ffmpeg failed to encode the animation")
+
+
+STREAMS = {
+    '.gif': _GifStream,
+    '.png': _ApngStream,
+    '.apng': _ApngStream,
+    '.mp4': _FfmpegStream,
+}
+
+
+def _changed_box(current, previous, region):
+    """Smallest (x, y, width, height) inside ``region`` where the two frames differ.
+
+    Frames are compared as one 32-bit RGBA word per pixel.
+    """
+    x0, y0, x1, y1 = region
+    changed = current[y0:y1, x0:x1] != previous[y0:y1, x0:x1]
+    rows = np.flatnonzero(changed.any(axis=1))
+    if len(rows) == 0:
+        # Formats need a frame to carry the delay; repeat one pixel
+        return x0, y0, 1, 1
+    columns = np.flatnonzero(changed.any(axis=0))
+    return x0 + columns[0], y0 + rows[0], columns[-1] - columns[0] + 1, rows[-1] - rows[0] + 1
+
+
+def animate_convergence(path, values=None, duration=8, fps=20, hold=2,
+                        width=9, height=6.5, dpi=100):
+    """Write an animation of ``values`` converging to ``path`` (.gif, .png/.apng or .mp4).
+
+    ``values`` defaults to the targets of the Slide 8 optimization run, read from
+    the run store. The curve builds up over ``duration`` seconds with at most
+    ``fps`` frames per second; long histories advance several iterations per
+    frame. The final frame is held for ``hold`` seconds. Returns the number of
+    frames written.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in STREAMS:
+        raise ValueError(f"Unsupported animation format '{extension}'; use one of {sorted(STREAMS)}")
+
+    if values is None:
+        values = slide8_runs()['deposition_rate'].to_numpy()
+    values = np.asarray(values, dtype=float)
+    count = len(values)
+    iterations = np.arange(1, count + 1)
+    best = running_best(values)
+    bends = _best_vertices(best)
+    stops = _frame_stops(count, min(count, max(1, round(duration * fps))))
+    delay = 1000 * duration / len(stops)
+
+    with style_context('default'):
+        fig, ax = plt.subplots(figsize=(width, height), dpi=dpi)
+        # Fixed limits: the axes never rescale, so the background stays valid
+        spread = values.max() - values.min() or 1
+        ax.set_xlim(0, count + 1)
+        ax.set_ylim(values.min() - 0.05 * spread, values.max() + 0.1 * spread)
+        ax.set_xlabel('Iteration Number', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Deposition Rate (Target Value)', fontsize=12, fontweight='bold')
+        ax.set_title('Bayesian Optimization Convergence', fontsize=16, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+
+        marker_size = 6 if count <= MARKER_LIMIT else 0
+        results_line, = ax.plot([], [], '-', color='lightblue', alpha=0.7, linewidth=2 if marker_size else 1,
+                                animated=True)
+        results_markers, = ax.plot([], [], 'o', color='lightblue', alpha=0.7, markersize=marker_size,
+                                   linestyle='none', animated=True)
+        best_line, = ax.plot([], [], 'r-', linewidth=3, animated=True)
+        best_marker, = ax.plot([], [], '*', color='green', markersize=16, animated=True)
+        progress = ax.text(0.02, 0.97, '', transform=ax.transAxes, va='top', fontsize=11, fontweight='bold',
+                           bbox=dict(boxstyle='round', facecolor='white', alpha=0.9), animated=True)
+        # Below the axes, so new points never have to be drawn around it
+        ax.legend(handles=[Line2D([], [], color='lightblue', marker='o' if marker_size else None,
+                                  linewidth=2, label='Iteration Results'),
+                           Line2D([], [], color='red', linewidth=3, label='Best Found So Far')],
+                  fontsize=11, loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=2)
+        fig.tight_layout()
+
+        canvas = fig.canvas
+        canvas.draw()
+        background = canvas.copy_from_bbox(ax.bbox)
+        frame_height = int(canvas.get_width_height()[1])
+        x0, y0, x1, y1 = ax.bbox.extents
+        region = (max(0, math.floor(x0) - 1), max(0, frame_height - math.ceil(y1) - 1),
+                  math.ceil(x1) + 1, frame_height - math.floor(y0) + 1)
+
+        def draw_moving(stop):
+            vertices = bends[:np.searchsorted(bends, stop)]
+            vertices = np.append(vertices, stop - 1) if not len(vertices) or vertices[-1] != stop - 1 else vertices
+            best_line.set_data(iterations[vertices], best[vertices])
+            leader = np.argmax(values[:stop])
+            best_marker.set_data([iterations[leader]], [values[leader]])
+            progress.set_text(f'Iteration {stop} of {count}\nBest so far: {best[stop - 1]:.2f} '
+                              f'(iteration {leader + 1})')
+            for artist in (best_line, best_marker, progress):
+                ax.draw_artist(artist)
+
+        def draw_results(start, stop):
+            # Reconnect to the previous frame's last point; markers only for new points
+            results_line.set_data(iterations[max(0, start - 1):stop], values[max(0, start - 1):stop])
+            results_markers.set_data(iterations[start:stop], values[start:stop])
+            ax.draw_artist(results_line)
+            if marker_size:
+                ax.draw_artist(results_markers)
+
+        # The GIF palette comes from the finished chart
+        draw_results(0, count)
+        draw_moving(count)
+        final_frame = np.array(canvas.buffer_rgba())[..., :3]
+        canvas.restore_region(background)
+
+        frame_width, frame_height = canvas.get_width_height()
+        stream = STREAMS[extension](path, (int(frame_width), int(frame_height)), len(stops), final_frame)
+        try:
+            previous = None
+            shown = 0
+            for index, stop in enumerate(stops):
+                canvas.restore_region(background)
+                draw_results(shown, stop)
+                # Points already plotted join the background; only the moving artists are redrawn
+                background = canvas.copy_from_bbox(ax.bbox)
+                draw_moving(stop)
+                shown = stop
+
+                rgba = np.asarray(canvas.buffer_rgba())
+                current = rgba.view(np.uint32)[..., 0]
+                if previous is None:
+                    x, y, box_width, box_height = 0, 0, current.shape[1], current.shape[0]
+                else:
+                    x, y, box_width, box_height = _changed_box(current, previous, region)
+                frame_delay = delay + (1000 * hold if index == len(stops) - 1 else 0)
+                stream.write(np.ascontiguousarray(rgba[y:y + box_height, x:x + box_width, :3]),
+                             int(x), int(y), frame_delay)
+                previous = current.copy()
+        finally:
+            stream.close()
+            plt.close(fig)
+    return len(stops)
+
+
+def synthetic_history(iterations, seed_name='convergence_demo'):
+    """Plausible long optimization history: wide exploration narrowing onto an optimum"""
+    rng = chart_rng(seed_name)
+    progress = np.arange(iterations) / iterations
+    spread = 300 * np.exp(-6 * progress) + 2
+    return 66 - rng.gamma(1.0, 1.0, iterations) * spread + rng.normal(0, 0.5, iterations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Animate the Bayesian optimization convergence curve")
+    parser.add_argument('output', nargs='?', default='bayesian_convergence.gif',
+                        help="output file (.gif, .png/.apng or .mp4)")
+    parser.add_argument('--iterations', type=int, default=None,
+                        help="animate a synthetic history of this many iterations instead of the Slide 8 data")
+    parser.add_argument('--duration', type=float, default=8, help="seconds for the curve to build up")
+    parser.add_argument('--fps', type=int, default=20, help="maximum frames per second")
+    parser.add_argument('--dpi', type=int, default=100, help="pixels per inch of the 9 x 6.5 inch frame")
+    args = parser.parse_args()
+
+    if args.iterations:
+        values = synthetic_history(args.iterations)
+    else:
+        values = slide8_runs()['deposition_rate'].to_numpy()
+    start = time.perf_counter()
+    try:
+        frames = animate_convergence(args.output, values, args.duration, args.fps, dpi=args.dpi)
+    except (RuntimeError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"✅ Animated {len(values)} iterations in {frames} frames: {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.0f} KB, {time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
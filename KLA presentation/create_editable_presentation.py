@@ -16,16 +16,13 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.dml import MSO_THEME_COLOR
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import plotly.io as pio
 import os
+from chart_data import IMPACT_METRICS, IMPACT_BEFORE, IMPACT_AFTER, IMPACT_IMPROVEMENTS, IMPACT_COLORS
+from pptx_charts import add_bar_chart, add_pie_chart
 
 # Set modern style
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
-pio.renderers.default = "png"
 
 # KLA Brand Colors
 KLA_BLUE = RGBColor(0, 51, 102)
@@ -342,35 +339,16 @@ def create_editable_results_slide(prs):
     title_para.font.bold = True
     title_para.font.color.rgb = KLA_BLUE
     
-    # Add editable performance metrics boxes
-    metrics = [
-        ("Yield Improvement", "28%", RGBColor(255, 165, 0)),  # Orange
-        ("Film Uniformity", "12%", RGBColor(0, 255, 0)),      # Green
-        ("Process Efficiency", "23%", RGBColor(0, 102, 204)),  # Blue
-        ("Cost Savings", "25%", RGBColor(255, 102, 0))        # KLA Orange
-    ]
-    
-    for i, (metric, value, color) in enumerate(metrics):
-        x_pos = 0.5 + i * 2.25
-        # Metric box
-        metric_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE, Inches(x_pos), Inches(2), Inches(2), Inches(1.5)
-        )
-        metric_box.fill.solid()
-        metric_box.fill.fore_color.rgb = color
-        metric_box.line.color.rgb = RGBColor(0, 0, 0)
-        metric_box.line.width = Pt(2)
-        
-        # Metric text
-        metric_text = slide.shapes.add_textbox(Inches(x_pos), Inches(2), Inches(2), Inches(1.5))
-        metric_text.text_frame.text = f"{metric}\n{value}"
-        metric_text.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        metric_text.text_frame.paragraphs[0].font.bold = True
-        metric_text.text_frame.paragraphs[0].font.size = Pt(14)
-        metric_text.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
+    # Add editable native charts: before/after scores and the improvement breakdown
+    add_bar_chart(slide, (0.5, 1.5, 5.5, 3.2), IMPACT_METRICS,
+                  [('Before', IMPACT_BEFORE), ('After', IMPACT_AFTER)],
+                  title='Performance Comparison', colors=['#e06666', '#6aa84f'],
+                  value_title='Score (%)', max_value=110, number_format='0"%"', font_size=10)
+    add_pie_chart(slide, (6.2, 1.5, 3.5, 3.2), IMPACT_METRICS, IMPACT_IMPROVEMENTS,
+                  title='Improvement Breakdown', colors=IMPACT_COLORS, font_size=10)
     
     # Add key achievements textbox (editable)
-    achievements_box = slide.shapes.add_textbox(Inches(0.5), Inches(4), Inches(9), Inches(2.5))
+    achievements_box = slide.shapes.add_textbox(Inches(0.5), Inches(4.8), Inches(9), Inches(2.5))
     achievements_frame = achievements_box.text_frame
     achievements_frame.text = "Key Achievements:\n• 28% yield improvement through automated thermal control\n• 12% increase in film uniformity using real-time feedback\n• 23% improvement in process efficiency with optimized parameters\n• 25% cost savings through reduced rework and improved quality\n• 90% defect detection rate with advanced metrology"
     achievements_para = achievements_frame.paragraphs[0]
@@ -5,24 +5,18 @@ Professional visual showing relevant experience categories
 """
 
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Rectangle, Circle
-import numpy as np
+from matplotlib.patches import FancyBboxPatch, Circle
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from chart_engine import cached_chart, save_chart, diagram_canvas
 
+@cached_chart
 def create_experience_snapshot_visual():
     """Create comprehensive experience snapshot visualization"""
     
-    fig, ax = plt.subplots(figsize=(16, 12))
-    ax.set_xlim(0, 16)
-    ax.set_ylim(0, 12)
-    ax.axis('off')
-    
-    # Set clean background
-    fig.patch.set_facecolor('white')
+    fig, ax = diagram_canvas((16, 12))
     
     # Title
     ax.text(8, 11.5, 'EXPERIENCE SNAPSHOT', ha='center', va='center',
@@ -173,20 +167,18 @@ def create_experience_snapshot_visual():
         point_y -= 0.25
     
     plt.tight_layout()
-    plt.savefig('experience_snapshot.png', dpi=300, bbox_inches='tight',
+    save_chart('experience_snapshot.png', width=9, height=6.8,
                facecolor='white', edgecolor='none', pad_inches=0.3)
     plt.close()
     
     print("✅ Created experience snapshot: experience_snapshot.png")
     return 'experience_snapshot.png'
 
+@cached_chart
 def create_experience_timeline():
     """Create timeline view of relevant experience"""
     
-    fig, ax = plt.subplots(figsize=(14, 8))
-    ax.set_xlim(0, 14)
-    ax.set_ylim(0, 8)
-    ax.axis('off')
+    fig, ax = diagram_canvas((14, 8))
     
     # Title
     ax.text(7, 7.5, 'RELEVANT EXPERIENCE TIMELINE', ha='center', va='center',
@@ -264,7 +256,7 @@ def create_experience_timeline():
            ha='center', va='center', fontsize=11, style='italic', color='#666666')
     
     plt.tight_layout()
-    plt.savefig('experience_timeline.png', dpi=300, bbox_inches='tight',
+    save_chart('experience_timeline.png', width=9, height=6.8,
                facecolor='white', edgecolor='none')
     plt.close()
     
@@ -9,17 +9,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch
-import seaborn as sns
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 import os
+from chart_engine import cached_chart, save_chart
 
-# Set style for charts
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
 
 def create_title_slide(prs):
     """Create the title slide"""
@@ -106,20 +103,9 @@ RESULTS:
     
     return slide
 
-def create_thermal_analysis_slide(prs):
-    """Create thermal analysis results slide"""
-    slide_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Thermal Performance Analysis: Air vs. Liquid Cooling"
-    title_frame.paragraphs[0].font.size = Pt(28)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
-    
-    # Create performance comparison chart
+@cached_chart(style='deck')
+def render_thermal_analysis():
+    """Render the performance comparison chart and return the PNG path"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
     
     # Temperature comparison
@@ -159,11 +145,27 @@ def create_thermal_analysis_slide(prs):
     ax2.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('thermal_analysis.png', dpi=300, bbox_inches='tight')
+    save_chart('thermal_analysis.png', width=9, height=5)
     plt.close()
+    return 'thermal_analysis.png'
+
+def create_thermal_analysis_slide(prs):
+    """Create thermal analysis results slide"""
+    slide_layout = prs.slide_layouts[6]  # Blank layout
+    slide = prs.slides.add_slide(slide_layout)
+    
+    # Title
+    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
+    title_frame = title_box.text_frame
+    title_frame.text = "Thermal Performance Analysis: Air vs. Liquid Cooling"
+    title_frame.paragraphs[0].font.size = Pt(28)
+    title_frame.paragraphs[0].font.bold = True
+    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
+    
+    image_file = render_thermal_analysis()
     
     # Add image to slide
-    slide.shapes.add_picture('thermal_analysis.png', Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(1.5), Inches(9), Inches(5))
     
     return slide
 
@@ -254,20 +256,9 @@ RELEVANCE TO KLA:
     
     return slide
 
-def create_kla_alignment_slide(prs):
-    """Create KLA SensArray alignment slide"""
-    slide_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Alignment with KLA SensArray: In-Situ Thermal Process Control"
-    title_frame.paragraphs[0].font.size = Pt(28)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
-    
-    # Create alignment diagram
+@cached_chart(style='deck')
+def render_kla_alignment():
+    """Render the alignment diagram and return the PNG path"""
     fig, ax = plt.subplots(figsize=(12, 8))
     
     # Define categories and skills
@@ -303,11 +294,27 @@ def create_kla_alignment_slide(prs):
                 f'{int(height)}%', ha='center', va='bottom', fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('kla_alignment.png', dpi=300, bbox_inches='tight')
+    save_chart('kla_alignment.png', width=9, height=5)
     plt.close()
+    return 'kla_alignment.png'
+
+def create_kla_alignment_slide(prs):
+    """Create KLA SensArray alignment slide"""
+    slide_layout = prs.slide_layouts[6]  # Blank layout
+    slide = prs.slides.add_slide(slide_layout)
+    
+    # Title
+    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
+    title_frame = title_box.text_frame
+    title_frame.text = "Alignment with KLA SensArray: In-Situ Thermal Process Control"
+    title_frame.paragraphs[0].font.size = Pt(28)
+    title_frame.paragraphs[0].font.bold = True
+    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
+    
+    image_file = render_kla_alignment()
     
     # Add image to slide
-    slide.shapes.add_picture('kla_alignment.png', Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(1.5), Inches(9), Inches(5))
     
     return slide
 
@@ -353,20 +360,9 @@ LEADERSHIP & COMMUNICATION:
     
     return slide
 
-def create_achievements_slide(prs):
-    """Create achievements and metrics slide"""
-    slide_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Quantified Impact & Achievements"
-    title_frame.paragraphs[0].font.size = Pt(28)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
-    
-    # Create achievements visualization
+@cached_chart(style='deck')
+def render_achievements():
+    """Render the achievements visualization and return the PNG path"""
     fig, ax = plt.subplots(figsize=(12, 8))
     
     # Define achievement categories and values
@@ -389,11 +385,27 @@ def create_achievements_slide(prs):
     ax.set_xlim(0, max(values) * 1.2)
     
     plt.tight_layout()
-    plt.savefig('achievements.png', dpi=300, bbox_inches='tight')
+    save_chart('achievements.png', width=9, height=5)
     plt.close()
+    return 'achievements.png'
+
+def create_achievements_slide(prs):
+    """Create achievements and metrics slide"""
+    slide_layout = prs.slide_layouts[6]  # Blank layout
+    slide = prs.slides.add_slide(slide_layout)
+    
+    # Title
+    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1))
+    title_frame = title_box.text_frame
+    title_frame.text = "Quantified Impact & Achievements"
+    title_frame.paragraphs[0].font.size = Pt(28)
+    title_frame.paragraphs[0].font.bold = True
+    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
+    
+    image_file = render_achievements()
     
     # Add image to slide
-    slide.shapes.add_picture('achievements.png', Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(1.5), Inches(9), Inches(5))
     
     return slide
 
@@ -5,26 +5,20 @@ Single diagram with no overlapping text and professional layout
 """
 
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Circle, Wedge, Arrow
+from matplotlib.patches import FancyBboxPatch, Circle
 import numpy as np
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from chart_engine import cached_chart, save_chart, diagram_canvas
 
+@cached_chart
 def create_clean_radial_diagram():
     """Create single, clean radial cluster diagram with no overlapping text"""
     
     # Create figure with larger size for better spacing
-    fig, ax = plt.subplots(figsize=(14, 14))
-    ax.set_xlim(-12, 12)
-    ax.set_ylim(-12, 12)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    
-    # Set clean white background
-    fig.patch.set_facecolor('white')
+    fig, ax = diagram_canvas((14, 14), xlim=(-12, 12), ylim=(-12, 12), equal=True)
     
     # Center circle - Main objective (larger and more prominent)
     center_circle = Circle((0, 0), 3, facecolor='#1f4e79', edgecolor='white', linewidth=4, zorder=5)
@@ -170,7 +164,7 @@ def create_clean_radial_diagram():
     
     # Save with high quality
     plt.tight_layout()
-    plt.savefig('slide4_clean_radial_diagram.png', dpi=300, bbox_inches='tight',
+    save_chart('slide4_clean_radial_diagram.png', width=9, height=7,
                facecolor='white', edgecolor='none', pad_inches=0.2)
     plt.close()
     
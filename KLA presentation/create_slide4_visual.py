@@ -5,22 +5,19 @@ Using radial/spoke design with minimal text and maximum visual impact
 """
 
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Circle, Wedge
+from matplotlib.patches import FancyBboxPatch, Circle
 import numpy as np
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from chart_engine import cached_chart, save_chart, diagram_canvas
 
+@cached_chart
 def create_user_requirements_diagram():
     """Create radial spoke diagram for user requirements"""
     
-    fig, ax = plt.subplots(figsize=(12, 12))
-    ax.set_xlim(-10, 10)
-    ax.set_ylim(-10, 10)
-    ax.set_aspect('equal')
-    ax.axis('off')
+    fig, ax = diagram_canvas((12, 12), xlim=(-10, 10), ylim=(-10, 10), equal=True)
     
     # Center circle - Main objective
     center_circle = Circle((0, 0), 2.5, facecolor='#1f4e79', edgecolor='white', linewidth=3)
@@ -135,19 +132,16 @@ def create_user_requirements_diagram():
                              connectionstyle="arc3,rad=0.3"))
     
     plt.tight_layout()
-    plt.savefig('user_requirements_radial_diagram.png', dpi=300, bbox_inches='tight',
+    save_chart('user_requirements_radial_diagram.png', width=9, height=6.5,
                facecolor='white', edgecolor='none')
     plt.close()
     return 'user_requirements_radial_diagram.png'
 
+@cached_chart
 def create_alternative_cycle_diagram():
     """Create alternative cycle diagram showing requirement relationships"""
     
-    fig, ax = plt.subplots(figsize=(12, 10))
-    ax.set_xlim(-8, 8)
-    ax.set_ylim(-6, 6)
-    ax.set_aspect('equal')
-    ax.axis('off')
+    fig, ax = diagram_canvas((12, 10), xlim=(-8, 8), ylim=(-6, 6), equal=True)
     
     # Define cycle positions (pentagon shape)
     requirements = [
@@ -197,7 +191,7 @@ def create_alternative_cycle_diagram():
            fontsize=18, fontweight='bold', color='#1f4e79')
     
     plt.tight_layout()
-    plt.savefig('user_requirements_cycle_diagram.png', dpi=300, bbox_inches='tight',
+    save_chart('user_requirements_cycle_diagram.png', width=9, height=6.5,
                facecolor='white', edgecolor='none')
     plt.close()
     return 'user_requirements_cycle_diagram.png'
@@ -13,7 +13,15 @@ from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from chart_engine import cached_chart, save_chart
+from chart_data import SLIDE8_OPTIMIZATION
+from pptx_charts import add_line_chart
+import gp_optimizer
+import process_model
+import run_store
+from gp_optimizer import slide8_runs
 
+@cached_chart(depends=[SLIDE8_OPTIMIZATION, gp_optimizer, process_model, run_store])
 def create_code_and_results_visual():
     """Create visual showing code implementation and results"""
     
@@ -35,7 +43,7 @@ def create_code_and_results_visual():
     # Code text (simplified representation)
     code_lines = [
         "import numpy as np",
-        "from bayes_opt import BayesianOptimization",
+        "from gp_optimizer import BayesianOptimization",
         "",
         "def deposition_model(temp, power):",
         "    rate = 5 + 0.1*temp + 0.2*power - 0.01*(temp-300)**2",
@@ -78,18 +86,18 @@ def create_code_and_results_visual():
     ax2.axis('off')
     ax2.set_title('Optimization Results', fontsize=14, fontweight='bold', pad=20)
     
-    # Sample results data (based on the image)
-    results_data = [
-        ['Iter', 'Target', 'Power', 'Temp'],
-        ['1', '56.25', '123.6', '285.7'],
-        ['2', '-194.3', '55.47', '460.1'],
-        ['3', '-281.4', '118.0', '128.5'],
-        ['4', '-80.23', '100.7', '207.2'],
-        ['5', '-194.8', '142.5', '455.8'],
-        ['...', '...', '...', '...'],
-        ['15', '65.25', '150.0', '304.6'],
-        ['Best', '65.25', '150.0', '305.3']
-    ]
+    # Results of the optimization run in the listing, from the run store
+    runs = slide8_runs()
+    best = runs.loc[runs['deposition_rate'].idxmax()]
+
+    def result_row(label, run):
+        return [label, f"{run['deposition_rate']:.2f}", f"{run['power']:.1f}", f"{run['temperature']:.1f}"]
+
+    results_data = [['Iter', 'Target', 'Power', 'Temp']]
+    results_data += [result_row(str(i), run) for i, (_, run) in enumerate(runs.head(5).iterrows(), 1)]
+    results_data += [['...', '...', '...', '...'],
+                     result_row(str(len(runs)), runs.iloc[-1]),
+                     result_row('Best', best)]
     
     # Create table
     table_bg = FancyBboxPatch((1, 2), 8, 8, boxstyle="round,pad=0.2",
@@ -131,30 +139,29 @@ def create_code_and_results_visual():
     # Add result annotations
     ax2.text(5, 1.5, 'Optimal Parameters Found:', fontsize=12, fontweight='bold', 
             color='#1f4e79', ha='center')
-    ax2.text(5, 1, 'Temperature: 305°C, Power: 150W', fontsize=11, 
-            color='#006400', ha='center', fontweight='bold')
-    ax2.text(5, 0.5, 'Maximum Deposition Rate: 65.25 units', fontsize=11, 
+    ax2.text(5, 1, f"Temperature: {best['temperature']:.0f}°C, Power: {best['power']:.0f}W",
+            fontsize=11, color='#006400', ha='center', fontweight='bold')
+    ax2.text(5, 0.5, f"Maximum Deposition Rate: {best['deposition_rate']:.2f} units", fontsize=11,
             color='#006400', ha='center', fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('slide8_code_and_results.png', dpi=300, bbox_inches='tight',
+    save_chart('slide8_code_and_results.png', width=9, height=6.5,
                facecolor='white', edgecolor='none')
     plt.close()
     
     print("✅ Created code and results visual: slide8_code_and_results.png")
     return 'slide8_code_and_results.png'
 
+@cached_chart(depends=[SLIDE8_OPTIMIZATION, gp_optimizer, process_model, run_store])
 def create_optimization_convergence_chart():
     """Create convergence chart showing optimization progress"""
     
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    # Sample convergence data (based on typical Bayesian optimization behavior)
-    iterations = list(range(1, 26))
-    target_values = [56.25, -194.3, -281.4, -80.23, -194.8, -164.2, -342.8, 
-                    -39.54, -268.9, -103.7, 45.85, 55.84, 48.46, 13.85, 
-                    65.25, 61.34, 64.87, 64.55, 65.67, 65.25, 65.95, 
-                    65.22, 65.45, 65.78, 65.25]
+    # Convergence of the optimization run in the listing
+    target_values = slide8_runs()['deposition_rate'].tolist()
+    init_points = SLIDE8_OPTIMIZATION['init_points']
+    iterations = list(range(1, len(target_values) + 1))
     
     # Running maximum
     running_max = []
@@ -180,30 +187,47 @@ def create_optimization_convergence_chart():
     ax.grid(True, alpha=0.3)
     ax.legend(fontsize=11)
     
-    # Add annotations
+    # Add annotations: the worst random probe and the first probe near the optimum
+    explored = int(np.argmin(target_values[:init_points]))
     ax.annotate('Initial exploration\n(wide parameter search)', 
-               xy=(5, -200), xytext=(8, -250),
+               xy=(explored + 1, target_values[explored]), xytext=(60, 10), textcoords='offset points',
                arrowprops=dict(arrowstyle='->', color='red', alpha=0.7),
                fontsize=10, ha='center', color='red')
     
+    spread = max(target_values) - min(target_values)
+    converged = int(np.argmax(np.array(running_max) >= max(target_values) - 0.01 * spread))
     ax.annotate('Convergence to optimum\n(focused refinement)', 
-               xy=(20, 65), xytext=(17, 40),
+               xy=(converged + 1, running_max[converged]), xytext=(-40, -60), textcoords='offset points',
                arrowprops=dict(arrowstyle='->', color='green', alpha=0.7),
                fontsize=10, ha='center', color='green')
     
     plt.tight_layout()
-    plt.savefig('bayesian_convergence_chart.png', dpi=300, bbox_inches='tight')
+    save_chart('bayesian_convergence_chart.png', width=9, height=6.5)
     plt.close()
     
     print("✅ Created convergence chart: bayesian_convergence_chart.png")
     return 'bayesian_convergence_chart.png'
 
+def add_convergence_native_chart(slide, box):
+    """Add the optimization convergence as an editable line chart"""
+    target_values = slide8_runs()['deposition_rate'].to_numpy()
+    running_max = np.maximum.accumulate(target_values)
+    iterations = [str(iteration) for iteration in range(1, len(target_values) + 1)]
+    chart = add_line_chart(slide, box, iterations,
+                           [('Iteration Results', target_values.round(2).tolist()),
+                            ('Best Found So Far', running_max.round(2).tolist())],
+                           title=f'Bayesian Optimization Convergence (optimum {running_max[-1]:.2f})',
+                           colors=['lightblue', 'red'], value_title='Deposition Rate (Target Value)',
+                           number_format='0.0')
+    chart.category_axis.axis_title.text_frame.text = 'Iteration Number'
+    chart.category_axis.axis_title.text_frame.paragraphs[0].font.bold = True
+    return chart
+
 def create_slide8_enhanced():
     """Create enhanced Slide 8 with code and results"""
     
-    # Generate visuals
+    # Generate visuals; the convergence slide is a native chart
     code_results_file = create_code_and_results_visual()
-    convergence_file = create_optimization_convergence_chart()
     
     # Create PowerPoint
     prs = Presentation()
@@ -238,15 +262,14 @@ def create_slide8_enhanced():
     title_frame2.paragraphs[0].alignment = PP_ALIGN.CENTER
     
     # Add convergence chart
-    slide2.shapes.add_picture(convergence_file, Inches(0.5), Inches(1), 
-                             width=Inches(9), height=Inches(6.5))
+    add_convergence_native_chart(slide2, (0.5, 1, 9, 6.5))
     
     # Save presentation
     prs.save('Slide8_Enhanced_Bayesian_Code.pptx')
     
     print("✅ Created enhanced Slide 8: Slide8_Enhanced_Bayesian_Code.pptx")
     
-    return code_results_file, convergence_file
+    return code_results_file
 
 def create_slide8_guide():
     """Create presentation guide for enhanced Slide 8"""
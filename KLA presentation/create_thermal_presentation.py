@@ -9,23 +9,23 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch, Circle
-import seaborn as sns
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.dml import MSO_THEME_COLOR
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import plotly.io as pio
 import os
-
-# Set modern style
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
-pio.renderers.default = "png"
+from chart_engine import cached_chart, save_chart
+from chart_rng import chart_rng
+import doe_designs
+import process_model
+import response_surface
+import run_store
+import monte_carlo
+from response_surface import process_surface
+from monte_carlo import process_capability, control_runs, TARGET_THICKNESS
+from chart_data import IMPACT_METRICS, IMPACT_BEFORE, IMPACT_AFTER, IMPACT_IMPROVEMENTS, IMPACT_COLORS
 
 # KLA Brand Colors
 KLA_BLUE = RGBColor(0, 51, 102)
@@ -105,26 +105,15 @@ def create_introduction_slide(prs):
         p.font.color.rgb = KLA_GRAY
         p.space_after = Pt(12)
 
-def create_problem_statement_slide(prs):
-    """Create problem statement slide with visual elements"""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "The Challenge: Thin-Film Uniformity in Semiconductor Manufacturing"
-    title_para = title_frame.paragraphs[0]
-    title_para.font.size = Pt(28)
-    title_para.font.bold = True
-    title_para.font.color.rgb = KLA_BLUE
-    
-    # Create problem visualization
+@cached_chart(style='deck')
+def render_problem_visualization():
+    """Render the problem visualization and return the PNG path"""
+    rng = chart_rng('problem_visualization')
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
     # Before optimization (non-uniform)
     x = np.linspace(0, 10, 100)
-    y1 = 100 + 20 * np.sin(x) + np.random.normal(0, 5, 100)
+    y1 = 100 + 20 * np.sin(x) + rng.normal(0, 5, 100)
     ax1.plot(x, y1, 'o-', color='red', alpha=0.7, linewidth=2)
     ax1.fill_between(x, y1-5, y1+5, alpha=0.3, color='red')
     ax1.set_title('Before: Non-Uniform Deposition', fontsize=14, fontweight='bold')
@@ -133,7 +122,7 @@ def create_problem_statement_slide(prs):
     ax1.grid(True, alpha=0.3)
     
     # After optimization (uniform)
-    y2 = 100 + np.random.normal(0, 2, 100)
+    y2 = 100 + rng.normal(0, 2, 100)
     ax2.plot(x, y2, 'o-', color='green', alpha=0.7, linewidth=2)
     ax2.fill_between(x, y2-2, y2+2, alpha=0.3, color='green')
     ax2.set_title('After: Optimized Uniformity', fontsize=14, fontweight='bold')
@@ -142,35 +131,40 @@ def create_problem_statement_slide(prs):
     ax2.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('problem_visualization.png', dpi=300, bbox_inches='tight')
+    save_chart('problem_visualization.png', width=9, height=4)
     plt.close()
-    
-    # Add image to slide
-    slide.shapes.add_picture('problem_visualization.png', Inches(0.5), Inches(2), Inches(9), Inches(4))
-    
-    # Add key metrics
-    metrics_box = slide.shapes.add_textbox(Inches(0.5), Inches(6.5), Inches(9), Inches(1.5))
-    metrics_frame = metrics_box.text_frame
-    metrics_frame.text = "Key Challenges:\n• Temperature variations causing non-uniform deposition\n• Manual calibration processes leading to inconsistencies\n• Lack of real-time thermal feedback and control\n• Yield losses due to thermal drift during processing"
-    metrics_para = metrics_frame.paragraphs[0]
-    metrics_para.font.size = Pt(16)
-    metrics_para.font.color.rgb = KLA_GRAY
+    return 'problem_visualization.png'
 
-def create_design_approach_slide(prs):
-    """Create design approach slide with system diagram"""
+def create_problem_statement_slide(prs):
+    """Create problem statement slide with visual elements"""
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
     title_frame = title_box.text_frame
-    title_frame.text = "Design Approach: Automated Thermal Calibration System"
+    title_frame.text = "The Challenge: Thin-Film Uniformity in Semiconductor Manufacturing"
     title_para = title_frame.paragraphs[0]
     title_para.font.size = Pt(28)
     title_para.font.bold = True
     title_para.font.color.rgb = KLA_BLUE
     
-    # Create system diagram
+    image_file = render_problem_visualization()
+    
+    # Add image to slide
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(2), Inches(9), Inches(4))
+    
+    # Add key metrics
+    metrics_box = slide.shapes.add_textbox(Inches(0.5), Inches(6.5), Inches(9), Inches(1.5))
+    metrics_frame = metrics_box.text_frame
+    metrics_frame.text = "Key Challenges:\n• Temperature variations causing non-uniform deposition\n• Manual calibration processes leading to inconsistencies\n• Lack of real-time thermal feedback and control\n• Yield losses due to thermal drift during processing"
+    metrics_para = metrics_frame.paragraphs[0]
+    metrics_para.font.size = Pt(16)
+    metrics_para.font.color.rgb = KLA_GRAY
+
+@cached_chart(style='deck')
+def render_system_diagram():
+    """Render the system diagram and return the PNG path"""
     fig, ax = plt.subplots(figsize=(12, 8))
     
     # Define components
@@ -213,27 +207,32 @@ def create_design_approach_slide(prs):
     ax.set_ylim(0, 8)
     ax.axis('off')
     
-    plt.savefig('system_diagram.png', dpi=300, bbox_inches='tight')
+    save_chart('system_diagram.png', width=9, height=5)
     plt.close()
-    
-    # Add image to slide
-    slide.shapes.add_picture('system_diagram.png', Inches(0.5), Inches(2), Inches(9), Inches(5))
+    return 'system_diagram.png'
 
-def create_technical_implementation_slide(prs):
-    """Create technical implementation slide with process flow"""
+def create_design_approach_slide(prs):
+    """Create design approach slide with system diagram"""
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
     title_frame = title_box.text_frame
-    title_frame.text = "Technical Implementation: CVD/PVD/ALD Process Integration"
+    title_frame.text = "Design Approach: Automated Thermal Calibration System"
     title_para = title_frame.paragraphs[0]
     title_para.font.size = Pt(28)
     title_para.font.bold = True
     title_para.font.color.rgb = KLA_BLUE
     
-    # Create process flow chart
+    image_file = render_system_diagram()
+    
+    # Add image to slide
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(2), Inches(9), Inches(5))
+
+@cached_chart(style='deck')
+def render_process_flow():
+    """Render the process flow chart and return the PNG path"""
     fig, ax = plt.subplots(figsize=(12, 6))
     
     # Process steps
@@ -264,64 +263,76 @@ def create_technical_implementation_slide(prs):
     ax.set_ylim(0, 4)
     ax.axis('off')
     
-    plt.savefig('process_flow.png', dpi=300, bbox_inches='tight')
+    save_chart('process_flow.png', width=9, height=3)
     plt.close()
-    
-    # Add image to slide
-    slide.shapes.add_picture('process_flow.png', Inches(0.5), Inches(2), Inches(9), Inches(3))
-    
-    # Add technical details
-    details_box = slide.shapes.add_textbox(Inches(0.5), Inches(5.5), Inches(9), Inches(2))
-    details_frame = details_box.text_frame
-    details_frame.text = "Key Technical Features:\n• Multi-zone thermal control with PID feedback loops\n• Real-time temperature monitoring using RTD sensors\n• Automated calibration algorithms for process optimization\n• Integration with existing CVD/PVD/ALD equipment\n• Advanced data logging and analysis capabilities"
-    details_para = details_frame.paragraphs[0]
-    details_para.font.size = Pt(16)
-    details_para.font.color.rgb = KLA_GRAY
+    return 'process_flow.png'
 
-def create_analysis_optimization_slide(prs):
-    """Create analysis and optimization slide with DOE results"""
+def create_technical_implementation_slide(prs):
+    """Create technical implementation slide with process flow"""
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
     title_frame = title_box.text_frame
-    title_frame.text = "Analysis & Optimization: DOE Methodology & SPC Control"
+    title_frame.text = "Technical Implementation: CVD/PVD/ALD Process Integration"
     title_para = title_frame.paragraphs[0]
     title_para.font.size = Pt(28)
     title_para.font.bold = True
     title_para.font.color.rgb = KLA_BLUE
     
-    # Create DOE results visualization
+    image_file = render_process_flow()
+    
+    # Add image to slide
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(2), Inches(9), Inches(3))
+    
+    # Add technical details
+    details_box = slide.shapes.add_textbox(Inches(0.5), Inches(5.5), Inches(9), Inches(2))
+    details_frame = details_box.text_frame
+    details_frame.text = "Key Technical Features:\n• Multi-zone thermal control with PID feedback loops\n• Real-time temperature monitoring using RTD sensors\n• Automated calibration algorithms for process optimization\n• Integration with existing CVD/PVD/ALD equipment\n• Advanced data logging and analysis capabilities"
+    details_para = details_frame.paragraphs[0]
+    details_para.font.size = Pt(16)
+    details_para.font.color.rgb = KLA_GRAY
+
+@cached_chart(depends=[doe_designs, process_model, response_surface, run_store, monte_carlo], style='deck')
+def render_doe_analysis():
+    """Render the DOE results visualization and return the PNG path"""
+    surface = process_surface()
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
     
-    # Temperature vs Uniformity
-    temp_range = np.linspace(200, 400, 50)
-    uniformity = 95 - 0.1 * (temp_range - 300)**2 + np.random.normal(0, 1, 50)
-    ax1.scatter(temp_range, uniformity, alpha=0.7, color='blue')
+    # Temperature vs Uniformity: fitted slice through the center, with the DOE runs on it
+    temp_range, uniformity = surface.slice('Temperature', 'Uniformity')
+    on_slice = np.all(surface.to_coded(surface.X)[:, 1:] == 0, axis=1)
+    ax1.plot(temp_range, uniformity, color='blue', linewidth=2, label='Quadratic model')
+    ax1.scatter(surface.X[on_slice, 0], surface.Y[on_slice, 1], alpha=0.7, color='blue',
+                edgecolor='black', zorder=3, label='DOE runs')
     ax1.set_xlabel('Temperature (°C)')
     ax1.set_ylabel('Uniformity (%)')
-    ax1.set_title('Temperature vs Film Uniformity')
+    ax1.set_title(f'Temperature vs Film Uniformity (R² = {surface.r_squared[1]:.3f})')
+    ax1.legend()
     ax1.grid(True, alpha=0.3)
     
-    # Pressure vs Deposition Rate
-    pressure_range = np.linspace(1, 10, 50)
-    dep_rate = 50 + 5 * pressure_range + np.random.normal(0, 2, 50)
-    ax2.scatter(pressure_range, dep_rate, alpha=0.7, color='green')
-    ax2.set_xlabel('Pressure (mTorr)')
-    ax2.set_ylabel('Deposition Rate (nm/min)')
-    ax2.set_title('Pressure vs Deposition Rate')
-    ax2.grid(True, alpha=0.3)
-    
-    # SPC Control Chart
-    time_points = np.arange(1, 31)
-    thickness = 100 + np.random.normal(0, 3, 30)
-    ucl = 100 + 3 * 3
-    lcl = 100 - 3 * 3
+    # Deposition rate response surface over temperature and pressure
+    X, Y, Z = surface.contour('Temperature', 'Pressure', 'Deposition Rate', points=100)
+    contours = ax2.contourf(X, Y, Z, levels=12, cmap='viridis')
+    fig.colorbar(contours, ax=ax2, label='Deposition Rate (nm/min)')
+    ax2.scatter(surface.X[:, 0], surface.X[:, 1], s=20, color='white', edgecolor='black',
+                clip_on=False, zorder=3, label='DOE runs')
+    ax2.set_xlabel('Temperature (°C)')
+    ax2.set_ylabel('Pressure (Torr)')
+    ax2.set_title(f'Deposition Rate Surface (R² = {surface.r_squared[0]:.3f})')
+    ax2.legend(loc='lower right')
+    
+    # SPC Control Chart: stored runs of the optimized recipe, limits from its Monte Carlo spread
+    capability = process_capability('optimized')
+    thickness = control_runs('optimized')['thickness'].to_numpy()
+    time_points = np.arange(1, len(thickness) + 1)
+    ucl = capability['mean'] + 3 * capability['std']
+    lcl = capability['mean'] - 3 * capability['std']
     ax3.plot(time_points, thickness, 'o-', color='blue')
     ax3.axhline(y=ucl, color='red', linestyle='--', label='UCL')
     ax3.axhline(y=lcl, color='red', linestyle='--', label='LCL')
-    ax3.axhline(y=100, color='green', linestyle='-', label='Target')
+    ax3.axhline(y=TARGET_THICKNESS, color='green', linestyle='-', label='Target')
     ax3.set_xlabel('Sample Number')
     ax3.set_ylabel('Film Thickness (nm)')
     ax3.set_title('SPC Control Chart')
@@ -341,33 +352,39 @@ def create_analysis_optimization_slide(prs):
                 f'{value}%', ha='center', va='bottom', fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('doe_analysis.png', dpi=300, bbox_inches='tight')
+    save_chart('doe_analysis.png', width=9, height=5)
     plt.close()
-    
-    # Add image to slide
-    slide.shapes.add_picture('doe_analysis.png', Inches(0.5), Inches(2), Inches(9), Inches(5))
+    return 'doe_analysis.png'
 
-def create_results_impact_slide(prs):
-    """Create results and impact slide with key metrics"""
+def create_analysis_optimization_slide(prs):
+    """Create analysis and optimization slide with DOE results"""
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
     title_frame = title_box.text_frame
-    title_frame.text = "Results & Impact: Quantifiable Performance Improvements"
+    title_frame.text = "Analysis & Optimization: DOE Methodology & SPC Control"
     title_para = title_frame.paragraphs[0]
     title_para.font.size = Pt(28)
     title_para.font.bold = True
     title_para.font.color.rgb = KLA_BLUE
     
-    # Create impact visualization
+    image_file = render_doe_analysis()
+    
+    # Add image to slide
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(2), Inches(9), Inches(5))
+
+@cached_chart(depends=[IMPACT_METRICS, IMPACT_BEFORE, IMPACT_AFTER, IMPACT_IMPROVEMENTS, IMPACT_COLORS],
+              style='deck')
+def render_results_impact():
+    """Render the impact visualization and return the PNG path"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
     
     # Key Metrics
-    metrics = ['Yield\nImprovement', 'Film\nUniformity', 'Process\nEfficiency', 'Cost\nSavings']
-    before_values = [72, 78, 65, 60]
-    after_values = [100, 90, 88, 85]
+    metrics = IMPACT_METRICS
+    before_values = IMPACT_BEFORE
+    after_values = IMPACT_AFTER
     
     x = np.arange(len(metrics))
     width = 0.35
@@ -394,49 +411,55 @@ def create_results_impact_slide(prs):
                 f'{height}%', ha='center', va='bottom', fontsize=9)
     
     # Pie chart for improvement breakdown
-    improvements = [28, 12, 23, 25]  # Yield, Uniformity, Efficiency, Cost
-    labels = ['Yield\nImprovement', 'Film\nUniformity', 'Process\nEfficiency', 'Cost\nSavings']
-    colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99']
+    improvements = IMPACT_IMPROVEMENTS  # Yield, Uniformity, Efficiency, Cost
+    labels = IMPACT_METRICS
+    colors = IMPACT_COLORS
     
     wedges, texts, autotexts = ax2.pie(improvements, labels=labels, colors=colors, autopct='%1.1f%%',
                                        startangle=90)
     ax2.set_title('Improvement Breakdown')
     
     plt.tight_layout()
-    plt.savefig('results_impact.png', dpi=300, bbox_inches='tight')
+    save_chart('results_impact.png', width=9, height=4)
     plt.close()
-    
-    # Add image to slide
-    slide.shapes.add_picture('results_impact.png', Inches(0.5), Inches(2), Inches(9), Inches(4))
-    
-    # Add key achievements
-    achievements_box = slide.shapes.add_textbox(Inches(0.5), Inches(6.5), Inches(9), Inches(1.5))
-    achievements_frame = achievements_box.text_frame
-    achievements_frame.text = "Key Achievements:\n• 28% yield improvement through automated thermal control\n• 12% increase in film uniformity using real-time feedback\n• 23% improvement in process efficiency with optimized parameters\n• 25% cost savings through reduced rework and improved quality"
-    achievements_para = achievements_frame.paragraphs[0]
-    achievements_para.font.size = Pt(16)
-    achievements_para.font.color.rgb = KLA_GRAY
+    return 'results_impact.png'
 
-def create_quality_assurance_slide(prs):
-    """Create quality assurance slide with metrology results"""
+def create_results_impact_slide(prs):
+    """Create results and impact slide with key metrics"""
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
     title_frame = title_box.text_frame
-    title_frame.text = "Quality Assurance: Advanced Metrology & Defect Detection"
+    title_frame.text = "Results & Impact: Quantifiable Performance Improvements"
     title_para = title_frame.paragraphs[0]
     title_para.font.size = Pt(28)
     title_para.font.bold = True
     title_para.font.color.rgb = KLA_BLUE
     
-    # Create metrology visualization
+    image_file = render_results_impact()
+    
+    # Add image to slide
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(2), Inches(9), Inches(4))
+    
+    # Add key achievements
+    achievements_box = slide.shapes.add_textbox(Inches(0.5), Inches(6.5), Inches(9), Inches(1.5))
+    achievements_frame = achievements_box.text_frame
+    achievements_frame.text = "Key Achievements:\n• 28% yield improvement through automated thermal control\n• 12% increase in film uniformity using real-time feedback\n• 23% improvement in process efficiency with optimized parameters\n• 25% cost savings through reduced rework and improved quality"
+    achievements_para = achievements_frame.paragraphs[0]
+    achievements_para.font.size = Pt(16)
+    achievements_para.font.color.rgb = KLA_GRAY
+
+@cached_chart(style='deck')
+def render_quality_assurance():
+    """Render the metrology visualization and return the PNG path"""
+    rng = chart_rng('quality_assurance')
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
     
     # SEM Analysis
-    x = np.random.normal(0, 1, 1000)
-    y = np.random.normal(0, 1, 1000)
+    x = rng.normal(0, 1, 1000)
+    y = rng.normal(0, 1, 1000)
     ax1.scatter(x, y, alpha=0.6, s=20, color='blue')
     ax1.set_title('SEM Surface Analysis')
     ax1.set_xlabel('X Position (μm)')
@@ -445,7 +468,7 @@ def create_quality_assurance_slide(prs):
     
     # XRD Pattern
     angles = np.linspace(20, 80, 100)
-    intensity = 1000 * np.exp(-(angles - 50)**2 / 100) + np.random.normal(0, 50, 100)
+    intensity = 1000 * np.exp(-(angles - 50)**2 / 100) + rng.normal(0, 50, 100)
     ax2.plot(angles, intensity, 'b-', linewidth=2)
     ax2.set_title('XRD Pattern Analysis')
     ax2.set_xlabel('2θ (degrees)')
@@ -454,7 +477,7 @@ def create_quality_assurance_slide(prs):
     
     # UV-Vis Spectroscopy
     wavelength = np.linspace(300, 800, 100)
-    absorbance = 0.5 * np.exp(-(wavelength - 550)**2 / 10000) + np.random.normal(0, 0.02, 100)
+    absorbance = 0.5 * np.exp(-(wavelength - 550)**2 / 10000) + rng.normal(0, 0.02, 100)
     ax3.plot(wavelength, absorbance, 'g-', linewidth=2)
     ax3.set_title('UV-Vis Spectroscopy')
     ax3.set_xlabel('Wavelength (nm)')
@@ -474,27 +497,32 @@ def create_quality_assurance_slide(prs):
                 f'{rate}%', ha='center', va='bottom', fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('quality_assurance.png', dpi=300, bbox_inches='tight')
+    save_chart('quality_assurance.png', width=9, height=5)
     plt.close()
-    
-    # Add image to slide
-    slide.shapes.add_picture('quality_assurance.png', Inches(0.5), Inches(2), Inches(9), Inches(5))
+    return 'quality_assurance.png'
 
-def create_kla_relevance_slide(prs):
-    """Create KLA relevance slide showing alignment with SensArray"""
+def create_quality_assurance_slide(prs):
+    """Create quality assurance slide with metrology results"""
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
     title_frame = title_box.text_frame
-    title_frame.text = "KLA SensArray Alignment: In-Situ Thermal Process Control"
+    title_frame.text = "Quality Assurance: Advanced Metrology & Defect Detection"
     title_para = title_frame.paragraphs[0]
     title_para.font.size = Pt(28)
     title_para.font.bold = True
     title_para.font.color.rgb = KLA_BLUE
     
-    # Create alignment visualization
+    image_file = render_quality_assurance()
+    
+    # Add image to slide
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(2), Inches(9), Inches(5))
+
+@cached_chart(style='deck')
+def render_kla_alignment():
+    """Render the alignment visualization and return the PNG path"""
     fig, ax = plt.subplots(figsize=(12, 8))
     
     # KLA SensArray Mission
@@ -531,27 +559,32 @@ def create_kla_relevance_slide(prs):
     ax.set_ylim(0, 8)
     ax.axis('off')
     
-    plt.savefig('kla_alignment.png', dpi=300, bbox_inches='tight')
+    save_chart('thermal_kla_alignment.png', width=9, height=5)
     plt.close()
-    
-    # Add image to slide
-    slide.shapes.add_picture('kla_alignment.png', Inches(0.5), Inches(2), Inches(9), Inches(5))
+    return 'thermal_kla_alignment.png'
 
-def create_future_applications_slide(prs):
-    """Create future applications slide showing scalability"""
+def create_kla_relevance_slide(prs):
+    """Create KLA relevance slide showing alignment with SensArray"""
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
     title_frame = title_box.text_frame
-    title_frame.text = "Future Applications: Scalability to KLA Manufacturing Environment"
+    title_frame.text = "KLA SensArray Alignment: In-Situ Thermal Process Control"
     title_para = title_frame.paragraphs[0]
     title_para.font.size = Pt(28)
     title_para.font.bold = True
     title_para.font.color.rgb = KLA_BLUE
     
-    # Create scalability diagram
+    image_file = render_kla_alignment()
+    
+    # Add image to slide
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(2), Inches(9), Inches(5))
+
+@cached_chart(style='deck')
+def render_future_applications():
+    """Render the scalability diagram and return the PNG path"""
     fig, ax = plt.subplots(figsize=(12, 8))
     
     # Current implementation
@@ -591,23 +624,40 @@ def create_future_applications_slide(prs):
         ax.annotate('', xy=(7, 3+i), xytext=(3, 3+i),
                    arrowprops=dict(arrowstyle='->', lw=3, color='red'))
     
-    # Add scalability benefits
-    benefits_box = slide.shapes.add_textbox(Inches(0.5), Inches(6.5), Inches(9), Inches(1.5))
-    benefits_frame = benefits_box.text_frame
-    benefits_frame.text = "Scalability Benefits:\n• Modular design allows easy integration with existing KLA equipment\n• Real-time thermal control enhances SensArray's in-situ monitoring capabilities\n• Automated calibration reduces manual intervention and improves consistency\n• Advanced analytics support APC (Automated Process Control) implementation"
-    benefits_para = benefits_frame.paragraphs[0]
-    benefits_para.font.size = Pt(16)
-    benefits_para.font.color.rgb = KLA_GRAY
-    
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 8)
     ax.axis('off')
     
-    plt.savefig('future_applications.png', dpi=300, bbox_inches='tight')
+    save_chart('future_applications.png', width=9, height=4)
     plt.close()
+    return 'future_applications.png'
+
+def create_future_applications_slide(prs):
+    """Create future applications slide showing scalability"""
+    slide_layout = prs.slide_layouts[6]
+    slide = prs.slides.add_slide(slide_layout)
+    
+    # Title
+    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
+    title_frame = title_box.text_frame
+    title_frame.text = "Future Applications: Scalability to KLA Manufacturing Environment"
+    title_para = title_frame.paragraphs[0]
+    title_para.font.size = Pt(28)
+    title_para.font.bold = True
+    title_para.font.color.rgb = KLA_BLUE
+    
+    image_file = render_future_applications()
     
     # Add image to slide
-    slide.shapes.add_picture('future_applications.png', Inches(0.5), Inches(2), Inches(9), Inches(4))
+    slide.shapes.add_picture(image_file, Inches(0.5), Inches(2), Inches(9), Inches(4))
+    
+    # Add scalability benefits
+    benefits_box = slide.shapes.add_textbox(Inches(0.5), Inches(6.5), Inches(9), Inches(1.5))
+    benefits_frame = benefits_box.text_frame
+    benefits_frame.text = "Scalability Benefits:\n• Modular design allows easy integration with existing KLA equipment\n• Real-time thermal control enhances SensArray's in-situ monitoring capabilities\n• Automated calibration reduces manual intervention and improves consistency\n• Advanced analytics support APC (Automated Process Control) implementation"
+    benefits_para = benefits_frame.paragraphs[0]
+    benefits_para.font.size = Pt(16)
+    benefits_para.font.color.rgb = KLA_GRAY
 
 def create_qa_slide(prs):
     """Create Q&A slide"""
@@ -671,7 +721,7 @@ def main():
     # Clean up temporary files
     temp_files = ['problem_visualization.png', 'system_diagram.png', 'process_flow.png', 
                   'doe_analysis.png', 'results_impact.png', 'quality_assurance.png', 
-                  'kla_alignment.png', 'future_applications.png']
+                  'thermal_kla_alignment.png', 'future_applications.png']
     for file in temp_files:
         if os.path.exists(file):
             os.remove(file)
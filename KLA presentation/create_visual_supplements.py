@@ -4,6 +4,8 @@ Visual Supplements Generator for Deposition Rate Optimization Presentation
 Creates charts, diagrams, tables, and visual elements to complement the main presentation
 """
 
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
@@ -18,11 +20,22 @@ from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 import os
+from chart_engine import cached_chart, render_charts, save_chart
+import doe_designs
+from doe_designs import PROCESS_FACTORS, doe_matrix, factor_levels
+from chart_data import (RESULTS_SUMMARY, RESULTS_CATEGORIES, BASELINE_FILL,
+                        VALIDATION_METRICS, VALIDATION_SCORES)
+from pptx_charts import add_bar_chart, add_radar_chart
+import monte_carlo
+import process_model
+import sensitivity
+import pareto
+from monte_carlo import process_capability, RECIPES
+from pareto import pareto_front, process_objectives, OBJECTIVES
+from sensitivity import process_sensitivity, RESPONSES
 
-# Set style for professional charts
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
 
+@cached_chart(style='supplement')
 def create_process_flow_diagram():
     """Create process flow diagram for methodology (Slide 5)"""
     fig, ax = plt.subplots(1, 1, figsize=(12, 8))
@@ -63,18 +76,22 @@ def create_process_flow_diagram():
     
     plt.title('Two-Phase Optimization Methodology', fontsize=16, fontweight='bold', pad=20)
     plt.tight_layout()
-    plt.savefig('process_flow_diagram.png', dpi=300, bbox_inches='tight')
+    save_chart('process_flow_diagram.png', width=9, height=6)
     plt.close()
     return 'process_flow_diagram.png'
 
+@cached_chart(style='supplement', depends=[doe_designs])
 def create_parameter_ranges_table():
     """Create parameter ranges table (Slide 7)"""
-    # Sample parameter data
+    # DOE factor ranges and the levels the Slide 6 design runs them at
+    levels = factor_levels(doe_matrix('fractional_factorial', center_points=4))
+    doe_levels = [' / '.join(f'{level:g}' for level in levels[name]) for name in PROCESS_FACTORS]
     parameters_data = {
         'Parameter': ['Temperature (°C)', 'Pressure (Torr)', 'Plasma Power (W)', 
                      'Gas Flow (sccm)', 'Spin Speed (RPM)', 'Time (min)'],
-        'Minimum': [200, 0.5, 50, 10, 1000, 2],
-        'Maximum': [500, 5.0, 150, 100, 3000, 10],
+        'Minimum': [low for low, _, _ in PROCESS_FACTORS.values()] + [1000, 2],
+        'Maximum': [high for _, high, _ in PROCESS_FACTORS.values()] + [3000, 10],
+        'DOE Levels': doe_levels + ['—', '—'],
         'Baseline': [300, 2.0, 100, 50, 2000, 5],
         'Optimized': [380, 1.8, 145, 75, 2500, 4.2],
         'Impact Level': ['High', 'Medium', 'High', 'Low', 'Medium', 'High']
@@ -87,7 +104,7 @@ def create_parameter_ranges_table():
     ax.axis('off')
     
     table = ax.table(cellText=df.values, colLabels=df.columns, cellLoc='center', loc='center',
-                    colWidths=[0.2, 0.15, 0.15, 0.15, 0.15, 0.2])
+                    colWidths=[0.18, 0.11, 0.11, 0.2, 0.11, 0.11, 0.15])
     
     # Format table
     table.auto_set_font_size(False)
@@ -98,11 +115,11 @@ def create_parameter_ranges_table():
     for i in range(len(df)):
         impact = df.iloc[i]['Impact Level']
         if impact == 'High':
-            table[(i+1, 5)].set_facecolor('#ffcccc')
+            table[(i+1, 6)].set_facecolor('#ffcccc')
         elif impact == 'Medium':
-            table[(i+1, 5)].set_facecolor('#ffffcc')
+            table[(i+1, 6)].set_facecolor('#ffffcc')
         else:
-            table[(i+1, 5)].set_facecolor('#ccffcc')
+            table[(i+1, 6)].set_facecolor('#ccffcc')
     
     # Header formatting
     for j in range(len(df.columns)):
@@ -110,10 +127,11 @@ def create_parameter_ranges_table():
         table[(0, j)].set_text_props(weight='bold', color='white')
     
     plt.title('Process Parameter Ranges and Optimization Results', fontsize=14, fontweight='bold', pad=20)
-    plt.savefig('parameter_ranges_table.png', dpi=300, bbox_inches='tight')
+    save_chart('parameter_ranges_table.png', width=9, height=6)
     plt.close()
     return 'parameter_ranges_table.png'
 
+@cached_chart(style='supplement')
 def create_bayesian_optimization_workflow():
     """Create Bayesian optimization workflow diagram (Slide 8)"""
     fig, ax = plt.subplots(1, 1, figsize=(12, 10))
@@ -172,136 +190,187 @@ def create_bayesian_optimization_workflow():
     
     plt.title('Bayesian Optimization Algorithm Workflow', fontsize=16, fontweight='bold', pad=20)
     plt.tight_layout()
-    plt.savefig('bayesian_workflow.png', dpi=300, bbox_inches='tight')
+    save_chart('bayesian_workflow.png', width=9, height=6)
     plt.close()
     return 'bayesian_workflow.png'
 
+def _format_value(value, number_format):
+    """Format a value with the Excel-style number format shared with the native charts"""
+    decimals = len(number_format.split('.')[1].rstrip('%')) if '.' in number_format else 0
+    return f"{value:.{decimals}f}" + ('%' if number_format.endswith('%') else '')
+
+def results_summary():
+    """RESULTS_SUMMARY with the modelled panels filled in.
+
+    Variability is simulated by the Monte Carlo engine; defect density and wafer
+    cost come from process_model on the same recipes the Pareto chart marks.
+    """
+    summary = [dict(result) for result in RESULTS_SUMMARY]
+    capability = [process_capability(recipe) for recipe in ('baseline', 'optimized')]
+    modelled = {metric: [float(model(*RECIPES[recipe].values())) for recipe in ('baseline', 'optimized')]
+                for metric, model in (('defects', process_model.defect_density),
+                                      ('cost', process_model.wafer_cost))}
+    for result in summary:
+        if result.get('metric') == 'rsd':
+            result['values'] = [round(float(run['rsd']), 2) for run in capability]
+            result['change'] = f"{capability[1]['rsd'] / capability[0]['rsd'] - 1:+.0%}"
+            result['capability'] = capability
+        elif result.get('metric') in modelled:
+            values = modelled[result['metric']]
+            result['values'] = [round(value) for value in values]
+            result['change'] = f"{values[1] / values[0] - 1:+.0%}"
+    return summary
+
+@cached_chart(depends=[RESULTS_SUMMARY, RESULTS_CATEGORIES, BASELINE_FILL, _format_value,
+                       monte_carlo, process_model], style='supplement')
 def create_results_charts():
     """Create results comparison charts (Slide 9)"""
     # Create subplots
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
-    
-    # 1. Deposition Rate Improvement
-    categories = ['Baseline', 'Optimized']
-    rates = [1.0, 1.4]  # 40% improvement
-    colors = ['lightcoral', 'lightgreen']
-    
-    bars1 = ax1.bar(categories, rates, color=colors, edgecolor='black', linewidth=2)
-    ax1.set_ylabel('Deposition Rate (μm/hour)', fontweight='bold')
-    ax1.set_title('Deposition Rate Improvement', fontweight='bold')
-    ax1.set_ylim(0, 1.6)
-    
-    # Add value labels on bars
-    for bar, rate in zip(bars1, rates):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.05,
-                f'{rate:.1f}', ha='center', va='bottom', fontweight='bold')
-    
-    # Add improvement percentage
-    ax1.text(1, 1.2, '+40%', ha='center', va='center', fontsize=14, 
-            fontweight='bold', color='green', 
-            bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgreen'))
-    
-    # 2. Process Variability Reduction
-    processes = ['Baseline', 'Optimized']
-    variability = [5.0, 3.75]  # 25% reduction
-    
-    bars2 = ax2.bar(processes, variability, color=['lightcoral', 'lightblue'], 
-                   edgecolor='black', linewidth=2)
-    ax2.set_ylabel('Process Variability (%RSD)', fontweight='bold')
-    ax2.set_title('Process Variability Reduction', fontweight='bold')
-    ax2.set_ylim(0, 6)
-    
-    for bar, var in zip(bars2, variability):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                f'{var:.2f}%', ha='center', va='bottom', fontweight='bold')
-    
-    ax2.text(1, 4.5, '-25%', ha='center', va='center', fontsize=14, 
-            fontweight='bold', color='blue', 
-            bbox=dict(boxstyle="round,pad=0.3", facecolor='lightblue'))
-    
-    # 3. Defect Reduction
-    conditions = ['Baseline', 'Optimized']
-    defects = [100, 80]  # 20% reduction
-    
-    bars3 = ax3.bar(conditions, defects, color=['lightcoral', 'lightyellow'], 
-                   edgecolor='black', linewidth=2)
-    ax3.set_ylabel('Defect Density (relative)', fontweight='bold')
-    ax3.set_title('Defect Density Reduction', fontweight='bold')
-    ax3.set_ylim(0, 120)
-    
-    for bar, defect in zip(bars3, defects):
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{defect}', ha='center', va='bottom', fontweight='bold')
-    
-    ax3.text(1, 90, '-20%', ha='center', va='center', fontsize=14, 
-            fontweight='bold', color='orange', 
-            bbox=dict(boxstyle="round,pad=0.3", facecolor='lightyellow'))
-    
-    # 4. Cost Reduction
-    cost_categories = ['Baseline', 'Optimized']
-    costs = [100, 85]  # 15% reduction
-    
-    bars4 = ax4.bar(cost_categories, costs, color=['lightcoral', 'lightsteelblue'], 
-                   edgecolor='black', linewidth=2)
-    ax4.set_ylabel('Cost per Wafer (relative)', fontweight='bold')
-    ax4.set_title('Manufacturing Cost Reduction', fontweight='bold')
-    ax4.set_ylim(0, 120)
-    
-    for bar, cost in zip(bars4, costs):
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{cost}', ha='center', va='bottom', fontweight='bold')
-    
-    ax4.text(1, 92, '-15%', ha='center', va='center', fontsize=14, 
-            fontweight='bold', color='blue', 
-            bbox=dict(boxstyle="round,pad=0.3", facecolor='lightsteelblue'))
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    
+    # Deposition rate, variability, defect density and cost, baseline vs optimized
+    for ax, result in zip(axes.flat, results_summary()):
+        values = result['values']
+        bars = ax.bar(RESULTS_CATEGORIES, values, color=[BASELINE_FILL, result['fill']],
+                      edgecolor='black', linewidth=2)
+        ax.set_ylabel(result['ylabel'], fontweight='bold')
+        ax.set_title(result['title'], fontweight='bold')
+        ax.set_ylim(0, result['ylim'])
+        
+        # Add value labels on bars
+        label_format = result['format'].replace('"%"', '%')
+        for bar, value in zip(bars, values):
+            ax.text(bar.get_x() + bar.get_width()/2., bar.get_height() + result['ylim'] * 0.02,
+                    _format_value(value, label_format), ha='center', va='bottom', fontweight='bold')
+        
+        # Add improvement percentage between the bar tops
+        ax.text(1, result['change_y'], result['change'], ha='center', va='center',
+                fontsize=14, fontweight='bold', color=result['accent'],
+                bbox=dict(boxstyle="round,pad=0.3", facecolor=result['fill']))
+        
+        # Thickness yield and Cpk behind the simulated variability figures
+        if 'capability' in result:
+            baseline, optimized = result['capability']
+            ax.text(0.5, 0.97, f"Cpk {baseline['cpk']:.2f} → {optimized['cpk']:.2f}   "
+                    f"Yield {baseline['yield']:.1%} → {optimized['yield']:.1%}\n"
+                    f"({optimized['samples']:,} Monte Carlo runs each)",
+                    transform=ax.transAxes, ha='center', va='top', fontsize=9)
     
     plt.suptitle('Optimization Results Summary', fontsize=16, fontweight='bold')
     plt.tight_layout()
-    plt.savefig('results_charts.png', dpi=300, bbox_inches='tight')
+    save_chart('results_charts.png', width=9, height=6)
     plt.close()
     return 'results_charts.png'
 
+@cached_chart(depends=[pareto, process_model, monte_carlo.RECIPES], style='supplement')
+def create_pareto_tradeoff():
+    """Create rate / uniformity / defect / cost trade-off chart from the Pareto front (Slide 9)"""
+    front = pareto_front()
+    rate, uniformity, defects, cost = (name for name, _ in OBJECTIVES)
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    # Colour shows defect density, marker size grows with wafer cost
+    spread = front[cost].max() - front[cost].min()
+    sizes = 6 + 40 * (front[cost] - front[cost].min()) / (spread or 1)
+    points = ax.scatter(front[uniformity], front[rate], c=front[defects], cmap='RdYlGn_r', s=sizes,
+                        alpha=0.8, edgecolors='none')
+    fig.colorbar(points, ax=ax, label='Defect Density (relative, baseline = 100)')
+    ax.text(0.01, 0.01, 'Marker size: cost per wafer (baseline = 100)', transform=ax.transAxes,
+            fontsize=9, style='italic')
+    
+    # Where the deck's baseline and optimized recipes sit relative to the front
+    # Labels sit left of the markers, clear of the colorbar
+    for (recipe, settings), marker in zip(RECIPES.items(), ['X', '*']):
+        values = process_objectives(np.array([list(settings.values())], dtype=float))[0]
+        ax.scatter(values[1], values[0], marker=marker, s=250, color='white', edgecolor='black',
+                   linewidth=1.5, zorder=3)
+        ax.annotate(f'{recipe.title()}\n(defects {values[2]:.0f}, cost {values[3]:.0f})',
+                    (values[1], values[0]), xytext=(-12, -5), textcoords='offset points',
+                    fontweight='bold', ha='right', va='top')
+    
+    ax.set_xlabel('Film Uniformity (%)', fontweight='bold')
+    ax.set_ylabel('Deposition Rate (nm/min)', fontweight='bold')
+    ax.set_title(f'Pareto Front: Rate, Uniformity, Defects and Cost ({len(front):,} optimal recipes)',
+                 fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    save_chart('pareto_tradeoff.png', width=9, height=6)
+    plt.close()
+    return 'pareto_tradeoff.png'
+
+def add_results_native_charts(slide, box):
+    """Add the results summary as four editable column charts in a 2x2 grid"""
+    left, top, width, height = box
+    cell_w, cell_h = width / 2, height / 2
+    for index, result in enumerate(results_summary()):
+        cell = (left + (index % 2) * cell_w, top + (index // 2) * cell_h, cell_w, cell_h)
+        add_bar_chart(slide, cell, RESULTS_CATEGORIES, [(result['ylabel'], result['values'])],
+                      title=f"{result['title']} ({result['change']})",
+                      point_colors=[BASELINE_FILL, result['fill']], max_value=result['ylim'],
+                      number_format=result['format'], font_size=10)
+
+@cached_chart(style='supplement', depends=[doe_designs])
 def create_doe_matrix_heatmap():
     """Create DOE matrix heatmap (Slide 6)"""
-    # Sample DOE data
-    np.random.seed(42)
-    parameters = ['Temperature', 'Pressure', 'Power', 'Flow Rate']
-    experiments = [f'Exp {i+1}' for i in range(12)]
-    
-    # Create DOE matrix (normalized values)
-    doe_data = np.random.rand(12, 4) * 2 - 1  # Values between -1 and 1 (low, medium, high)
-    
-    # Create DataFrame
-    df_doe = pd.DataFrame(doe_data, index=experiments, columns=parameters)
+    # Resolution IV 2^(4-1) fractional factorial plus center points, in coded units
+    df_doe = doe_matrix('fractional_factorial', coded=True, center_points=4)
+    df_doe.index = [f'Exp {i+1}' for i in range(len(df_doe))]
     
     # Create heatmap
     fig, ax = plt.subplots(figsize=(10, 8))
     
     # Custom colormap
-    sns.heatmap(df_doe, annot=True, fmt='.2f', cmap='RdYlBu_r', center=0,
+    sns.heatmap(df_doe, annot=True, fmt='.0f', cmap='RdYlBu_r', center=0,
                 square=True, cbar_kws={'label': 'Parameter Level\n(-1: Low, 0: Medium, +1: High)'})
     
-    plt.title('Design of Experiments (DOE) Matrix', fontsize=14, fontweight='bold', pad=20)
+    plt.title('Design of Experiments (DOE) Matrix\n$2^{4-1}$ Fractional Factorial + 4 Center Points', fontsize=14, fontweight='bold', pad=20)
     plt.xlabel('Process Parameters', fontweight='bold')
     plt.ylabel('Experimental Runs', fontweight='bold')
     plt.tight_layout()
-    plt.savefig('doe_matrix_heatmap.png', dpi=300, bbox_inches='tight')
+    save_chart('doe_matrix_heatmap.png', width=9, height=6)
     plt.close()
     return 'doe_matrix_heatmap.png'
 
+@cached_chart(depends=[sensitivity, process_model, doe_designs], style='supplement')
+def create_sensitivity_tornado():
+    """Create Sobol sensitivity tornado chart (Slide 6)"""
+    fig, axes = plt.subplots(1, len(RESPONSES), figsize=(12, 5), sharex=True)
+    
+    for ax, response in zip(axes, RESPONSES):
+        # Most influential factor on top
+        indices = process_sensitivity(response).sort_values('ST')
+        y = np.arange(len(indices))
+        ax.barh(y + 0.2, indices['ST'], height=0.4, color='steelblue', edgecolor='black',
+                xerr=[indices['ST'] - indices['ST_low'], indices['ST_high'] - indices['ST']],
+                capsize=3, label='Total effect (S$_T$)')
+        ax.barh(y - 0.2, indices['S1'], height=0.4, color='lightblue', edgecolor='black',
+                xerr=[indices['S1'] - indices['S1_low'], indices['S1_high'] - indices['S1']],
+                capsize=3, label='First order (S$_1$)')
+        for position, value in zip(y, indices['ST']):
+            ax.text(value + 0.03, position + 0.2, f'{value:.2f}', va='center', fontsize=9, fontweight='bold')
+        ax.set_yticks(y)
+        ax.set_yticklabels(indices.index, fontweight='bold')
+        ax.set_xlim(0, 1)
+        ax.set_xlabel('Sobol Index (share of output variance)', fontweight='bold')
+        ax.set_title(response, fontweight='bold')
+    axes[0].legend(loc='lower right')
+    
+    plt.suptitle('Which Parameters Matter? Global Sensitivity (Sobol Indices, 95% CI)',
+                 fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    # Placed at 9 x 3.75 in, the figure's own aspect, rather than the usual 9 x 6 box
+    save_chart('sensitivity_tornado.png', width=9, height=3.75)
+    plt.close()
+    return 'sensitivity_tornado.png'
+
+@cached_chart(depends=[VALIDATION_METRICS, VALIDATION_SCORES], style='supplement')
 def create_validation_spider_chart():
     """Create validation metrics spider chart (Slide 10)"""
     # Metrics for baseline vs optimized
-    metrics = ['Thickness\nUniformity', 'Surface\nQuality', 'Crystal\nStructure', 
-              'Defect\nDensity', 'Process\nStability', 'Adhesion']
+    metrics = VALIDATION_METRICS
     
     # Scores (out of 10)
-    baseline_scores = [6, 7, 8, 5, 6, 7]
-    optimized_scores = [8, 8, 8, 8, 9, 8]
+    baseline_scores = list(VALIDATION_SCORES['Baseline'])
+    optimized_scores = list(VALIDATION_SCORES['Optimized'])
     
     # Number of variables
     N = len(metrics)
@@ -337,10 +406,17 @@ def create_validation_spider_chart():
     plt.title('Film Quality Validation Metrics\n(Higher scores = Better performance)', 
              fontsize=14, fontweight='bold', pad=30)
     plt.tight_layout()
-    plt.savefig('validation_spider_chart.png', dpi=300, bbox_inches='tight')
+    save_chart('validation_spider_chart.png', width=9, height=6)
     plt.close()
     return 'validation_spider_chart.png'
 
+def add_validation_native_chart(slide, box):
+    """Add the validation scores as an editable radar chart"""
+    add_radar_chart(slide, box, VALIDATION_METRICS, list(VALIDATION_SCORES.items()),
+                    title='Film Quality Validation Metrics (higher is better)',
+                    colors=['red', 'green'], max_value=10)
+
+@cached_chart(style='supplement')
 def create_kla_alignment_diagram():
     """Create KLA alignment diagram (Slide 11)"""
     fig, ax = plt.subplots(1, 1, figsize=(12, 8))
@@ -385,10 +461,11 @@ def create_kla_alignment_diagram():
     
     plt.title('Candidate-Role Alignment Matrix', fontsize=16, fontweight='bold', pad=20)
     plt.tight_layout()
-    plt.savefig('kla_alignment_diagram.png', dpi=300, bbox_inches='tight')
+    save_chart('kla_alignment_diagram.png', width=9, height=6)
     plt.close()
     return 'kla_alignment_diagram.png'
 
+@cached_chart(style='supplement')
 def create_timeline_gantt():
     """Create project timeline Gantt chart"""
     fig, ax = plt.subplots(figsize=(12, 6))
@@ -417,7 +494,7 @@ def create_timeline_gantt():
     ax.set_xlim(0, 16)
     
     plt.tight_layout()
-    plt.savefig('project_timeline.png', dpi=300, bbox_inches='tight')
+    save_chart('project_timeline.png', width=9, height=6)
     plt.close()
     return 'project_timeline.png'
 
@@ -425,20 +502,22 @@ def create_visual_presentation():
     """Create PowerPoint with all visual elements"""
     prs = Presentation()
     
-    # Generate all charts
+    # Generate the picture charts in parallel; a chart that fails leaves None in its slot.
+    # Results and validation are native PowerPoint charts and need no rendering.
     print("Generating charts and diagrams...")
-    chart_files = []
-    
-    chart_files.append(create_process_flow_diagram())
-    chart_files.append(create_parameter_ranges_table())
-    chart_files.append(create_doe_matrix_heatmap())
-    chart_files.append(create_bayesian_optimization_workflow())
-    chart_files.append(create_results_charts())
-    chart_files.append(create_validation_spider_chart())
-    chart_files.append(create_kla_alignment_diagram())
-    chart_files.append(create_timeline_gantt())
+    chart_files = render_charts([
+        create_process_flow_diagram,
+        create_parameter_ranges_table,
+        create_doe_matrix_heatmap,
+        create_sensitivity_tornado,
+        create_bayesian_optimization_workflow,
+        create_pareto_tradeoff,
+        create_kla_alignment_diagram,
+        create_timeline_gantt,
+    ])
     
     # Slide mapping information
+    results = {result['metric']: result for result in results_summary()}
     slide_mappings = [
         {
             'title': 'Process Flow Diagram',
@@ -461,6 +540,14 @@ def create_visual_presentation():
             'main_slide': 'Slide 6: Decision Framework (DOE & Design Tree)',
             'usage': 'Visual representation of experimental design structure'
         },
+        {
+            'title': 'Parameter Sensitivity Tornado',
+            'description': 'Sobol Indices of Rate and Uniformity',
+            'file': 'sensitivity_tornado.png',
+            'height': 3.75,
+            'main_slide': 'Slide 6: Decision Framework (DOE & Design Tree)',
+            'usage': 'Evidence for which parameters the DOE and optimization focus on'
+        },
         {
             'title': 'Bayesian Optimization Workflow',
             'description': 'Algorithm Implementation Flowchart',
@@ -471,14 +558,24 @@ def create_visual_presentation():
         {
             'title': 'Results Summary Charts',
             'description': 'Key Performance Improvements',
-            'file': 'results_charts.png',
+            'file': None,
+            'native': add_results_native_charts,
+            'main_slide': 'Slide 9: Results & Data Interpretation',
+            'usage': (f"Quantitative results showing {results['rate']['change'].lstrip('+')} rate increase, "
+                      f"{results['rsd']['change'].lstrip('-')} variability reduction")
+        },
+        {
+            'title': 'Rate / Uniformity / Defect / Cost Trade-off',
+            'description': 'Pareto Front of the Process Model',
+            'file': 'pareto_tradeoff.png',
             'main_slide': 'Slide 9: Results & Data Interpretation',
-            'usage': 'Quantitative results showing 40% rate increase, 25% variability reduction'
+            'usage': 'Shows the gains are a trade-off: no recipe maximizes every metric at once'
         },
         {
             'title': 'Validation Metrics Spider Chart',
             'description': 'Film Quality Assessment Comparison',
-            'file': 'validation_spider_chart.png',
+            'file': None,
+            'native': add_validation_native_chart,
             'main_slide': 'Slide 10: Metrology & Validation',
             'usage': 'Multi-dimensional quality comparison baseline vs optimized'
         },
@@ -521,9 +618,14 @@ def create_visual_presentation():
         title_frame.paragraphs[0].font.bold = True
         title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
         
-        # Add image
-        slide.shapes.add_picture(mapping['file'], Inches(0.5), Inches(1.2), 
-                               width=Inches(9), height=Inches(6))
+        # Add native chart or image
+        if 'native' in mapping:
+            mapping['native'](slide, (0.5, 1.2, 9, 6))
+        elif mapping['file'] in chart_files:
+            slide.shapes.add_picture(mapping['file'], Inches(0.5), Inches(1.2), 
+                                   width=Inches(9), height=Inches(mapping.get('height', 6)))
+        else:
+            print(f"Warning: {mapping['file']} was not rendered; slide left without chart")
         
         # Add mapping information
         info_box = slide.shapes.add_textbox(Inches(0.5), Inches(7.5), Inches(9), Inches(1))
@@ -561,7 +663,7 @@ def create_visual_presentation():
         
         for mapping in slide_mappings:
             f.write(f"VISUAL: {mapping['title']}\n")
-            f.write(f"FILE: {mapping['file']}\n")
+            f.write(f"FILE: {mapping['file'] or 'native PowerPoint chart (editable in the deck)'}\n")
             f.write(f"MAPS TO: {mapping['main_slide']}\n")
             f.write(f"DESCRIPTION: {mapping['description']}\n")
             f.write(f"USAGE: {mapping['usage']}\n")
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Design-of-Experiments Generator
+Full and fractional factorial, Box-Behnken, central-composite and optimized Latin
+hypercube designs for the deposition process parameters. Designs are built with
+array operations in coded units (-1 = low, +1 = high) and cached by their spec
+"""
+
+import os
+import json
+import time
+import hashlib
+import argparse
+import itertools
+import numpy as np
+import pandas as pd
+from chart_engine import CACHE_DIR
+from chart_rng import BASE_SEED
+
+DOE_CACHE_DIR = os.path.join(CACHE_DIR, 'doe')
+
+# Process parameters varied in the DOE: (low, high, units)
+PROCESS_FACTORS = {
+    'Temperature': (200, 500, '°C'),
+    'Pressure': (0.5, 5.0, 'Torr'),
+    'Power': (50, 150, 'W'),
+    'Flow Rate': (10, 100, 'sccm'),
+}
+
+# Default generators for the 2^(k-p) fractional factorials (resolution IV or better)
+FRACTIONAL_GENERATORS = {
+    3: 'a b ab',
+    4: 'a b c abc',
+    5: 'a b c d abcd',
+    6: 'a b c d abc bcd',
+    7: 'a b c d abc abd acd',
+    8: 'a b c d e bcd acd abce',
+}
+
+# Latin hypercubes up to this many runs are maximin-optimized (O(runs^2) memory);
+# larger ones are decorrelated instead
+MAXIMIN_RUNS = 1000
+
+
+def _with_center_points(design, center_points):
+    if not center_points:
+        return design
+    return np.vstack([design, np.zeros((center_points, design.shape[1]))])
+
+
+def full_factorial(k, levels=2, center_points=0):
+    """Every combination of ``levels`` (an int or one count per factor), first factor varying fastest"""
+    levels = [levels] * k if np.isscalar(levels) else list(levels)
+    if len(levels) != k:
+        raise ValueError(f"Got {len(levels)} level counts for {k} factors")
+    # np.indices varies the last axis fastest; reverse so the first factor does (standard order)
+    indices = np.indices(levels[::-1]).reshape(k, -1)[::-1].T
+    steps = np.maximum(np.array(levels) - 1, 1)
+    coded = 2.0 * indices / steps - 1
+    coded[:, np.array(levels) == 1] = 0
+    return _with_center_points(coded, center_points)
+
+
+def fractional_factorial(k, generators=None, center_points=0):
+    """Two-level 2^(k-p) fractional factorial.
+
+    ``generators`` names one column per factor: single letters are base factors
+    of a full factorial, words are their products (a '-' prefix negates), e.g.
+    'a b c abc' is the resolution IV 2^(4-1) design with D = ABC.
+    """
+    generators = generators or FRACTIONAL_GENERATORS.get(k, '')
+    tokens = generators.split()
+    if len(tokens) != k:
+        raise ValueError(f"Need one generator per factor ({k}), got '{generators}'")
+    base = sorted(token for token in tokens if len(token) == 1)
+    if not {letter for token in tokens for letter in token.lstrip('-')} <= set(base):
+        raise ValueError(f"Every letter in '{generators}' needs its own base factor column")
+    runs = full_factorial(len(base), 2)
+    columns = []
+    for token in tokens:
+        sign = -1.0 if token.startswith('-') else 1.0
+        columns.append(sign * np.prod(runs[:, [base.index(letter) for letter in token.lstrip('-')]], axis=1))
+    return _with_center_points(np.column_stack(columns), center_points)
+
+
+def box_behnken(k, center_points=3):
+    """Box-Behnken design: each factor pair at its four +/-1 corners with the rest at 0"""
+    if k < 3:
+        raise ValueError("Box-Behnken designs need at least 3 factors")
+    pairs = np.array(list(itertools.combinations(range(k), 2)))
+    corners = full_factorial(2, 2)
+    design = np.zeros((len(pairs) * 4, k))
+    rows = np.arange(len(design))
+    design[rows, np.repeat(pairs[:, 0], 4)] = np.tile(corners[:, 0], len(pairs))
+    design[rows, np.repeat(pairs[:, 1], 4)] = np.tile(corners[:, 1], len(pairs))
+    return _with_center_points(design, center_points)
+
+
+def central_composite(k, center_points=(4, 4), face='ccc', alpha='rotatable'):
+    """Central-composite design: 2^k factorial, 2k axial points and center points.
+
+    ``center_points`` = (in the factorial block, in the axial block). ``face``:
+    'ccc' puts the axial points at +/-alpha beyond the ranges, 'cci' shrinks the
+    design so they land on the ranges, 'ccf' puts them on the cube faces.
+    ``alpha`` is 'rotatable' ((2^k)^(1/4)), 'orthogonal' or a number.
+    """
+    factorial = full_factorial(k, 2)
+    if face == 'ccf':
+        distance = 1.0
+    elif alpha == 'rotatable':
+        distance = len(factorial) ** 0.25
+    elif alpha == 'orthogonal':
+        corners = len(factorial)
+        added = 2 * k + sum(center_points)
+        distance = (corners * (np.sqrt(corners + added) - np.sqrt(corners)) ** 2 / 4) ** 0.25
+    else:
+        distance = float(alpha)
+    axial = np.vstack([np.eye(k) * -distance, np.eye(k) * distance])
+    design = np.vstack([_with_center_points(factorial, center_points[0]),
+                        _with_center_points(axial, center_points[1])])
+    if face == 'cci':
+        design /= distance
+    elif face not in ('ccc', 'ccf'):
+        raise ValueError(f"Unknown central-composite face '{face}'; use 'ccc', 'cci' or 'ccf'")
+    return design
+
+
+def _decorrelate(strata, rounds=3):
+    """Re-pair the strata of each column so columns are nearly uncorrelated (Iman-Conover)"""
+    runs = len(strata)
+    for _ in range(rounds):
+        scores = (strata - (runs - 1) / 2) / runs
+        correlation = np.corrcoef(scores, rowvar=False)
+        try:
+            factor = np.linalg.cholesky(correlation)
+        except np.linalg.LinAlgError:
+            break
+        target = scores @ np.linalg.inv(factor).T
+        strata = np.argsort(np.argsort(target, axis=0), axis=0)
+    return strata
+
+
+def _maximin(strata, rng, iterations, p=15):
+    """Swap strata within columns while that lowers the Morris-Mitchell phi_p criterion.
+
+    Only the swapped rows' distances change, so each trial swap costs O(runs).
+    """
+    runs, k = strata.shape
+    points = (strata + 0.5) / runs
+    squared = np.sum((points[:, None, :] - points[None, :, :]) ** 2, axis=2)
+    np.fill_diagonal(squared, np.inf)
+    columns = rng.integers(0, k, iterations)
+    pairs = rng.integers(0, runs, (iterations, 2))
+    for column, (i, j) in zip(columns, pairs):
+        if i == j:
+            continue
+        shift = points[:, column]
+        delta_i = (shift[j] - shift) ** 2 - (shift[i] - shift) ** 2
+        new_i = squared[i] + delta_i
+        new_j = squared[j] - delta_i
+        # The i-j distance itself does not change with the swap
+        new_i[j] = new_j[i] = squared[i, j]
+        new_i[i] = new_j[j] = np.inf
+        change = (np.sum(new_i ** (-p / 2)) + np.sum(new_j ** (-p / 2))
+                  - np.sum(squared[i] ** (-p / 2)) - np.sum(squared[j] ** (-p / 2)))
+        if change < 0:
+            points[[i, j], column] = points[[j, i], column]
+            strata[[i, j], column] = strata[[j, i], column]
+            squared[i], squared[j] = new_i, new_j
+            squared[:, i], squared[:, j] = new_i, new_j
+    return strata
+
+
+def latin_hypercube(k, runs, criterion='auto', iterations=None, seed=BASE_SEED):
+    """Latin hypercube of ``runs`` points: every factor hits each of ``runs`` strata once.
+
+    ``criterion``: 'maximin' spreads the points apart (centered in their strata),
+    'correlation' makes the columns nearly uncorrelated (jittered in their
+    strata, scales to 10^5+ runs), 'auto' picks maximin up to MAXIMIN_RUNS runs
+    and None leaves the random pairing.
+    """
+    rng = np.random.default_rng(seed)
+    strata = rng.permuted(np.tile(np.arange(runs), (k, 1)), axis=1).T
+    if criterion == 'auto':
+        criterion = 'maximin' if runs <= MAXIMIN_RUNS else 'correlation'
+    if criterion == 'maximin':
+        strata = _maximin(strata, rng, iterations or min(20000, 50 * runs * k))
+        unit = (strata + 0.5) / runs
+    elif criterion in ('correlation', None):
+        if criterion == 'correlation':
+            strata = _decorrelate(strata)
+        unit = (strata + rng.random((runs, k))) / runs
+    else:
+        raise ValueError(f"Unknown Latin hypercube criterion '{criterion}'")
+    return 2 * unit - 1
+
+
+DESIGNS = {
+    'full_factorial': full_factorial,
+    'fractional_factorial': fractional_factorial,
+    'box_behnken': box_behnken,
+    'central_composite': central_composite,
+    'latin_hypercube': latin_hypercube,
+}
+
+_memory_cache = {}
+
+
+def design_key(kind, k, options):
+    """Content hash of a design spec, the default seed and this module's code"""
+    spec = json.dumps({'kind': kind, 'k': k, 'options': options, 'seed': BASE_SEED},
+                      sort_keys=True, default=list)
+    digest = hashlib.sha256(spec.encode())
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def coded_design(kind, k, **options):
+    """Design matrix in coded units for ``k`` factors, cached in memory and on disk by spec"""
+    if kind not in DESIGNS:
+        raise ValueError(f"Unknown design '{kind}'; use one of {', '.join(DESIGNS)}")
+    key = design_key(kind, k, options)
+    if key not in _memory_cache:
+        cached = os.path.join(DOE_CACHE_DIR, key + '.npy')
+        if os.path.exists(cached):
+            design = np.load(cached)
+        else:
+            design = DESIGNS[kind](k, **options)
+            os.makedirs(DOE_CACHE_DIR, exist_ok=True)
+            np.save(cached, design)
+        design.setflags(write=False)
+        _memory_cache[key] = design
+    return _memory_cache[key]
+
+
+def to_natural(coded, factors=PROCESS_FACTORS):
+    """Map coded units onto each factor's (low, high) range"""
+    low = np.array([factors[name][0] for name in factors], dtype=float)
+    high = np.array([factors[name][1] for name in factors], dtype=float)
+    return (low + high) / 2 + np.asarray(coded) * (high - low) / 2
+
+
+def doe_matrix(kind, factors=PROCESS_FACTORS, coded=False, **options):
+    """Design as a DataFrame with one column per factor and rows 'Run 1', 'Run 2', ..."""
+    design = coded_design(kind, len(factors), **options)
+    values = design if coded else to_natural(design, factors)
+    index = [f'Run {i + 1}' for i in range(len(values))]
+    return pd.DataFrame(values, index=index, columns=list(factors))
+
+
+def factor_levels(matrix):
+    """Distinct settings each factor takes in a (natural-unit) design DataFrame"""
+    return {name: np.unique(matrix[name].round(6)).tolist() for name in matrix.columns}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a design of experiments")
+    parser.add_argument('kind', choices=list(DESIGNS), help="design family")
+    parser.add_argument('--factors', type=int, default=None,
+                        help="number of factors (default: the four process parameters)")
+    parser.add_argument('--runs', type=int, default=None, help="runs (latin_hypercube)")
+    parser.add_argument('--center-points', type=int, default=None, help="center points to add")
+    parser.add_argument('--criterion', default='auto', help="latin_hypercube criterion")
+    parser.add_argument('-o', '--output', default=None, help="write the design to this CSV file")
+    args = parser.parse_args()
+
+    options = {}
+    if args.kind == 'latin_hypercube':
+        options = {'runs': args.runs or 20, 'criterion': args.criterion}
+    elif args.center_points is not None:
+        options['center_points'] = args.center_points if args.kind != 'central_composite' \
+            else (args.center_points, args.center_points)
+
+    start = time.perf_counter()
+    if args.factors:
+        factors = {f'x{i + 1}': (-1, 1, '') for i in range(args.factors)}
+    else:
+        factors = PROCESS_FACTORS
+    matrix = doe_matrix(args.kind, factors, **options)
+    elapsed = time.perf_counter() - start
+
+    if args.output:
+        matrix.to_csv(args.output)
+    if len(matrix) <= 50:
+        print(matrix.round(3).to_string())
+    print(f"\n✅ {args.kind}: {len(matrix):,} runs x {len(factors)} factors ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Objective Evaluation Cache
+Memoizes expensive objective evaluations (simulator runs, real depositions) by
+location: a request within a tolerance radius of an earlier evaluation, in
+normalized parameter units, returns the stored result instead of re-running.
+Lookups go through a KD-tree plus a small unindexed buffer of recent points;
+results persist to disk so later studies re-use earlier runs
+"""
+
+import os
+import time
+import argparse
+import threading
+import functools
+import numpy as np
+from chart_engine import CACHE_DIR
+from gp_optimizer import BayesianOptimization
+from process_model import simulated_tool_run, DEPOSITION_BOUNDS
+
+EVALUATION_CACHE_DIR = os.path.join(CACHE_DIR, 'evaluations')
+# Default match radius in unit-cube coordinates (0.1% of each parameter's range)
+TOLERANCE = 1e-3
+LEAF_SIZE = 16
+
+
+class KDTree:
+    """Static KD-tree over the rows of ``points`` for nearest-within-radius queries.
+
+    Nodes split at the median of their widest dimension; leaves of up to
+    ``leaf_size`` points are searched with one vectorized distance computation.
+    """
+
+    def __init__(self, points, leaf_size=LEAF_SIZE):
+        self.points = np.asarray(points, dtype=float)
+        self.leaf_size = leaf_size
+        self.order = np.arange(len(self.points))
+        # Per node: [start, end) of its slice of ``order``, split dimension/value and children
+        self.start, self.end, self.dim, self.split, self.left, self.right = [], [], [], [], [], []
+        if len(self.points):
+            self._build()
+
+    def _node(self, start, end):
+        for column in (self.dim, self.split, self.left, self.right):
+            column.append(-1)
+        self.start.append(start)
+        self.end.append(end)
+        return len(self.start) - 1
+
+    def _build(self):
+        stack = [self._node(0, len(self.points))]
+        while stack:
+            node = stack.pop()
+            start, end = self.start[node], self.end[node]
+            if end - start <= self.leaf_size:
+                continue
+            members = self.points[self.order[start:end]]
+            dim = int(np.argmax(members.max(axis=0) - members.min(axis=0)))
+            middle = (end - start) // 2
+            partition = np.argpartition(members[:, dim], middle)
+            self.order[start:end] = self.order[start:end][partition]
+            self.dim[node] = dim
+            self.split[node] = float(self.points[self.order[start + middle], dim])
+            self.left[node] = self._node(start, start + middle)
+            self.right[node] = self._node(start + middle, end)
+            stack.extend([self.left[node], self.right[node]])
+
+    def nearest(self, x, radius=np.inf):
+        """(index, distance) of the nearest point within ``radius`` of ``x``, or (None, inf)"""
+        best, best_distance = None, radius
+        if not len(self.points):
+            return best, np.inf
+        x = np.asarray(x, dtype=float)
+        stack = [(0, 0.0)]
+        while stack:
+            node, gap = stack.pop()
+            if gap > best_distance:
+                continue
+            if self.dim[node] < 0:
+                members = self.order[self.start[node]:self.end[node]]
+                distances = np.sqrt(np.sum((self.points[members] - x) ** 2, axis=1))
+                closest = int(np.argmin(distances))
+                if distances[closest] <= best_distance:
+                    best, best_distance = int(members[closest]), float(distances[closest])
+                continue
+            offset = x[self.dim[node]] - self.split[node]
+            near, far = (self.left[node], self.right[node]) if offset < 0 else (self.right[node], self.left[node])
+            # Visit the near side first (pushed last); the far side only if the ball crosses the split
+            stack.append((far, abs(offset)))
+            stack.append((near, gap))
+        return best, (best_distance if best is not None else np.inf)
+
+
+class CachedObjective:
+    """Wraps ``objective(**params)`` with a persistent nearest-neighbour evaluation cache.
+
+    ``bounds`` maps each parameter to its (low, high) range, which defines the
+    normalization; ``tolerance`` is the match radius in those unit-cube
+    coordinates. With a ``name`` the cache is kept in EVALUATION_CACHE_DIR as
+    <name>.npz and written after every new evaluation. Safe to call from the
+    optimizer's batch worker threads.
+    """
+
+    def __init__(self, objective, bounds, tolerance=TOLERANCE, name=None, cache_dir=EVALUATION_CACHE_DIR):
+        self.objective = objective
+        self.names = list(bounds)
+        self.low = np.array([bounds[name][0] for name in self.names], dtype=float)
+        self.high = np.array([bounds[name][1] for name in self.names], dtype=float)
+        self.tolerance = tolerance
+        self.path = os.path.join(cache_dir, f'{name}.npz') if name else None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._points = np.empty((0, len(self.names)))
+        self._values = np.empty(0)
+        self._load()
+        self.loaded = len(self._values)
+        self._rebuild()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        stored = np.load(self.path)
+        if list(stored['names']) != self.names or not np.allclose(stored['bounds'], [self.low, self.high]):
+            print(f"Warning: {self.path} was saved for other parameters or bounds; starting an empty cache")
+            return
+        self._points = self._to_unit(stored['points'])
+        self._values = stored['values']
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        partial = self.path + '.partial.npz'
+        np.savez(partial, names=np.array(self.names), bounds=np.array([self.low, self.high]),
+                 points=self._from_unit(self._points), values=self._values)
+        os.replace(partial, self.path)
+
+    def _to_unit(self, values):
+        return (np.asarray(values, dtype=float) - self.low) / (self.high - self.low)
+
+    def _from_unit(self, unit):
+        return self.low + unit * (self.high - self.low)
+
+    def _rebuild(self):
+        self._tree = KDTree(self._points)
+
+    def lookup(self, params):
+        """Stored value within ``tolerance`` of ``params`` (nearest one), or None"""
+        x = self._to_unit([params[name] for name in self.names])
+        index, distance = self._tree.nearest(x, self.tolerance)
+        # Points added since the last rebuild are not in the tree yet
+        pending = self._points[len(self._tree.points):]
+        if len(pending):
+            distances = np.sqrt(np.sum((pending - x) ** 2, axis=1))
+            closest = int(np.argmin(distances))
+            if distances[closest] <= min(distance, self.tolerance):
+                index = len(self._tree.points) + closest
+        return None if index is None else float(self._values[index])
+
+    def add(self, params, value):
+        x = self._to_unit([params[name] for name in self.names])
+        self._points = np.vstack([self._points, x])
+        self._values = np.append(self._values, float(value))
+        # Rebuild once the unindexed buffer outgrows ~sqrt(n), keeping both lookups sublinear
+        if len(self._points) - len(self._tree.points) > max(LEAF_SIZE, np.sqrt(len(self._points))):
+            self._rebuild()
+
+    def __call__(self, **params):
+        with self._lock:
+            value = self.lookup(params)
+            if value is not None:
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = self.objective(**params)
+        with self._lock:
+            self.add(params, value)
+            self.save()
+        return value
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def report(self):
+        name = os.path.basename(self.path) if self.path else 'in-memory cache'
+        return (f"{name}: {self.hits + self.misses} lookups, {self.hits} hits ({self.hit_rate:.1%}), "
+                f"{self.misses} new evaluations, {len(self._values)} stored ({self.loaded} loaded)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Repeat a Bayesian optimization study through the evaluation cache")
+    parser.add_argument('--studies', type=int, default=3, help="optimization studies to run")
+    parser.add_argument('--iterations', type=int, default=20, help="GP-guided probes per study")
+    parser.add_argument('--run-time', type=float, default=0.05, help="seconds per simulated tool run")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help="match radius (unit-cube units)")
+    parser.add_argument('--name', default='deposition_tool', help="cache file name under .chart_cache/evaluations")
+    parser.add_argument('--seed', type=int, default=None, help="optimizer seed (default: fresh for each study)")
+    args = parser.parse_args()
+
+    objective = CachedObjective(functools.partial(simulated_tool_run, run_time=args.run_time),
+                                DEPOSITION_BOUNDS, args.tolerance, args.name)
+    for study in range(args.studies):
+        start = time.perf_counter()
+        hits = objective.hits
+        optimizer = BayesianOptimization(objective, DEPOSITION_BOUNDS, seed=args.seed)
+        best = optimizer.maximize(5, args.iterations)
+        print(f"Study {study + 1}: best {best['target']:.3f} in {time.perf_counter() - start:.2f}s, "
+              f"{objective.hits - hits}/{len(optimizer.res)} probes served from the cache")
+    print(f"\n✅ {objective.report()}")
+
+
+if __name__ == "__main__":
+    main()
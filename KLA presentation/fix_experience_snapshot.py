@@ -4,25 +4,18 @@ Fix Experience Snapshot diagram with better text positioning and no overlaps
 """
 
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Rectangle, Circle
-import numpy as np
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from chart_engine import cached_chart, save_chart, diagram_canvas, experience_card, alignment_panel
 
+@cached_chart
 def create_fixed_experience_snapshot():
     """Create experience snapshot with proper text positioning and no overlaps"""
     
     # Create larger figure for better spacing
-    fig, ax = plt.subplots(figsize=(18, 14))
-    ax.set_xlim(0, 18)
-    ax.set_ylim(0, 14)
-    ax.axis('off')
-    
-    # Set clean background
-    fig.patch.set_facecolor('white')
+    fig, ax = diagram_canvas((18, 14))
     
     # Title with more space
     ax.text(9, 13.2, 'EXPERIENCE SNAPSHOT', ha='center', va='center',
@@ -96,55 +89,10 @@ def create_fixed_experience_snapshot():
     
     # Draw experience boxes with proper spacing
     for exp in experiences:
-        x, y = exp['position']
-        w, h = exp['size']
-        
-        # Main background box with padding
-        main_box = FancyBboxPatch((x-w/2, y-h/2), w, h, 
-                                 boxstyle="round,pad=0.2", 
-                                 facecolor=exp['color'], alpha=0.15,
-                                 edgecolor=exp['color'], linewidth=3)
-        ax.add_patch(main_box)
-        
-        # Header box with proper sizing
-        header_height = 0.8
-        header_box = FancyBboxPatch((x-w/2+0.15, y+h/2-header_height-0.05), 
-                                   w-0.3, header_height,
-                                   boxstyle="round,pad=0.1",
-                                   facecolor=exp['color'], alpha=0.95)
-        ax.add_patch(header_box)
-        
-        # Title text (centered in header)
-        ax.text(x, y+h/2-header_height/2-0.05, exp['title'], 
-               ha='center', va='center',
-               fontsize=13, fontweight='bold', color=exp['text_color'])
-        
-        # Content area for items (below header)
-        content_start_y = y + h/2 - header_height - 0.3
-        item_y = content_start_y
-        line_spacing = 0.25
-        
-        # Draw items with proper spacing
-        for item in exp['items']:
-            # Check if text fits, if not wrap better
-            ax.text(x-w/2+0.4, item_y, item, ha='left', va='top',
-                   fontsize=11, color=exp['color'], fontweight='600')
-            item_y -= line_spacing
+        experience_card(ax, exp['position'], exp['size'], exp['title'], exp['items'],
+                        exp['color'], exp['text_color'], items_offset=0.3, line_spacing=0.25)
     
     # Add KLA alignment section at bottom with better spacing
-    kla_y = 1.8
-    kla_height = 2
-    kla_box = FancyBboxPatch((1, kla_y-kla_height/2), 16, kla_height, 
-                            boxstyle="round,pad=0.3",
-                            facecolor='#1f4e79', alpha=0.12,
-                            edgecolor='#1f4e79', linewidth=3)
-    ax.add_patch(kla_box)
-    
-    # KLA header
-    ax.text(9, kla_y+0.6, 'KLA SENSARRAY ALIGNMENT', ha='center', va='center',
-           fontsize=16, fontweight='bold', color='#1f4e79')
-    
-    # Alignment points in two clean columns
     left_alignment = [
         '✓ In-Situ Process Monitoring & Control',
         '✓ Semiconductor Deposition Tool Experience', 
@@ -157,23 +105,13 @@ def create_fixed_experience_snapshot():
         '✓ CAD Design & Thermal Analysis'
     ]
     
-    # Left column
-    point_y = kla_y + 0.1
-    for point in left_alignment:
-        ax.text(3, point_y, point, ha='left', va='center',
-               fontsize=12, color='#1f4e79', fontweight='600')
-        point_y -= 0.35
-    
-    # Right column
-    point_y = kla_y + 0.1
-    for point in right_alignment:
-        ax.text(10, point_y, point, ha='left', va='center',
-               fontsize=12, color='#1f4e79', fontweight='600')
-        point_y -= 0.35
+    alignment_panel(ax, center=9, y=1.8, height=2, width=16,
+                    title='KLA SENSARRAY ALIGNMENT', columns=(left_alignment, right_alignment),
+                    column_x=(3, 10), title_offset=0.6, points_offset=0.1)
     
     # Save with high quality and proper margins
     plt.tight_layout()
-    plt.savefig('experience_snapshot_fixed.png', dpi=300, bbox_inches='tight',
+    save_chart('experience_snapshot_fixed.png', width=9.6, height=7,
                facecolor='white', edgecolor='none', pad_inches=0.4)
     plt.close()
     
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Gaussian-Process Bayesian Optimizer
+Maximizes an objective over a box of named parameters. The GP posterior is kept
+up to date with incremental Cholesky updates, acquisition functions (EI, UCB, PI)
+score whole candidate batches at once and every run is reproducible from its seed.
+Batch mode proposes several points per cycle and evaluates them on a worker pool
+"""
+
+import sys
+import time
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import process_model
+from chart_data import SLIDE8_OPTIMIZATION
+from chart_rng import chart_rng
+from process_model import deposition_model, simulated_tool_run, DEPOSITION_BOUNDS, DEPOSITION_OPTIMUM
+from run_store import RunStore, study_name
+
+# Length scales (in unit-cube coordinates) tried when the kernel is re-tuned
+LENGTH_SCALES = np.geomspace(0.05, 2.0, 12)
+
+
+def erf(x):
+    """Vectorized error function (Abramowitz & Stegun 7.1.26, |error| < 1.5e-7)"""
+    x = np.asarray(x, dtype=float)
+    sign = np.sign(x)
+    x = np.abs(x)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    return sign * (1.0 - poly * np.exp(-x * x))
+
+
+def norm_pdf(z):
+    return np.exp(-0.5 * z * z) / np.sqrt(2 * np.pi)
+
+
+def norm_cdf(z):
+    return 0.5 * (1.0 + erf(z / np.sqrt(2)))
+
+
+def expected_improvement(mean, std, best, xi=0.01, kappa=None):
+    """Expected amount by which each candidate beats ``best`` (plus margin ``xi``)"""
+    improvement = mean - best - xi
+    z = improvement / std
+    return improvement * norm_cdf(z) + std * norm_pdf(z)
+
+
+def upper_confidence_bound(mean, std, best=None, xi=None, kappa=2.576):
+    """Optimistic estimate ``mean + kappa * std``"""
+    return mean + kappa * std
+
+
+def probability_of_improvement(mean, std, best, xi=0.01, kappa=None):
+    """Probability that each candidate beats ``best`` by at least ``xi``"""
+    return norm_cdf((mean - best - xi) / std)
+
+
+ACQUISITIONS = {
+    'ei': expected_improvement,
+    'ucb': upper_confidence_bound,
+    'pi': probability_of_improvement,
+}
+
+
+class GaussianProcess:
+    """GP regression with a squared-exponential kernel on unit-cube inputs.
+
+    Targets are standardized internally. Instead of the Cholesky factor L of the
+    kernel matrix, the inverse factor L^-1 is kept: adding a point appends one
+    row in O(n^2) and predictions become plain matrix products. The kernel
+    length scale is re-tuned by marginal likelihood whenever the data doubles,
+    which is the only time the matrix is factorized from scratch.
+    """
+
+    def __init__(self, dims, length_scale=0.3, noise=1e-6, capacity=64):
+        self.dims = dims
+        self.length_scale = length_scale
+        self.noise = noise
+        self.count = 0
+        self.tuned_at = 0
+        self.X = np.empty((capacity, dims))
+        self.y = np.empty(capacity)
+        self.L_inv = np.zeros((capacity, capacity))
+
+    def kernel(self, A, B, length_scale=None):
+        length_scale = length_scale or self.length_scale
+        scale = -0.5 / length_scale ** 2
+        K = A @ B.T
+        K *= -2
+        K += np.sum(A * A, axis=1)[:, None]
+        K += np.sum(B * B, axis=1)[None, :]
+        np.maximum(K, 0, out=K)
+        K *= scale
+        return np.exp(K, out=K)
+
+    def _grow(self, needed):
+        capacity = len(self.y)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        for name in ('X', 'y'):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:])
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        L_inv = np.zeros((capacity, capacity))
+        L_inv[:self.count, :self.count] = self.L_inv[:self.count, :self.count]
+        self.L_inv = L_inv
+
+    def _factorize(self):
+        """Full O(n^3) factorization; only after the length scale changes"""
+        n = self.count
+        K = self.kernel(self.X[:n], self.X[:n]) + self.noise * np.eye(n)
+        L = np.linalg.cholesky(K)
+        self.L_inv[:n, :n] = np.linalg.solve(L, np.eye(n))
+
+    def _append(self, x):
+        """Extend L^-1 by the row for one new point (x already stored at index n)"""
+        n = self.count
+        k = self.kernel(self.X[:n], x[None, :])[:, 0]
+        l = self.L_inv[:n, :n] @ k
+        # Clamp for points (nearly) on top of existing ones
+        d = np.sqrt(max(1.0 + self.noise - l @ l, self.noise))
+        self.L_inv[n, :n] = -(l @ self.L_inv[:n, :n]) / d
+        self.L_inv[n, n] = 1.0 / d
+
+    def log_marginal_likelihood(self, length_scale):
+        """Log evidence of the standardized targets for a candidate length scale"""
+        n = self.count
+        y = self._standardized()
+        K = self.kernel(self.X[:n], self.X[:n], length_scale) + self.noise * np.eye(n)
+        try:
+            L = np.linalg.cholesky(K)
+        except np.linalg.LinAlgError:
+            return -np.inf
+        alpha = np.linalg.solve(L, y)
+        return -0.5 * alpha @ alpha - np.log(np.diag(L)).sum() - 0.5 * n * np.log(2 * np.pi)
+
+    def tune(self):
+        """Pick the length scale with the highest marginal likelihood and refactorize"""
+        scores = [self.log_marginal_likelihood(scale) for scale in LENGTH_SCALES]
+        self.length_scale = LENGTH_SCALES[int(np.argmax(scores))]
+        self.tuned_at = self.count
+        self._factorize()
+
+    def add(self, X, y, tune=True):
+        """Add observations (rows of unit-cube ``X`` with targets ``y``)"""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        self._grow(self.count + len(y))
+        for x, target in zip(X, y):
+            self.X[self.count] = x
+            self.y[self.count] = target
+            self._append(x)
+            self.count += 1
+        if tune and self.count >= 2 * max(self.tuned_at, 2):
+            self.tune()
+
+    def truncate(self, count):
+        """Forget every observation after the first ``count``.
+
+        L^-1 is lower triangular, so its leading block is already the factor of
+        the remaining points. Used to roll back the fantasy points of a batch.
+        """
+        self.count = min(count, self.count)
+
+    def _standardized(self):
+        y = self.y[:self.count]
+        self.y_mean = y.mean()
+        self.y_std = y.std() or 1.0
+        return (y - self.y_mean) / self.y_std
+
+    def predict(self, C):
+        """Posterior mean and standard deviation at the rows of ``C``, in target units"""
+        n = self.count
+        L_inv = self.L_inv[:n, :n]
+        alpha = L_inv.T @ (L_inv @ self._standardized())
+        K_cross = self.kernel(self.X[:n], C)
+        v = L_inv @ K_cross
+        mean = K_cross.T @ alpha
+        variance = np.maximum(1.0 - np.sum(v * v, axis=0), 1e-12)
+        return self.y_mean + self.y_std * mean, self.y_std * np.sqrt(variance)
+
+
+class BayesianOptimization:
+    """Maximize ``objective(**params)`` over ``bounds`` = {name: (low, high)}.
+
+    ``maximize`` probes ``init_points`` random points, then spends ``n_iter``
+    iterations on the candidate with the best acquisition score. Each iteration
+    scores ``candidates`` uniform random points plus a cloud around the best
+    point found so far. ``res`` lists every probe as {'target', 'params'} and
+    ``max`` is the best of them.
+
+    ``maximize_batch`` proposes ``batch_size`` points per cycle and evaluates
+    them in parallel; ``strategy`` picks how pending points are filled in while
+    the batch is built: 'believer' (Kriging believer, the GP's own prediction)
+    or 'liar' (constant liar, the worst target seen, which spreads the batch).
+
+    ``surrogate`` builds the GP from the number of parameters; pass
+    sparse_gp.SparseGaussianProcess for histories of thousands of runs.
+    """
+
+    def __init__(self, objective, bounds, acquisition='ei', xi=0.01, kappa=2.576, candidates=256,
+                 strategy='believer', seed=None, surrogate=GaussianProcess):
+        if acquisition not in ACQUISITIONS:
+            raise ValueError(f"Unknown acquisition '{acquisition}'; use one of {sorted(ACQUISITIONS)}")
+        if strategy not in ('believer', 'liar'):
+            raise ValueError(f"Unknown batch strategy '{strategy}'; use 'believer' or 'liar'")
+        self.objective = objective
+        self.names = list(bounds)
+        self.low = np.array([bounds[name][0] for name in self.names], dtype=float)
+        self.high = np.array([bounds[name][1] for name in self.names], dtype=float)
+        self.acquisition = ACQUISITIONS[acquisition]
+        self.xi = xi
+        self.kappa = kappa
+        self.candidates = candidates
+        self.strategy = strategy
+        self.rng = np.random.default_rng(seed)
+        self.gp = surrogate(len(self.names))
+        self.res = []
+        self._best = None
+
+    def _to_unit(self, values):
+        return (np.asarray(values, dtype=float) - self.low) / (self.high - self.low)
+
+    def _from_unit(self, unit):
+        return self.low + unit * (self.high - self.low)
+
+    def _params(self, unit):
+        return {name: float(value) for name, value in zip(self.names, self._from_unit(unit))}
+
+    @property
+    def max(self):
+        return self._best
+
+    @property
+    def targets(self):
+        return [entry['target'] for entry in self.res]
+
+    def register(self, params, target):
+        """Record an observation made outside ``maximize``"""
+        self.gp.add(self._to_unit([params[name] for name in self.names]), target)
+        entry = {'target': float(target), 'params': dict(params)}
+        self.res.append(entry)
+        if self._best is None or entry['target'] > self._best['target']:
+            self._best = entry
+
+    def _candidate_set(self):
+        dims = len(self.names)
+        uniform = self.rng.random((self.candidates, dims))
+        best = self._to_unit([self.max['params'][name] for name in self.names])
+        local = np.clip(best + self.rng.normal(0, 0.05, (self.candidates // 4, dims)), 0, 1)
+        return np.vstack([uniform, local])
+
+    def acquisition_scores(self, candidates):
+        """Acquisition value of every row of unit-cube ``candidates``"""
+        mean, std = self.gp.predict(candidates)
+        return self.acquisition(mean, std, self.max['target'], xi=self.xi, kappa=self.kappa)
+
+    def _best_candidate(self):
+        candidates = self._candidate_set()
+        return candidates[int(np.argmax(self.acquisition_scores(candidates)))]
+
+    def suggest(self):
+        """Parameters of the next point to probe"""
+        if not self.res:
+            return self._params(self.rng.random(len(self.names)))
+        return self._params(self._best_candidate())
+
+    def suggest_batch(self, size):
+        """Parameters of ``size`` points to probe together.
+
+        Each pick is added to the GP as a fantasy observation (see ``strategy``)
+        so the next pick moves elsewhere; the fantasies are rolled back before
+        returning, leaving the GP as it was.
+        """
+        if not self.res:
+            return [self._params(self.rng.random(len(self.names))) for _ in range(size)]
+        observed = self.gp.count
+        lie = min(self.targets)
+        batch = []
+        for _ in range(size):
+            unit = self._best_candidate()
+            batch.append(self._params(unit))
+            fantasy = self.gp.predict(unit[None, :])[0][0] if self.strategy == 'believer' else lie
+            self.gp.add(unit, fantasy, tune=False)
+        self.gp.truncate(observed)
+        return batch
+
+    def probe(self, params):
+        target = self.objective(**params)
+        self.register(params, target)
+        return target
+
+    def maximize(self, init_points=5, n_iter=25):
+        """Run the optimization loop and return the best probe"""
+        for _ in range(init_points):
+            self.probe(self._params(self.rng.random(len(self.names))))
+        for _ in range(n_iter):
+            self.probe(self.suggest())
+        return self.max
+
+    def _probe_batch(self, executor, batch):
+        futures = [executor.submit(self.objective, **params) for params in batch]
+        for params, future in zip(batch, futures):
+            self.register(params, future.result())
+
+    def maximize_batch(self, init_points=5, n_batches=10, batch_size=4, executor=None, target=None):
+        """Run the optimization in cycles of ``batch_size`` parallel probes.
+
+        Probes go to ``executor`` (any concurrent.futures executor; by default a
+        thread pool with one worker per batch slot, suited to objectives that
+        wait on a tool or simulator). Stops early once ``target`` is reached.
+        Returns the best probe.
+        """
+        own_executor = executor is None
+        executor = executor or ThreadPoolExecutor(max_workers=batch_size)
+        try:
+            self._probe_batch(executor, [self._params(self.rng.random(len(self.names)))
+                                         for _ in range(init_points)])
+            for _ in range(n_batches):
+                if target is not None and self.max['target'] >= target:
+                    break
+                self._probe_batch(executor, self.suggest_batch(batch_size))
+        finally:
+            if own_executor:
+                executor.shutdown()
+        return self.max
+
+
+@functools.lru_cache(maxsize=None)
+def slide8_optimization():
+    """The deposition-rate optimization run whose results Slide 8 shows"""
+    settings = SLIDE8_OPTIMIZATION
+    optimizer = BayesianOptimization(deposition_model, DEPOSITION_BOUNDS, settings['acquisition'],
+                                     seed=chart_rng('slide8_optimization'))
+    optimizer.maximize(settings['init_points'], settings['n_iter'])
+    return optimizer
+
+
+@functools.lru_cache(maxsize=None)
+def slide8_runs():
+    """The Slide 8 optimization's probes in order, as recorded in the run store"""
+    def record():
+        optimizer = slide8_optimization()
+        return [entry['params'] for entry in optimizer.res], {'target': optimizer.targets}, SLIDE8_OPTIMIZATION
+
+    with RunStore() as store:
+        name = study_name('slide8', SLIDE8_OPTIMIZATION, sys.modules[__name__], process_model)
+        return store.study(name, record)
+
+
+def benchmark_workers(worker_counts, run_time=0.05, tolerance=0.05, init_points=8, max_probes=120,
+                      strategy='believer', repeats=3):
+    """Time-to-optimum of batch optimization on the simulated tool per worker count.
+
+    Each worker count runs batches of that many parallel probes until a probe
+    is within ``tolerance`` of DEPOSITION_OPTIMUM. Returns
+    {workers: (seconds, probes, reached)} averaged over ``repeats`` seeds.
+    """
+    objective = functools.partial(simulated_tool_run, run_time=run_time)
+    results = {}
+    for workers in worker_counts:
+        runs = []
+        for repeat in range(repeats):
+            optimizer = BayesianOptimization(objective, DEPOSITION_BOUNDS, strategy=strategy,
+                                             seed=chart_rng(f'batch_benchmark_{repeat}'))
+            start = time.perf_counter()
+            best = optimizer.maximize_batch(init_points, -(-(max_probes - init_points) // workers), workers,
+                                            target=DEPOSITION_OPTIMUM - tolerance)
+            runs.append((time.perf_counter() - start, len(optimizer.res),
+                         best['target'] >= DEPOSITION_OPTIMUM - tolerance))
+        seconds, probes, reached = zip(*runs)
+        results[workers] = (float(np.mean(seconds)), float(np.mean(probes)), sum(reached))
+        print(f"{workers:>3} workers: {results[workers][0]:6.2f}s to optimum, "
+              f"{results[workers][1]:5.1f} probes, reached in {sum(reached)}/{repeats} runs")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bayesian optimization of the deposition model")
+    parser.add_argument('--init-points', type=int, default=10, help="random probes before the GP takes over")
+    parser.add_argument('--iterations', type=int, default=15, help="GP-guided probes")
+    parser.add_argument('--acquisition', choices=sorted(ACQUISITIONS), default='ei')
+    parser.add_argument('--seed', type=int, default=None, help="random seed (default: fresh each run)")
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help="benchmark batch mode on the simulated tool with these worker counts")
+    parser.add_argument('--strategy', choices=['believer', 'liar'], default='believer',
+                        help="how pending batch points are filled in")
+    parser.add_argument('--warm-start', default=None, metavar='STUDY',
+                        help="start from the runs of this run-store study")
+    parser.add_argument('--record', default=None, metavar='STUDY', help="append this run's probes to the run store")
+    args = parser.parse_args()
+
+    if args.workers:
+        benchmark_workers(args.workers, strategy=args.strategy)
+        return
+
+    start = time.perf_counter()
+    optimizer = BayesianOptimization(deposition_model, DEPOSITION_BOUNDS, args.acquisition, seed=args.seed)
+    init_points = args.init_points
+    if args.warm_start:
+        with RunStore() as store:
+            warm = store.warm_start(optimizer, study=args.warm_start)
+        print(f"Warm start: {warm} stored runs registered")
+        # History replaces the random initial probes
+        init_points = 0 if warm else init_points
+    history = len(optimizer.res)
+    best = optimizer.maximize(init_points, args.iterations)
+    elapsed = time.perf_counter() - start
+    if args.record:
+        probes = optimizer.res[history:]
+        with RunStore() as store:
+            store.append(args.record, [entry['params'] for entry in probes],
+                         {'target': [entry['target'] for entry in probes]})
+        print(f"Recorded {len(probes)} probes in study '{args.record}'")
+    print(f"{'Iter':>5} {'Target':>9} " + ' '.join(f'{name:>8}' for name in optimizer.names))
+    for index, entry in enumerate(optimizer.res, 1):
+        print(f"{index:>5} {entry['target']:>9.3f} "
+              + ' '.join(f"{entry['params'][name]:>8.2f}" for name in optimizer.names))
+    print(f"\n✅ Best target {best['target']:.3f} at "
+          + ', '.join(f"{name}={value:.2f}" for name, value in best['params'].items())
+          + f" ({len(optimizer.res)} probes in {elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo Process-Variability Engine
+Propagates recipe tolerances through the film model for tens of millions of
+samples. Samples are drawn and evaluated in fixed-size chunks and folded into
+streaming statistics (running moments, a mergeable quantile histogram and spec
+counts), so memory stays constant however many samples are run
+"""
+
+import time
+import argparse
+import functools
+import numpy as np
+import process_model
+from chart_rng import chart_rng
+from process_model import film_responses
+from run_store import RunStore, study_name
+
+# Recipes from the parameter table: baseline and optimized settings of the DOE factors
+RECIPES = {
+    'baseline': {'Temperature': 300, 'Pressure': 2.0, 'Power': 100, 'Flow Rate': 50},
+    'optimized': {'Temperature': 380, 'Pressure': 1.8, 'Power': 145, 'Flow Rate': 75},
+}
+# Run-to-run standard deviation of each setting: manual control vs closed-loop control
+TOLERANCES = {
+    'baseline': {'Temperature': 8.0, 'Pressure': 0.5, 'Power': 8.0, 'Flow Rate': 6.0},
+    'optimized': {'Temperature': 6.0, 'Pressure': 0.42, 'Power': 6.0, 'Flow Rate': 4.5},
+}
+# Film thickness target and specification limits (nm); deposition time is set per
+# recipe so the nominal settings hit the target
+TARGET_THICKNESS = 100.0
+SPEC_LIMITS = (90.0, 110.0)
+
+SAMPLES = 10_000_000
+CHUNK_SIZE = 1 << 20
+
+
+class RunningMoments:
+    """Count, mean, variance, min and max of a stream, merged chunk by chunk (Chan et al.)"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        if not len(values):
+            return
+        count = len(values)
+        mean = values.mean()
+        m2 = np.sum((values - mean) ** 2)
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """Fixed-size histogram that widens itself to cover the stream.
+
+    The range starts from the first chunk; when later values fall outside it,
+    the bin width doubles (neighbouring bins merge) until they fit. Quantiles
+    are interpolated within a bin, so their error is below one bin width.
+    """
+
+    def __init__(self, bins=4096):
+        self.bins = bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.low = None
+        self.width = None
+
+    def _widen(self, low, high):
+        while low < self.low or high >= self.low + self.width * self.bins:
+            # Double the width, keeping the edge on the side that does not need to grow
+            if low < self.low:
+                self.low -= self.width * self.bins
+                self.counts = np.concatenate([np.zeros(self.bins // 2, np.int64),
+                                              self.counts.reshape(-1, 2).sum(axis=1)])
+            else:
+                self.counts = np.concatenate([self.counts.reshape(-1, 2).sum(axis=1),
+                                              np.zeros(self.bins // 2, np.int64)])
+            self.width *= 2
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        if not len(values):
+            return
+        low, high = values.min(), values.max()
+        if self.low is None:
+            span = max(high - low, 1e-12)
+            self.low = low - 0.25 * span
+            self.width = 1.5 * span / self.bins
+        self._widen(low, high)
+        index = ((values - self.low) / self.width).astype(np.int64)
+        np.clip(index, 0, self.bins - 1, out=index)
+        self.counts += np.bincount(index, minlength=self.bins)
+
+    @property
+    def edges(self):
+        return self.low + self.width * np.arange(self.bins + 1)
+
+    def quantile(self, q):
+        """Interpolated quantile(s) ``q`` in [0, 1]"""
+        cumulative = np.concatenate([[0], np.cumsum(self.counts)])
+        return np.interp(np.asarray(q) * cumulative[-1], cumulative, self.edges)
+
+    def histogram(self, bins=60):
+        """(edges, counts) re-binned to ``bins`` bins over the occupied range"""
+        occupied = np.flatnonzero(self.counts)
+        first, last = occupied[0], occupied[-1] + 1
+        group = max(1, -(-(last - first) // bins))
+        counts = self.counts[first:last]
+        counts = np.pad(counts, (0, -len(counts) % group)).reshape(-1, group).sum(axis=1)
+        edges = self.low + self.width * (first + group * np.arange(len(counts) + 1))
+        return edges, counts
+
+
+def propagate(model, nominal, sigmas, samples=SAMPLES, chunk_size=CHUNK_SIZE, rng=None,
+              spec_limits=None, quantiles=(0.00135, 0.5, 0.99865)):
+    """Push Gaussian tolerances on ``nominal`` settings through ``model``, chunk by chunk.
+
+    ``nominal`` and ``sigmas`` map each input (in ``model``'s argument order) to
+    its setting and standard deviation. Returns the streaming statistics, plus
+    yield and Cpk when ``spec_limits`` = (lower, upper) is given.
+    """
+    rng = rng or np.random.default_rng()
+    names = list(nominal)
+    center = np.array([nominal[name] for name in names], dtype=float)
+    spread = np.array([sigmas.get(name, 0.0) for name in names], dtype=float)
+    moments = RunningMoments()
+    sketch = QuantileSketch()
+    in_spec = 0
+    for start in range(0, samples, chunk_size):
+        size = min(chunk_size, samples - start)
+        settings = center + spread * rng.standard_normal((size, len(names)))
+        output = model(*settings.T)
+        moments.update(output)
+        sketch.update(output)
+        if spec_limits:
+            in_spec += np.count_nonzero((output >= spec_limits[0]) & (output <= spec_limits[1]))
+
+    result = {
+        'samples': moments.count,
+        'mean': moments.mean,
+        'std': moments.std,
+        'rsd': 100 * moments.std / moments.mean,
+        'min': moments.min,
+        'max': moments.max,
+        'quantiles': dict(zip(quantiles, sketch.quantile(quantiles))),
+        'sketch': sketch,
+    }
+    if spec_limits:
+        lower, upper = spec_limits
+        result['yield'] = in_spec / moments.count
+        result['cpk'] = min(upper - moments.mean, moments.mean - lower) / (3 * moments.std)
+    return result
+
+
+def thickness_model(recipe):
+    """Film thickness (nm) as a function of the four settings, timed so ``recipe`` hits the target"""
+    rate, _ = film_responses(*RECIPES[recipe].values())
+    deposition_time = TARGET_THICKNESS / rate
+
+    def thickness(temp, pressure, power, flow):
+        rate, _ = film_responses(temp, pressure, power, flow)
+        return rate * deposition_time
+    return thickness
+
+
+@functools.lru_cache(maxsize=None)
+def process_capability(recipe, samples=SAMPLES):
+    """Thickness statistics, yield and Cpk of a recipe under its control tolerances"""
+    return propagate(thickness_model(recipe), RECIPES[recipe], TOLERANCES[recipe], samples,
+                     rng=chart_rng(f'monte_carlo_{recipe}'), spec_limits=SPEC_LIMITS)
+
+
+def sample_runs(recipe, count, rng):
+    """``count`` individual runs of a recipe: their settings (one array per factor) and thickness"""
+    nominal, sigmas = RECIPES[recipe], TOLERANCES[recipe]
+    settings = {name: rng.normal(nominal[name], sigmas[name], count) for name in nominal}
+    return settings, thickness_model(recipe)(*settings.values())
+
+
+@functools.lru_cache(maxsize=None)
+def control_runs(recipe, count=30):
+    """Production runs of a recipe for its control chart, as recorded in the run store"""
+    def record():
+        settings, thickness = sample_runs(recipe, count, chart_rng(f'control_runs_{recipe}'))
+        return settings, {'Thickness': thickness}, {'recipe': recipe, 'tolerances': TOLERANCES[recipe]}
+
+    with RunStore() as store:
+        name = study_name(f'control_{recipe}', count, RECIPES, TOLERANCES, record, sample_runs, thickness_model,
+                          process_model)
+        return store.study(name, record)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo thickness variability of the process recipes")
+    parser.add_argument('recipes', nargs='*', default=list(RECIPES), help="recipes to simulate")
+    parser.add_argument('--samples', type=int, default=SAMPLES, help="Monte Carlo samples per recipe")
+    args = parser.parse_args()
+
+    for recipe in args.recipes:
+        if recipe not in RECIPES:
+            print(f"Warning: unknown recipe '{recipe}'; available: {', '.join(RECIPES)}")
+            continue
+        start = time.perf_counter()
+        result = process_capability(recipe, args.samples)
+        elapsed = time.perf_counter() - start
+        low, median, high = result['quantiles'].values()
+        print(f"{recipe}: {result['mean']:.2f} ± {result['std']:.2f} nm ({result['rsd']:.2f}% RSD), "
+              f"±3σ range {low:.1f}-{high:.1f} nm, median {median:.2f}")
+        print(f"  yield {result['yield']:.4%} within {SPEC_LIMITS[0]:g}-{SPEC_LIMITS[1]:g} nm, "
+              f"Cpk {result['cpk']:.2f}")
+        print(f"✅ {result['samples']:,} samples in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
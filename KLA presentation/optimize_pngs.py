@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+PNG Optimizer for Rendered Charts and Diagrams
+Rewrites flat-colour PNGs as palette images where that is lossless (or visually
+lossless), drops unused alpha and metadata chunks and recompresses at maximum
+deflate effort, in parallel across files
+"""
+
+import io
+import os
+import math
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from PIL import Image
+
+# Minimum PSNR (dB) for accepting a 256-colour quantization of an image that
+# has more colours; anti-aliased diagrams stay indistinguishable above this
+MIN_PSNR = 45
+
+
+def _psnr(original, candidate):
+    error = np.mean((original.astype(np.float64) - candidate.astype(np.float64)) ** 2)
+    return math.inf if error == 0 else 10 * math.log10(255 ** 2 / error)
+
+
+def _pack(values):
+    """One integer per pixel (or palette entry) from its RGB(A) channels"""
+    values = values.astype(np.uint32)
+    packed = np.zeros(values.shape[:-1], np.uint32)
+    for channel in range(values.shape[-1]):
+        packed = (packed << 8) | values[..., channel]
+    return packed
+
+
+def _exact_palette(image, pixels):
+    """Paletted copy of an image with at most 256 distinct colours, bit-exact"""
+    counts = image.getcolors(256)
+    if counts is None:
+        return None
+    colors = np.array(sorted(color for _, color in counts), np.uint8)
+    indices = np.searchsorted(_pack(colors), _pack(pixels))
+    palette = Image.fromarray(indices.astype(np.uint8), 'P')
+    palette.putpalette(colors[:, :3].flatten().tolist())
+    if image.mode == 'RGBA':
+        palette.info['transparency'] = bytes(colors[:, 3].tolist())
+    return palette
+
+
+def _quantized_palette(image, pixels):
+    """256-colour copy of the image if it stays above MIN_PSNR, else None"""
+    method = Image.Quantize.FASTOCTREE if image.mode == 'RGBA' else Image.Quantize.MEDIANCUT
+    quantized = image.quantize(256, method=method, dither=Image.Dither.NONE)
+    restored = np.asarray(quantized.convert(image.mode))
+    return quantized if _psnr(pixels, restored) >= MIN_PSNR else None
+
+
+def _encode(image, dpi, icc_profile=None):
+    buffer = io.BytesIO()
+    params = {'optimize': True, 'compress_level': 9}
+    if dpi:
+        params['dpi'] = dpi
+    if icc_profile:
+        params['icc_profile'] = icc_profile
+    if 'transparency' in image.info:
+        params['transparency'] = image.info['transparency']
+    image.save(buffer, 'PNG', **params)
+    return buffer.getvalue()
+
+
+def optimize_png(path, output_path=None, lossless=False):
+    """Optimize one PNG; returns (path, bytes_before, bytes_after, description).
+
+    The file is only rewritten when the result is smaller. Text and other
+    metadata chunks are dropped; the DPI and ICC profile are kept. 16-bit and
+    float images (modes I;16, I, F) are left as they are: the 8-bit palette and
+    truecolour paths would clip their samples.
+    """
+    output_path = output_path or path
+    with open(path, 'rb') as f:
+        original = f.read()
+    image = Image.open(io.BytesIO(original))
+    image.load()
+    dpi = image.info.get('dpi')
+    icc_profile = image.info.get('icc_profile')
+
+    if image.mode.startswith('I') or image.mode == 'F':
+        if output_path != path:
+            with open(output_path, 'wb') as f:
+                f.write(original)
+        return path, len(original), len(original), 'unchanged'
+    if image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+        image = image.convert('RGBA')
+    # Flatten alpha that is fully opaque everywhere
+    if image.mode in ('RGBA', 'LA') and image.getchannel('A').getextrema()[0] == 255:
+        image = image.convert(image.mode[:-1])
+    if image.mode in ('L', 'LA'):
+        image = image.convert('RGB' if image.mode == 'L' else 'RGBA')
+
+    # A palette image is practically always smaller, so truecolor is only
+    # re-encoded when no acceptable palette exists
+    pixels = np.asarray(image)
+    palette = _exact_palette(image, pixels)
+    quantized = None if palette is not None or lossless else _quantized_palette(image, pixels)
+    if palette is not None:
+        candidates = [(palette, 'palette')]
+    elif quantized is not None:
+        candidates = [(quantized, 'quantized')]
+    else:
+        candidates = [(image, image.mode.lower())]
+
+    description, data = 'unchanged', original
+    for candidate, label in candidates:
+        encoded = _encode(candidate, dpi, icc_profile)
+        if len(encoded) < len(data):
+            description, data = label, encoded
+
+    if data is not original or output_path != path:
+        with open(output_path, 'wb') as f:
+            f.write(data)
+    return path, len(original), len(data), description
+
+
+def _expand_inputs(paths):
+    """Expand directories into the PNGs they contain"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                if name.lower().endswith('.png')))
+        elif os.path.exists(path):
+            files.append(path)
+        else:
+            print(f"Warning: PNG not found: {path}")
+    return files
+
+
+def optimize_pngs(paths, lossless=False, max_workers=None):
+    """Optimize every PNG in ``paths`` in place across worker processes and print the savings"""
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        jobs = {pool.submit(optimize_png, path, None, lossless): path for path in _expand_inputs(paths)}
+        for future in as_completed(jobs):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"Error optimizing {jobs[future]}: {e}")
+
+    total_before = total_after = 0
+    for path, before, after, description in sorted(results):
+        total_before += before
+        total_after += after
+        saved = 100 * (before - after) / before if before else 0
+        print(f"{os.path.basename(path)[:50]:<50} {before / 1024:>8.0f} KB -> {after / 1024:>8.0f} KB "
+              f"({saved:4.1f}% saved, {description})")
+    if total_before:
+        print(f"{'Total':<50} {total_before / 1024:>8.0f} KB -> {total_after / 1024:>8.0f} KB "
+              f"({100 * (total_before - total_after) / total_before:4.1f}% saved)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Losslessly shrink rendered chart and diagram PNGs")
+    parser.add_argument('paths', nargs='*', default=['.'], help="PNG files or folders")
+    parser.add_argument('--lossless', action='store_true',
+                        help="never quantize images with more than 256 colours")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+    optimize_pngs(args.paths, args.lossless, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
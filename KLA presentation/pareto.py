@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Multi-Objective Process Optimization
+NSGA-II over the four DOE factors, trading deposition rate and uniformity
+(maximized) against defect density and wafer cost (minimized). Fronts are ranked with an
+efficient non-dominated sort that binary-searches the fronts in objective order;
+for two and three objectives each front answers "does it dominate this point?"
+from a sorted staircase in O(log N), so a population sorts in O(M N log N);
+with four or more each front is checked by one vectorized pass over its members.
+Crowding distances, selection and variation are vectorized over the population
+"""
+
+import time
+import bisect
+import argparse
+import functools
+import numpy as np
+import pandas as pd
+from chart_rng import chart_rng
+from doe_designs import PROCESS_FACTORS
+from process_model import film_responses, defect_density, wafer_cost
+
+# Objectives reported for the trade-off chart: (name, +1 maximize / -1 minimize)
+OBJECTIVES = [
+    ('Deposition Rate', 1),
+    ('Uniformity', 1),
+    ('Defect Density', -1),
+    ('Wafer Cost', -1),
+]
+POPULATION = 2000
+GENERATIONS = 80
+
+
+def process_objectives(X):
+    """Objective columns (natural units) for recipes ``X`` with one column per PROCESS_FACTORS entry"""
+    rate, uniformity = film_responses(*X.T)
+    return np.column_stack([rate, uniformity, defect_density(*X.T), wafer_cost(*X.T)])
+
+
+class _Staircase:
+    """Two-objective non-dominated set, sorted by the first with the second strictly decreasing"""
+
+    def __init__(self):
+        self.keys = []
+        self.values = []
+
+    def dominates(self, a, b):
+        position = bisect.bisect_right(self.keys, a) - 1
+        return position >= 0 and self.values[position] <= b
+
+    def add(self, a, b):
+        position = bisect.bisect_left(self.keys, a)
+        end = position
+        while end < len(self.keys) and self.values[end] >= b:
+            end += 1
+        self.keys[position:end] = [a]
+        self.values[position:end] = [b]
+
+
+class _Members:
+    """Any number of objectives: members are kept column-major in a growing array and
+    checked with one vectorized comparison per objective"""
+
+    def __init__(self):
+        self.columns = None
+        self.count = 0
+
+    def dominates(self, *point):
+        if not self.count:
+            return False
+        columns = self.columns[:, :self.count]
+        mask = columns[0] <= point[0]
+        for column, value in zip(columns[1:], point[1:]):
+            mask &= column <= value
+        return bool(mask.any())
+
+    def add(self, *point):
+        if self.columns is None:
+            self.columns = np.empty((len(point), 16))
+        elif self.count == self.columns.shape[1]:
+            self.columns = np.concatenate([self.columns, np.empty_like(self.columns)], axis=1)
+        self.columns[:, self.count] = point
+        self.count += 1
+
+
+def non_dominated_sort(F):
+    """Front index (0 = Pareto front) of every row of ``F``, all objectives minimized.
+
+    Rows are visited in lexicographic order, so only earlier rows can dominate
+    a later one, and every row joins the first front that does not dominate it
+    (found by binary search: fronts nest). With three objectives a front
+    dominates a row iff its (f2, f3) staircase does; with two a running minimum
+    suffices. Duplicate rows share a front.
+    """
+    F = np.asarray(F, dtype=float)
+    unique, inverse = np.unique(F, axis=0, return_inverse=True)
+    count, objectives = unique.shape
+    # np.unique sorts rows lexicographically, which is the visiting order we need
+    ranks = np.empty(count, dtype=np.int64)
+    if objectives == 1:
+        ranks[:] = np.arange(count)
+        return ranks[inverse.ravel()]
+
+    if objectives == 2:
+        minima = []
+        for index, value in enumerate(unique[:, 1]):
+            # The fronts' running minima increase with the front index
+            front = bisect.bisect_right(minima, value)
+            if front == len(minima):
+                minima.append(value)
+            else:
+                minima[front] = value
+            ranks[index] = front
+        return ranks[inverse.ravel()]
+
+    make_front = _Staircase if objectives == 3 else _Members
+    tail = unique[:, 1:].tolist()
+    fronts = []
+    for index, point in enumerate(tail):
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            if fronts[middle].dominates(*point):
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(fronts):
+            fronts.append(make_front())
+        fronts[low].add(*point)
+        ranks[index] = low
+    return ranks[inverse.ravel()]
+
+
+def crowding_distance(F, ranks):
+    """NSGA-II crowding distance of every row within its front (front edges are infinite)"""
+    F = np.asarray(F, dtype=float)
+    count, objectives = F.shape
+    distance = np.zeros(count)
+    for m in range(objectives):
+        order = np.lexsort((F[:, m], ranks))
+        values = F[order, m]
+        front = ranks[order]
+        starts = np.flatnonzero(np.diff(front, prepend=-1))
+        ends = np.append(starts[1:], count) - 1
+        span = np.repeat(values[ends] - values[starts], np.diff(np.append(starts, count)))
+        gap = np.zeros(count)
+        gap[1:-1] = values[2:] - values[:-2]
+        gap = np.divide(gap, span, out=np.zeros(count), where=span > 0)
+        gap[starts] = np.inf
+        gap[ends] = np.inf
+        distance[order] += gap
+    return distance
+
+
+def _tournament(rng, ranks, crowding, size):
+    """Binary tournaments: lower front wins, then larger crowding distance"""
+    a, b = rng.integers(0, len(ranks), (2, size))
+    a_wins = (ranks[a] < ranks[b]) | ((ranks[a] == ranks[b]) & (crowding[a] >= crowding[b]))
+    return np.where(a_wins, a, b)
+
+
+def _variation(rng, parents, crossover_eta=15, mutation_eta=20):
+    """Simulated binary crossover and polynomial mutation, in unit-cube coordinates"""
+    dims = parents.shape[1]
+    first, second = parents[0::2], parents[1::2]
+    u = rng.random(first.shape)
+    beta = np.where(u <= 0.5, (2 * u) ** (1 / (crossover_eta + 1)),
+                    (1 / (2 * (1 - u))) ** (1 / (crossover_eta + 1)))
+    # Each variable crosses over with probability 0.5
+    beta = np.where(rng.random(first.shape) < 0.5, beta, 1.0)
+    children = np.concatenate([0.5 * ((1 + beta) * first + (1 - beta) * second),
+                               0.5 * ((1 - beta) * first + (1 + beta) * second)])
+
+    u = rng.random(children.shape)
+    delta = np.where(u < 0.5, (2 * u) ** (1 / (mutation_eta + 1)) - 1,
+                     1 - (2 * (1 - u)) ** (1 / (mutation_eta + 1)))
+    mutate = rng.random(children.shape) < 1 / dims
+    children = np.where(mutate, children + delta, children)
+    return np.clip(children, 0, 1)
+
+
+def nsga2(objectives, bounds, population=POPULATION, generations=GENERATIONS, rng=None):
+    """Minimize every column of ``objectives(X)`` over the box ``bounds`` = [(low, high), ...].
+
+    Returns the final population, its objective values and front indices, Pareto front first.
+    """
+    rng = rng or np.random.default_rng()
+    low = np.array([bound[0] for bound in bounds], dtype=float)
+    high = np.array([bound[1] for bound in bounds], dtype=float)
+    population += population % 2
+    unit = rng.random((population, len(bounds)))
+    F = objectives(low + unit * (high - low))
+    ranks = non_dominated_sort(F)
+    crowding = crowding_distance(F, ranks)
+
+    for _ in range(generations):
+        parents = unit[_tournament(rng, ranks, crowding, population)]
+        children = _variation(rng, parents)
+        unit = np.concatenate([unit, children])
+        F = np.concatenate([F, objectives(low + children * (high - low))])
+        ranks = non_dominated_sort(F)
+        crowding = crowding_distance(F, ranks)
+        # Keep whole fronts in order; the last one that fits partly keeps its least crowded rows
+        survivors = np.lexsort((-crowding, ranks))[:population]
+        # Dropping later fronts leaves the earlier fronts' ranks unchanged
+        unit, F, ranks = unit[survivors], F[survivors], ranks[survivors]
+        crowding = crowding_distance(F, ranks)
+
+    order = np.lexsort((-crowding, ranks))
+    return low + unit[order] * (high - low), F[order], ranks[order]
+
+
+@functools.lru_cache(maxsize=None)
+def pareto_front(population=POPULATION, generations=GENERATIONS):
+    """Pareto-optimal recipes of the film and defect models, one row per recipe"""
+    signs = np.array([sign for _, sign in OBJECTIVES], dtype=float)
+    bounds = [PROCESS_FACTORS[name][:2] for name in PROCESS_FACTORS]
+    X, F, ranks = nsga2(lambda X: -signs * process_objectives(X), bounds, population, generations,
+                        chart_rng('pareto_front'))
+    front = ranks == 0
+    table = pd.DataFrame(X[front], columns=list(PROCESS_FACTORS))
+    for (name, sign), column in zip(OBJECTIVES, (-signs * F[front]).T):
+        table[name] = column
+    return table.sort_values(OBJECTIVES[0][0]).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pareto front of deposition rate, uniformity, defects and cost")
+    parser.add_argument('--population', type=int, default=POPULATION, help="NSGA-II population size")
+    parser.add_argument('--generations', type=int, default=GENERATIONS, help="NSGA-II generations")
+    parser.add_argument('-o', '--output', default=None, help="write the front to this CSV file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    front = pareto_front(args.population, args.generations)
+    elapsed = time.perf_counter() - start
+    if args.output:
+        front.to_csv(args.output, index=False)
+    print(front.describe().loc[['min', 'max']].round(2).to_string())
+    print(f"\n✅ {len(front):,} Pareto-optimal recipes ({args.population:,} recipes x "
+          f"{args.generations} generations, {elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
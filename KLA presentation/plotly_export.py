@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Persistent Plotly Static Exporter
+Starts the headless Kaleido renderer once per build, streams every plotly figure
+through it and reuses earlier exports whose figure JSON has not changed
+"""
+
+import os
+import atexit
+import shutil
+import hashlib
+import plotly
+from chart_engine import CACHE_DIR, output_dpi
+
+PLOTLY_CACHE_DIR = os.path.join(CACHE_DIR, 'plotly')
+# Plotly lays figures out in CSS pixels
+CSS_DPI = 96
+
+
+class PlotlyExporter:
+    """One long-lived Kaleido renderer shared by every export in the process.
+
+    Supports Kaleido 1.x (persistent sync server) and 0.2.x (PlotlyScope
+    subprocess, pointed at plotly's own bundled plotly.js so both agree).
+    """
+
+    def __init__(self, cache_dir=PLOTLY_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.backend = None
+        self.scope = None
+        self.exports = 0
+        self.cache_hits = 0
+
+    def _start(self):
+        import kaleido
+        if hasattr(kaleido, 'start_sync_server'):
+            kaleido.start_sync_server(silence_warnings=True)
+            self.backend = 'server'
+        else:
+            from kaleido.scopes.plotly import PlotlyScope
+            plotlyjs = os.path.join(os.path.dirname(plotly.__file__), 'package_data', 'plotly.min.js')
+            self.scope = PlotlyScope(plotlyjs=plotlyjs if os.path.exists(plotlyjs) else None,
+                                     mathjax=False)
+            self.backend = 'scope'
+
+    def _render(self, fig, fmt, width, height, scale):
+        if self.backend is None:
+            self._start()
+        if self.backend == 'server':
+            import kaleido
+            return kaleido.calc_fig_sync(fig, opts={'format': fmt, 'width': width,
+                                                    'height': height, 'scale': scale})
+        return self.scope.transform(fig.to_dict(), format=fmt, width=width, height=height, scale=scale)
+
+    def export(self, fig, path, width, height, profile=None):
+        """Write ``fig`` to ``path`` sized for a ``width`` x ``height`` inch slide box.
+
+        The figure is laid out at 96 px per inch and scaled to the output
+        profile's resolution, matching save_chart for matplotlib charts.
+        """
+        fmt = os.path.splitext(path)[1].lstrip('.').lower() or 'png'
+        width_px, height_px = round(width * CSS_DPI), round(height * CSS_DPI)
+        scale = output_dpi(profile) / CSS_DPI
+
+        digest = hashlib.sha256(fig.to_json().encode())
+        digest.update(f'{fmt} {width_px}x{height_px}@{scale} plotly{plotly.__version__}'.encode())
+        cached = os.path.join(self.cache_dir, f'{digest.hexdigest()}.{fmt}')
+
+        if os.path.exists(cached):
+            self.cache_hits += 1
+        else:
+            data = self._render(fig, fmt, width_px, height_px, scale)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cached, 'wb') as f:
+                f.write(data)
+            self.exports += 1
+        shutil.copyfile(cached, path)
+        return path
+
+    def close(self):
+        """Shut the renderer down; the next export starts a new one"""
+        if self.backend == 'server':
+            import kaleido
+            kaleido.stop_sync_server(silence_warnings=True)
+        elif self.scope is not None:
+            self.scope._shutdown_kaleido()
+        self.backend = None
+        self.scope = None
+
+
+_exporter = None
+
+
+def export_figure(fig, path, width, height, profile=None):
+    """Export a plotly figure through the build's shared exporter"""
+    global _exporter
+    if _exporter is None:
+        _exporter = PlotlyExporter()
+        atexit.register(_exporter.close)
+    return _exporter.export(fig, path, width, height, profile)
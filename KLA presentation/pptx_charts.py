@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Native PowerPoint Charts
+Adds editable bar, line, pie and radar chart parts to python-pptx slides, so decks
+embed the chart data itself rather than a rendered picture of it
+"""
+
+from matplotlib.colors import to_rgb
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION
+from pptx.util import Inches, Pt
+
+TITLE_COLOR = RGBColor(0, 51, 102)
+
+
+def _rgb(color):
+    """RGBColor from an RGBColor, '#rrggbb' or any matplotlib colour name"""
+    if isinstance(color, RGBColor):
+        return color
+    return RGBColor(*(round(channel * 255) for channel in to_rgb(color)))
+
+
+def _fill(format_, color):
+    format_.fill.solid()
+    format_.fill.fore_color.rgb = _rgb(color)
+
+
+def _chart_data(categories, series, number_format=None):
+    data = CategoryChartData(number_format=number_format) if number_format else CategoryChartData()
+    # Line breaks used for matplotlib tick labels read badly as category names
+    data.categories = [category.replace('\n', ' ') for category in categories]
+    for name, values in series:
+        data.add_series(name, values)
+    return data
+
+
+def _add_chart(slide, chart_type, box, data, title=None, font_size=12):
+    """Place a chart in ``box`` = (left, top, width, height) in inches"""
+    left, top, width, height = (Inches(v) for v in box)
+    chart = slide.shapes.add_chart(chart_type, left, top, width, height, data).chart
+    chart.font.size = Pt(font_size)
+    if title:
+        chart.has_title = True
+        chart.chart_title.text_frame.text = title
+        paragraph = chart.chart_title.text_frame.paragraphs[0]
+        paragraph.font.size = Pt(font_size + 2)
+        paragraph.font.bold = True
+        paragraph.font.color.rgb = TITLE_COLOR
+    else:
+        chart.has_title = False
+    return chart
+
+
+def _style_axes(chart, value_title=None, max_value=None, number_format=None, gridlines=True):
+    value_axis = chart.value_axis
+    value_axis.has_major_gridlines = gridlines
+    if max_value is not None:
+        value_axis.minimum_scale = 0
+        value_axis.maximum_scale = max_value
+    if number_format:
+        value_axis.tick_labels.number_format = number_format
+        value_axis.tick_labels.number_format_is_linked = False
+    if value_title:
+        value_axis.axis_title.text_frame.text = value_title
+        value_axis.axis_title.text_frame.paragraphs[0].font.bold = True
+
+
+def add_bar_chart(slide, box, categories, series, title=None, colors=None, point_colors=None,
+                  value_title=None, max_value=None, number_format=None, data_labels=True,
+                  legend=None, font_size=12):
+    """Clustered column chart; ``series`` is [(name, values), ...].
+
+    ``colors`` sets one fill per series, ``point_colors`` one per category (for
+    single-series baseline/optimized comparisons). The legend is shown by
+    default only when there is more than one series.
+    """
+    data = _chart_data(categories, series, number_format)
+    chart = _add_chart(slide, XL_CHART_TYPE.COLUMN_CLUSTERED, box, data, title, font_size)
+    _style_axes(chart, value_title, max_value, number_format)
+    chart.plots[0].gap_width = 80
+
+    for index, plot_series in enumerate(chart.series):
+        if colors:
+            _fill(plot_series.format, colors[index % len(colors)])
+        plot_series.format.line.color.rgb = RGBColor(0, 0, 0)
+        if point_colors:
+            for point_index, color in enumerate(point_colors):
+                _fill(plot_series.points[point_index].format, color)
+
+    if data_labels:
+        plot = chart.plots[0]
+        plot.has_data_labels = True
+        plot.data_labels.font.bold = True
+        plot.data_labels.position = XL_LABEL_POSITION.OUTSIDE_END
+        if number_format:
+            plot.data_labels.number_format = number_format
+            plot.data_labels.number_format_is_linked = False
+
+    chart.has_legend = len(series) > 1 if legend is None else legend
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    return chart
+
+
+def add_line_chart(slide, box, categories, series, title=None, colors=None, value_title=None,
+                   max_value=None, number_format=None, legend=None, font_size=12):
+    """Line chart with markers; ``series`` is [(name, values), ...]"""
+    data = _chart_data(categories, series, number_format)
+    chart = _add_chart(slide, XL_CHART_TYPE.LINE_MARKERS, box, data, title, font_size)
+    _style_axes(chart, value_title, max_value, number_format)
+    for index, plot_series in enumerate(chart.series):
+        plot_series.smooth = False
+        if colors:
+            color = colors[index % len(colors)]
+            plot_series.format.line.color.rgb = _rgb(color)
+            plot_series.format.line.width = Pt(2.25)
+            _fill(plot_series.marker.format, color)
+    chart.has_legend = len(series) > 1 if legend is None else legend
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    return chart
+
+
+def add_pie_chart(slide, box, categories, values, title=None, colors=None, font_size=12):
+    """Pie chart labelled with each slice's share of the total"""
+    data = _chart_data(categories, [('Share', values)])
+    chart = _add_chart(slide, XL_CHART_TYPE.PIE, box, data, title, font_size)
+    plot = chart.plots[0]
+    if colors:
+        for point_index, color in enumerate(colors):
+            _fill(plot.series[0].points[point_index].format, color)
+    plot.has_data_labels = True
+    plot.data_labels.show_percentage = True
+    plot.data_labels.show_value = False
+    plot.data_labels.number_format = '0.0%'
+    plot.data_labels.number_format_is_linked = False
+    chart.has_legend = True
+    chart.legend.position = XL_LEGEND_POSITION.RIGHT
+    chart.legend.include_in_layout = False
+    return chart
+
+
+def add_radar_chart(slide, box, categories, series, title=None, colors=None, max_value=None,
+                    font_size=12):
+    """Filled radar chart comparing ``series`` ([(name, values), ...]) across categories"""
+    data = _chart_data(categories, series)
+    chart = _add_chart(slide, XL_CHART_TYPE.RADAR_FILLED, box, data, title, font_size)
+    if max_value is not None:
+        chart.value_axis.minimum_scale = 0
+        chart.value_axis.maximum_scale = max_value
+    if colors:
+        for index, plot_series in enumerate(chart.series):
+            color = colors[index % len(colors)]
+            _fill(plot_series.format, color)
+            # Keep the overlapping areas readable, like alpha in the PNG version
+            plot_series.format.fill.fore_color.brightness = 0.4
+            plot_series.format.line.color.rgb = _rgb(color)
+    chart.has_legend = True
+    chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+    chart.legend.include_in_layout = False
+    return chart
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Deposition Process Model
+The benchmark objective from the Slide 8 code listing and its parameter ranges,
+vectorized so optimizers and surface plots can evaluate whole grids at once, and
+a timed stand-in for running a recipe on the deposition tool. The film and defect
+models cover all four DOE factors for the response-surface and trade-off slides,
+and the wafer cost model combines them
+"""
+
+import time
+import zlib
+import numpy as np
+
+# Parameter ranges searched on Slide 8: temperature (°C) and RF power (W)
+DEPOSITION_BOUNDS = {
+    'temp': (100, 500),
+    'power': (50, 150),
+}
+# Best achievable deposition rate within DEPOSITION_BOUNDS
+DEPOSITION_OPTIMUM = 65.25
+# Shares of the baseline wafer cost: tool time, RF energy, process gas and scrap
+WAFER_COST_SHARES = {'tool_time': 0.62, 'energy': 0.06, 'gas': 0.02, 'scrap': 0.30}
+
+
+def deposition_model(temp, power):
+    """Deposition rate for a temperature and power (scalars or numpy arrays).
+
+    Peaks at 65.25 with temp = 305 and power = 150 within DEPOSITION_BOUNDS.
+    """
+    return 5 + 0.1 * temp + 0.2 * power - 0.01 * (temp - 300) ** 2
+
+
+def film_responses(temp, pressure, power, flow):
+    """Deposition rate (nm/min) and film uniformity (%) for the four DOE factors.
+
+    Rate rises with power and pressure until gas-phase depletion sets in;
+    uniformity peaks near 300 °C and 2 Torr and drops at high power.
+    """
+    rate = (20 + 0.06 * temp + 9 * pressure - 0.9 * pressure ** 2 + 0.25 * power
+            + 0.08 * flow + 0.02 * pressure * flow - 0.0001 * (temp - 350) ** 2)
+    uniformity = (96 - 0.0002 * (temp - 300) ** 2 - 0.8 * (pressure - 2) ** 2
+                  - 0.0004 * (power - 80) ** 2 + 0.02 * flow - 0.0001 * (flow - 60) ** 2
+                  - 0.0004 * (temp - 300) * (pressure - 2))
+    return rate, uniformity
+
+
+def defect_density(temp, pressure, power, flow):
+    """Relative defect density (100 at the baseline recipe: 300 °C, 2 Torr, 100 W, 50 sccm).
+
+    Gas-phase particles grow with pressure and plasma power; hotter substrates
+    and stronger purge flow reduce them. Calibrated to the measured 20% drop
+    at the optimized recipe (380 °C, 1.8 Torr, 145 W, 75 sccm).
+    """
+    return 100 * np.exp(0.25 * (pressure - 2) + 0.008 * (power - 100)
+                        - 0.0048 * (temp - 300) - 0.006 * (flow - 50))
+
+
+def wafer_cost(temp, pressure, power, flow):
+    """Relative cost per wafer (100 at the baseline recipe).
+
+    Tool time, RF energy and gas scale with the time needed to deposit the
+    baseline thickness; scrap scales with defect density.
+    """
+    rate, _ = film_responses(temp, pressure, power, flow)
+    baseline_rate, _ = film_responses(300, 2.0, 100, 50)
+    duration = baseline_rate / rate
+    shares = WAFER_COST_SHARES
+    return 100 * (shares['tool_time'] * duration
+                  + shares['energy'] * duration * power / 100
+                  + shares['gas'] * duration * flow / 50
+                  + shares['scrap'] * defect_density(temp, pressure, power, flow) / 100)
+
+
+def simulated_tool_run(temp, power, run_time=0.05, noise=0.0):
+    """Run one recipe on a simulated tool: waits ``run_time`` seconds, returns the rate.
+
+    ``noise`` adds Gaussian measurement error with that standard deviation,
+    seeded from the recipe so repeated runs of a recipe agree.
+    """
+    time.sleep(run_time)
+    rate = deposition_model(temp, power)
+    if noise:
+        seed = zlib.crc32(f'{temp!r} {power!r}'.encode())
+        rate += np.random.default_rng(seed).normal(0, noise)
+    return float(rate)
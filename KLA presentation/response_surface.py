@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Response-Surface Modeling
+Fits linear, interaction and quadratic models to DOE results by least squares
+(all responses in one solve) and evaluates the fitted surfaces over dense
+multi-dimensional grids. Grids are built by contracting the coefficient tensor
+with one small Vandermonde matrix per axis, chunk by chunk into a memory-mapped
+.npy file, so 4-D landscapes at 200 points per axis never have to fit in RAM
+"""
+
+import os
+import time
+import hashlib
+import argparse
+import functools
+import itertools
+import numpy as np
+import doe_designs
+import process_model
+from chart_engine import CACHE_DIR
+from chart_rng import chart_rng
+from doe_designs import PROCESS_FACTORS, doe_matrix
+from process_model import film_responses
+from run_store import RunStore, study_name, run_columns
+
+SURFACE_CACHE_DIR = os.path.join(CACHE_DIR, 'response_surface')
+# Grid points evaluated per chunk (about 32 MB of float64 intermediates)
+CHUNK_POINTS = 1 << 22
+# Grids larger than this are written to a memory-mapped file instead of RAM
+IN_MEMORY_BYTES = 256 * 1024 ** 2
+
+MODELS = ('linear', 'interaction', 'quadratic')
+# Responses measured on the DOE runs
+RESPONSES = ('Deposition Rate', 'Uniformity')
+
+
+def model_terms(k, model='quadratic'):
+    """Exponents of each model term, one row per term: intercept, mains, interactions, squares"""
+    if model not in MODELS:
+        raise ValueError(f"Unknown model '{model}'; use one of {', '.join(MODELS)}")
+    terms = [np.zeros(k, dtype=int)] + list(np.eye(k, dtype=int))
+    if model in ('interaction', 'quadratic'):
+        for i, j in itertools.combinations(range(k), 2):
+            term = np.zeros(k, dtype=int)
+            term[[i, j]] = 1
+            terms.append(term)
+    if model == 'quadratic':
+        terms += list(2 * np.eye(k, dtype=int))
+    return np.array(terms)
+
+
+def design_matrix(coded, powers):
+    """Model matrix: one column per term evaluated at each (coded) run"""
+    coded = np.atleast_2d(coded)
+    return np.prod(coded[:, None, :] ** powers[None, :, :], axis=2)
+
+
+class ResponseSurface:
+    """Polynomial response surfaces over named factors, fitted in coded units.
+
+    ``factors`` maps each factor to its (low, high, ...) range, as in
+    doe_designs.PROCESS_FACTORS; ``responses`` names the fitted responses.
+    Inputs and grid axes are given in natural units.
+    """
+
+    def __init__(self, factors, responses, model='quadratic'):
+        self.factors = dict(factors)
+        self.names = list(self.factors)
+        self.responses = list(responses)
+        self.model = model
+        self.powers = model_terms(len(self.names), model)
+        self.low = np.array([self.factors[name][0] for name in self.names], dtype=float)
+        self.high = np.array([self.factors[name][1] for name in self.names], dtype=float)
+        self.coefficients = None
+
+    def to_coded(self, values):
+        return (np.asarray(values, dtype=float) - (self.low + self.high) / 2) / ((self.high - self.low) / 2)
+
+    def to_coded_axis(self, values, factor):
+        low, high = self.low[factor], self.high[factor]
+        return (values - (low + high) / 2) / ((high - low) / 2)
+
+    def _response_index(self, response):
+        return self.responses.index(response) if isinstance(response, str) else response
+
+    @property
+    def term_names(self):
+        names = []
+        for powers in self.powers:
+            parts = [name if power == 1 else f'{name}^{power}'
+                     for name, power in zip(self.names, powers) if power]
+            names.append('*'.join(parts) or 'Intercept')
+        return names
+
+    def fit(self, X, Y):
+        """Fit every response column of ``Y`` to the runs ``X`` in one least-squares solve"""
+        self.X = np.asarray(X, dtype=float)
+        self.Y = np.asarray(Y, dtype=float).reshape(len(self.X), -1)
+        if self.Y.shape[1] != len(self.responses):
+            raise ValueError(f"Got {self.Y.shape[1]} response columns for {len(self.responses)} responses")
+        A = design_matrix(self.to_coded(self.X), self.powers)
+        if len(A) < A.shape[1]:
+            print(f"Warning: {len(A)} runs for {A.shape[1]} {self.model} terms; the fit is underdetermined")
+        self.coefficients, _, _, _ = np.linalg.lstsq(A, self.Y, rcond=None)
+        residuals = self.Y - A @ self.coefficients
+        total = np.sum((self.Y - self.Y.mean(axis=0)) ** 2, axis=0)
+        self.r_squared = 1 - np.sum(residuals ** 2, axis=0) / np.where(total > 0, total, 1)
+        self.rmse = np.sqrt(np.mean(residuals ** 2, axis=0))
+        return self
+
+    def predict(self, X, response=None):
+        """Predicted responses at runs ``X`` (all columns, or one ``response``)"""
+        predictions = design_matrix(self.to_coded(X), self.powers) @ self.coefficients
+        return predictions if response is None else predictions[:, self._response_index(response)]
+
+    def coefficient_tensor(self, response=0):
+        """Coefficients arranged by exponent: entry [p1, ..., pk] multiplies x1^p1 * ... * xk^pk"""
+        degree = int(self.powers.max())
+        tensor = np.zeros((degree + 1,) * len(self.names))
+        tensor[tuple(self.powers.T)] = self.coefficients[:, self._response_index(response)]
+        return tensor
+
+    def _axes(self, axes):
+        axes = [np.atleast_1d(np.asarray(axis, dtype=float)) for axis in axes]
+        if len(axes) != len(self.names):
+            raise ValueError(f"Need one axis per factor ({len(self.names)}), got {len(axes)}")
+        return axes
+
+    def evaluate_grid(self, axes, response=0, path=None, dtype=np.float32, chunk_points=CHUNK_POINTS):
+        """Surface over the full grid of ``axes`` (one 1-D array or scalar per factor).
+
+        Returns an array of shape (len(axis1), ..., len(axisk)). Grids above
+        IN_MEMORY_BYTES (or any grid when ``path`` is given) are written in
+        chunks along the first axis to a memory-mapped .npy file; without a
+        ``path`` that file is cached under SURFACE_CACHE_DIR and reused.
+        """
+        axes = self._axes(axes)
+        shape = tuple(len(axis) for axis in axes)
+        tensor = self.coefficient_tensor(response)
+        exponents = np.arange(tensor.shape[0])[:, None]
+        # Per-axis Vandermonde matrices: row p holds the coded axis values to the power p
+        vandermondes = [self.to_coded_axis(axis, i) ** exponents for i, axis in enumerate(axes)]
+
+        nbytes = int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+        if path is None and nbytes > IN_MEMORY_BYTES:
+            digest = hashlib.sha256(tensor.tobytes() + np.dtype(dtype).str.encode())
+            for axis in axes:
+                digest.update(axis.tobytes())
+            path = os.path.join(SURFACE_CACHE_DIR, digest.hexdigest()[:32] + '.npy')
+            if os.path.exists(path):
+                return np.load(path, mmap_mode='r')
+        if path is None:
+            grid = np.empty(shape, dtype)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            partial = path + '.partial'
+            # Write the .npy header and size the file; chunks get their own mappings below
+            grid = np.lib.format.open_memmap(partial, mode='w+', dtype=dtype, shape=shape)
+            offset = grid.offset
+            del grid
+
+        rows = max(1, chunk_points // max(1, int(np.prod(shape[1:], dtype=np.int64))))
+        for start in range(0, shape[0], rows):
+            block = tensor
+            # Each contraction sums out the leading exponent axis and appends a grid axis
+            for index, vandermonde in enumerate(vandermondes):
+                if index == 0:
+                    vandermonde = vandermonde[:, start:start + rows]
+                block = np.tensordot(block, vandermonde, axes=(0, 0))
+            if path is None:
+                grid[start:start + rows] = block
+            else:
+                # A mapping per chunk, so written pages are released instead of piling up
+                chunk = _chunk_map(partial, offset, dtype, shape, start, len(block), 'r+')
+                chunk[:] = block
+                chunk.flush()
+                del chunk
+
+        if path is not None:
+            os.replace(partial, path)
+            return np.load(path, mmap_mode='r')
+        return grid
+
+    def _fixed_axes(self, varying, points, fixed):
+        """Grid axes with ``varying`` factors spanning their ranges and the rest held fixed"""
+        fixed = fixed or {}
+        axes = []
+        for i, name in enumerate(self.names):
+            if name in varying:
+                axes.append(np.linspace(self.low[i], self.high[i], points))
+            else:
+                axes.append(fixed.get(name, (self.low[i] + self.high[i]) / 2))
+        return axes
+
+    def slice(self, factor, response=0, points=200, fixed=None):
+        """(x, y) of the surface along one factor, others at ``fixed`` values (default: centers)"""
+        axes = self._fixed_axes([factor], points, fixed)
+        values = self.evaluate_grid(axes, response, dtype=np.float64)
+        return axes[self.names.index(factor)], values.ravel()
+
+    def contour(self, x_factor, y_factor, response=0, points=200, fixed=None):
+        """(X, Y, Z) meshes over two factors for contour plots, Z indexed [y, x]"""
+        axes = self._fixed_axes([x_factor, y_factor], points, fixed)
+        i, j = self.names.index(x_factor), self.names.index(y_factor)
+        values = self.evaluate_grid(axes, response, dtype=np.float64).reshape(points, points)
+        Z = values.T if i < j else values
+        X, Y = np.meshgrid(axes[i], axes[j])
+        return X, Y, Z
+
+
+def _chunk_map(filename, offset, dtype, shape, start, rows, mode='r'):
+    """Memory map of rows ``start:start + rows`` of a C-ordered array stored at ``offset``"""
+    row_bytes = int(np.prod(shape[1:], dtype=np.int64)) * np.dtype(dtype).itemsize
+    return np.memmap(filename, dtype=dtype, mode=mode, offset=offset + start * row_bytes,
+                     shape=(rows,) + tuple(shape[1:]))
+
+
+def grid_maximum(grid, axes, chunk_points=CHUNK_POINTS):
+    """Largest value of an evaluated grid and its factor settings, scanning it chunk by chunk"""
+    best, best_index = -np.inf, None
+    chunk_rows = max(1, chunk_points // max(1, int(np.prod(grid.shape[1:], dtype=np.int64))))
+    for start in range(0, grid.shape[0], chunk_rows):
+        rows = min(chunk_rows, grid.shape[0] - start)
+        if isinstance(grid, np.memmap):
+            block = np.array(_chunk_map(grid.filename, grid.offset, grid.dtype, grid.shape, start, rows))
+        else:
+            block = grid[start:start + rows]
+        flat = int(np.argmax(block))
+        if block.flat[flat] > best:
+            best = float(block.flat[flat])
+            best_index = np.unravel_index(flat, block.shape)
+            best_index = (best_index[0] + start,) + best_index[1:]
+    point = [np.atleast_1d(axis)[index] for axis, index in zip(axes, best_index)]
+    return best, point
+
+
+@functools.lru_cache(maxsize=None)
+def process_doe_runs():
+    """The face-centered CCD run on the film model, as recorded in the run store"""
+    def record():
+        design = doe_matrix('central_composite', face='ccf')
+        rate, uniformity = film_responses(*design.values.T)
+        rng = chart_rng('process_surface')
+        # Measurement noise of the metrology: rate in nm/min, uniformity in %
+        measurements = {'Deposition Rate': rate + rng.normal(0, 0.5, len(design)),
+                        'Uniformity': uniformity + rng.normal(0, 0.3, len(design))}
+        return design, measurements, {'design': 'central_composite', 'face': 'ccf'}
+
+    with RunStore() as store:
+        return store.study(study_name('process_doe', record, doe_designs, process_model), record)
+
+
+def fit_runs(runs, model='quadratic', responses=RESPONSES):
+    """ResponseSurface over PROCESS_FACTORS fitted to the complete rows of stored ``runs``"""
+    table = run_columns(runs, [*PROCESS_FACTORS, *responses])
+    return ResponseSurface(PROCESS_FACTORS, list(responses), model).fit(table[list(PROCESS_FACTORS)].values,
+                                                                         table[list(responses)].values)
+
+
+@functools.lru_cache(maxsize=None)
+def process_surface(model='quadratic'):
+    """Rate and uniformity surfaces fitted to the DOE runs"""
+    return fit_runs(process_doe_runs(), model)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit the process response surfaces and map a dense landscape")
+    parser.add_argument('--model', choices=MODELS, default='quadratic', help="response-surface model")
+    parser.add_argument('--response', default='Deposition Rate', help="response to map")
+    parser.add_argument('--points', type=int, default=200, help="grid points per factor")
+    parser.add_argument('-o', '--output', default=None,
+                        help=".npy file for the landscape (default: cached under .chart_cache)")
+    parser.add_argument('--history', nargs='?', const='', default=None, metavar='STUDY',
+                        help="fit every run in the run store (all studies, or just STUDY) instead of the DOE")
+    args = parser.parse_args()
+
+    if args.history is None:
+        surface = process_surface(args.model)
+    else:
+        with RunStore() as store:
+            surface = fit_runs(store.query(args.history or None), args.model)
+    for name, r_squared, rmse in zip(surface.responses, surface.r_squared, surface.rmse):
+        print(f"{name}: R² = {r_squared:.4f}, RMSE = {rmse:.3f} ({len(surface.X)} runs)")
+
+    axes = [np.linspace(surface.low[i], surface.high[i], args.points) for i in range(len(surface.names))]
+    start = time.perf_counter()
+    grid = surface.evaluate_grid(axes, args.response, path=args.output)
+    elapsed = time.perf_counter() - start
+    best, point = grid_maximum(grid, axes)
+    settings = ', '.join(f'{name} = {value:.4g}' for name, value in zip(surface.names, point))
+    print(f"Maximum {args.response}: {best:.2f} at {settings}")
+    print(f"\n✅ {grid.size:,} grid points ({grid.nbytes / 1024 ** 2:,.0f} MB) in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Experiment Run Store
+Embedded, append-only log of process runs (recipe settings, measurements and
+metadata) in a single SQLite file. Rows are never updated or deleted; B-tree
+indexes on every recipe parameter (alone and within a study) and on the
+timestamp answer range queries over millions of runs in milliseconds. Studies recorded here warm-start the
+Bayesian optimizer and the response-surface fits, and the charts read their
+run data from the same store
+"""
+
+import os
+import time
+import json
+import sqlite3
+import hashlib
+import inspect
+import argparse
+import tempfile
+import contextlib
+import numpy as np
+import pandas as pd
+from chart_rng import BASE_SEED
+from doe_designs import PROCESS_FACTORS
+
+RUN_STORE_PATH = 'experiment_runs.sqlite'
+# Store column -> the names the scripts use for it (DOE factor, optimizer parameter, ...)
+PARAMETERS = {
+    'temperature': ('Temperature', 'temp'),
+    'pressure': ('Pressure',),
+    'power': ('Power',),
+    'flow_rate': ('Flow Rate', 'flow'),
+}
+MEASUREMENTS = {
+    'deposition_rate': ('Deposition Rate', 'target'),
+    'uniformity': ('Uniformity',),
+    'defect_density': ('Defect Density',),
+    'thickness': ('Thickness',),
+}
+COLUMNS = {alias: column for column, aliases in {**PARAMETERS, **MEASUREMENTS}.items()
+           for alias in (column,) + aliases}
+# Most recent runs registered by warm_start (the exact GP costs O(n^2) per point;
+# use limit=None with sparse_gp.SparseGaussianProcess for the whole history)
+WARM_START_LIMIT = 500
+# SQLite page cache per connection
+CACHE_KIB = 256 * 1024
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS studies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    created REAL NOT NULL,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    study_id INTEGER NOT NULL REFERENCES studies(id),
+    timestamp REAL NOT NULL,
+    {', '.join(f'{column} REAL' for column in [*PARAMETERS, *MEASUREMENTS])},
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_study ON runs(study_id, timestamp);
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs(timestamp);
+{''.join(f'CREATE INDEX IF NOT EXISTS runs_{column} ON runs({column});' for column in PARAMETERS)}
+{''.join(f'CREATE INDEX IF NOT EXISTS runs_study_{column} ON runs(study_id, {column});' for column in PARAMETERS)}
+""" + ''.join(f"""
+CREATE TRIGGER IF NOT EXISTS {table}_no_{action} BEFORE {action.upper()} ON {table}
+BEGIN SELECT RAISE(ABORT, 'the run store is append-only'); END;
+""" for table in ('studies', 'runs') for action in ('update', 'delete'))
+
+
+def column_name(name):
+    """Store column for a parameter or measurement name (or alias)"""
+    if name not in COLUMNS:
+        raise ValueError(f"Unknown run field '{name}'; use one of {sorted(COLUMNS)}")
+    return COLUMNS[name]
+
+
+def study_name(name, *depends):
+    """``name`` tagged with a hash of the code and data a study is generated from.
+
+    A synthetic study is recorded once per version of its generator, so charts
+    never read runs produced by older code.
+    """
+    digest = hashlib.sha256(f'seed{BASE_SEED}'.encode())
+    for value in depends:
+        source = inspect.getsource(value) if callable(value) or inspect.ismodule(value) else repr(value)
+        digest.update(source.encode())
+    return f'{name}@{digest.hexdigest()[:12]}'
+
+
+def run_columns(runs, names):
+    """Columns ``names`` (store columns or aliases) of a query result, keeping complete rows"""
+    columns = runs[[column_name(name) for name in names]]
+    columns.columns = list(names)
+    return columns[columns.notna().all(axis=1)].reset_index(drop=True)
+
+
+def _table(rows):
+    """DataFrame of ``rows``: a DataFrame, a dict of columns or a list of dicts"""
+    if rows is None:
+        return pd.DataFrame()
+    return rows.reset_index(drop=True) if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows)
+
+
+class RunStore:
+    """Append-only run log in the SQLite file ``path`` (':memory:' for a scratch store).
+
+    Each run belongs to a named study and carries a timestamp, any of the
+    PARAMETERS and MEASUREMENTS (by column name or alias) and an optional JSON
+    metadata dict. Several processes may read and append concurrently.
+    """
+
+    def __init__(self, path=RUN_STORE_PATH):
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        if path != ':memory:':
+            self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        # Bulk appends touch every index; a larger page cache keeps their hot pages in memory
+        self.connection.execute(f'PRAGMA cache_size=-{CACHE_KIB}')
+        self.connection.executescript(SCHEMA)
+        self._depth = 0
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Write transaction, taking the database lock up front; nested uses join the outer one"""
+        if self._depth:
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+        self.connection.execute('BEGIN IMMEDIATE')
+        self._depth = 1
+        try:
+            yield
+        except BaseException:
+            self.connection.execute('ROLLBACK')
+            raise
+        else:
+            self.connection.execute('COMMIT')
+        finally:
+            self._depth = 0
+
+    def _study_id(self, name, create=False, metadata=None):
+        row = self.connection.execute('SELECT id FROM studies WHERE name = ?', (name,)).fetchone()
+        if row or not create:
+            return row[0] if row else None
+        cursor = self.connection.execute(
+            'INSERT INTO studies (name, created, metadata) VALUES (?, ?, ?)',
+            (name, time.time(), json.dumps(metadata) if metadata else None))
+        return cursor.lastrowid
+
+    def studies(self):
+        """One row per study: name, creation time, metadata and run count"""
+        rows = self.connection.execute(
+            'SELECT name, created, metadata, (SELECT COUNT(*) FROM runs WHERE study_id = studies.id) '
+            'FROM studies ORDER BY id').fetchall()
+        table = pd.DataFrame(rows, columns=['study', 'created', 'metadata', 'runs'])
+        table['metadata'] = [json.loads(text) if text else {} for text in table['metadata']]
+        return table
+
+    def append(self, study, recipes, measurements=None, timestamps=None, metadata=None, study_metadata=None):
+        """Append runs to ``study`` (created on first use) and return how many were added.
+
+        ``recipes`` and ``measurements`` hold one row per run, as DataFrames,
+        dicts of columns or lists of dicts, keyed by column name or alias.
+        ``timestamps`` defaults to now; ``metadata`` is an optional list of
+        per-run dicts and ``study_metadata`` describes a newly created study.
+        """
+        table = pd.concat([_table(recipes), _table(measurements)], axis=1)
+        table.columns = [column_name(name) for name in table.columns]
+        if table.columns.duplicated().any():
+            raise ValueError(f"Run fields given twice: {sorted(set(table.columns[table.columns.duplicated()]))}")
+        count = len(table)
+        if timestamps is None:
+            timestamps = np.full(count, time.time())
+        notes = [json.dumps(entry) if entry else None for entry in metadata] if metadata else [None] * count
+        if len(timestamps) != count or len(notes) != count:
+            raise ValueError(f"Expected {count} timestamps and metadata entries, one per run")
+
+        fields = list(table.columns)
+        # tolist() gives Python floats; SQLite stores NaN as NULL
+        columns = [np.asarray(timestamps, dtype=float).tolist()]
+        columns += [table[field].to_numpy(dtype=float).tolist() for field in fields]
+        sql = (f"INSERT INTO runs (study_id, timestamp, {''.join(f'{field}, ' for field in fields)}metadata) "
+               f"VALUES (?, ?, {'?, ' * len(fields)}?)")
+        with self.transaction():
+            study_id = self._study_id(study, create=True, metadata=study_metadata)
+            self.connection.executemany(sql, zip([study_id] * count, *columns, notes))
+        return count
+
+    def query(self, study=None, since=None, until=None, limit=None, **ranges):
+        """Runs matching every filter, oldest first.
+
+        ``since``/``until`` bound the timestamp and each keyword range
+        ``name=(low, high)`` a parameter or measurement (inclusive; either bound
+        may be None). ``limit`` keeps only the most recent matches.
+        """
+        ranged = {'timestamp': (since, until)} if since is not None or until is not None else {}
+        ranged.update({column_name(name): bounds for name, bounds in ranges.items()})
+        study_id = self._study_id(study) if study is not None else None
+        # SQLite has no statistics on value ranges, so pick the index ourselves: the indexed
+        # range covering the smallest share of its column's span (within the study, if
+        # given). A unary + keeps the planner from using an index for the other conditions.
+        indexed = [column for column in ranged if column == 'timestamp' or column in PARAMETERS]
+        driver = indexed[0] if len(indexed) == 1 else min(
+            indexed, key=lambda column: self._coverage(column, *ranged[column], study_id=study_id), default=None)
+        conditions, values = [], []
+        if study is not None:
+            # The (study, timestamp) and (study, parameter) indexes serve ranges within a study
+            conditions.append('study_id = ?')
+            values.append(study_id)
+        for column, (low, high) in ranged.items():
+            prefix = '' if column == driver else '+'
+            if low is not None:
+                conditions.append(f'{prefix}{column} >= ?')
+                values.append(float(low))
+            if high is not None:
+                conditions.append(f'{prefix}{column} <= ?')
+                values.append(float(high))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        fields = ['timestamp', *PARAMETERS, *MEASUREMENTS]
+        sql = f"SELECT id, study_id, {', '.join(fields)}, metadata FROM runs{where}"
+        if limit is not None:
+            sql = f"SELECT * FROM ({sql} ORDER BY timestamp DESC, id DESC LIMIT {int(limit)})"
+        rows = self.connection.execute(f"{sql} ORDER BY timestamp, id", values).fetchall()
+        table = pd.DataFrame(rows, columns=['id', 'study', *fields, 'metadata'])
+        names = dict(self.connection.execute('SELECT id, name FROM studies'))
+        table['study'] = table['study'].map(names)
+        table[fields] = table[fields].astype(float)
+        return table
+
+    def _coverage(self, column, low, high, study_id=None):
+        """Share of ``column``'s stored span (in study ``study_id``, if given) inside [low, high].
+
+        Two O(log n) index probes for the timestamp and the PARAMETERS.
+        """
+        if study_id is None:
+            lowest, highest = self.connection.execute(
+                f'SELECT (SELECT MIN({column}) FROM runs), (SELECT MAX({column}) FROM runs)').fetchone()
+        else:
+            # The planner may pick another (study_id, ...) index and scan the whole study
+            index = 'runs_study' if column == 'timestamp' else f'runs_study_{column}'
+            lowest, highest = self.connection.execute(
+                f'SELECT (SELECT MIN({column}) FROM runs INDEXED BY {index} WHERE study_id = ?1), '
+                f'(SELECT MAX({column}) FROM runs INDEXED BY {index} WHERE study_id = ?1)',
+                (study_id,)).fetchone()
+        if lowest is None or highest <= lowest:
+            return 1.0
+        low = lowest if low is None else max(float(low), lowest)
+        high = highest if high is None else min(float(high), highest)
+        return max(high - low, 0.0) / (highest - lowest)
+
+    def history(self, names, study=None, **filters):
+        """Matching runs with a value for every one of ``names``, as columns under those names"""
+        return run_columns(self.query(study, **filters), names)
+
+    def study(self, name, record):
+        """Runs of study ``name``, recording them with ``record()`` first if the store has none.
+
+        ``record`` returns (recipes, measurements, study metadata) as taken by
+        ``append``. The check and the append share one write transaction, so
+        concurrent chart workers record a study exactly once.
+        """
+        with self.transaction():
+            if self._study_id(name) is None:
+                recipes, measurements, metadata = record()
+                self.append(name, recipes, measurements, study_metadata=metadata)
+        return self.query(name)
+
+    def warm_start(self, optimizer, measurement='deposition_rate', study=None, limit=WARM_START_LIMIT, **filters):
+        """Register stored runs inside ``optimizer``'s bounds as its observations; returns the count.
+
+        The optimizer's parameter names are matched to store columns by alias,
+        and ``measurement`` is the target. Only the ``limit`` most recent
+        matching runs are used.
+        """
+        ranges = {name: (low, high) for name, low, high in zip(optimizer.names, optimizer.low, optimizer.high)}
+        runs = self.history([*optimizer.names, measurement], study, limit=limit, **ranges, **filters)
+        for row in runs.itertuples(index=False):
+            optimizer.register(dict(zip(optimizer.names, row[:-1])), row[-1])
+        return len(runs)
+
+
+def benchmark(rows, queries=200, path=None, rng=None):
+    """Append ``rows`` synthetic runs to a fresh store and time indexed range queries.
+
+    Returns (seconds to append, median query milliseconds, median rows per query).
+    """
+    rng = rng or np.random.default_rng()
+    directory = None
+    if path is None:
+        directory = tempfile.TemporaryDirectory()
+        path = os.path.join(directory.name, 'runs.sqlite')
+    try:
+        with RunStore(path) as store:
+            start = time.perf_counter()
+            end = time.time()
+            chunk = 1 << 18
+            for offset in range(0, rows, chunk):
+                size = min(chunk, rows - offset)
+                recipes = {name: rng.uniform(low, high, size) for name, (low, high, _) in PROCESS_FACTORS.items()}
+                # A year of runs, in time order
+                timestamps = end - 365 * 86400 * (1 - (offset + np.arange(size)) / rows)
+                measurements = {'Deposition Rate': rng.normal(40, 5, size), 'Uniformity': rng.normal(95, 1, size)}
+                store.append('benchmark', recipes, measurements, timestamps)
+            store.connection.execute('ANALYZE')
+            append_time = time.perf_counter() - start
+
+            timings, sizes = [], []
+            for _ in range(queries):
+                # Alternate between a narrow parameter window and a one-day time window
+                if len(timings) % 2:
+                    low = rng.uniform(200, 495)
+                    query = {'Temperature': (low, low + 0.5), 'Power': (50, 150)}
+                else:
+                    since = end - rng.uniform(1, 365) * 86400
+                    query = {'since': since, 'until': since + 86400}
+                start = time.perf_counter()
+                sizes.append(len(store.query(**query)))
+                timings.append(1000 * (time.perf_counter() - start))
+        return append_time, float(np.median(timings)), float(np.median(sizes))
+    finally:
+        if directory:
+            directory.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the experiment run store or benchmark its queries")
+    parser.add_argument('--path', default=RUN_STORE_PATH, help="run store file")
+    parser.add_argument('--benchmark', type=int, default=None, metavar='ROWS',
+                        help="time range queries over this many synthetic runs (in a temporary store)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        append_time, milliseconds, matches = benchmark(args.benchmark)
+        print(f"✅ Appended {args.benchmark:,} runs in {append_time:.1f}s; range queries take "
+              f"{milliseconds:.2f} ms (median, {matches:.0f} matching runs)")
+        return
+
+    if not os.path.exists(args.path):
+        print(f"Warning: no run store at {args.path}; render the charts to record the studies")
+        return
+    with RunStore(args.path) as store:
+        studies = store.studies()
+    print(studies[['study', 'created', 'runs']].assign(
+        created=pd.to_datetime(studies['created'], unit='s').dt.strftime('%Y-%m-%d %H:%M')).to_string(index=False))
+    print(f"\n✅ {studies['runs'].sum():,} runs in {len(studies)} studies")
+
+
+if __name__ == "__main__":
+    main()
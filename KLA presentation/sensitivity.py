@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Global Sensitivity Analysis
+Sobol first-order and total indices of the film model's responses to the four
+DOE factors, estimated with Saltelli's sampling scheme. The whole sample
+matrix is evaluated in one vectorized call (or split across worker processes
+for expensive models) and the confidence intervals come from a vectorized
+bootstrap over the same model evaluations
+"""
+
+import time
+import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from chart_rng import chart_rng
+from doe_designs import PROCESS_FACTORS, latin_hypercube
+from process_model import film_responses
+
+# Base samples N; the model is evaluated N * (k + 2) times
+BASE_SAMPLES = 8192
+BOOTSTRAP = 1000
+CONFIDENCE = 0.95
+# Bootstrap replicates resampled per vectorized batch (bounds the index arrays' memory)
+BOOTSTRAP_BATCH = 100
+
+
+def deposition_rate(temp, pressure, power, flow):
+    return film_responses(temp, pressure, power, flow)[0]
+
+
+def film_uniformity(temp, pressure, power, flow):
+    return film_responses(temp, pressure, power, flow)[1]
+
+
+# Responses analysed for the slides; module-level functions so worker processes can pickle them
+RESPONSES = {
+    'Deposition Rate': deposition_rate,
+    'Uniformity': film_uniformity,
+}
+
+
+def saltelli_sample(factors, base_samples, rng):
+    """Stacked Saltelli matrix [A; B; AB_1; ...; AB_k] in natural units.
+
+    A and B are the two halves of one decorrelated Latin hypercube; AB_i is A
+    with column i taken from B.
+    """
+    k = len(factors)
+    low = np.array([factors[name][0] for name in factors], dtype=float)
+    high = np.array([factors[name][1] for name in factors], dtype=float)
+    unit = (latin_hypercube(2 * k, base_samples, criterion='correlation', seed=rng) + 1) / 2
+    A, B = unit[:, :k], unit[:, k:]
+    AB = np.repeat(A[None], k, axis=0)
+    columns = np.arange(k)
+    AB[columns, :, columns] = B[:, columns].T
+    stacked = np.concatenate([A[None], B[None], AB]).reshape(-1, k)
+    return low + stacked * (high - low)
+
+
+def _evaluate_chunk(model, chunk):
+    return np.asarray(model(*chunk.T), dtype=float)
+
+
+def evaluate(model, X, workers=None):
+    """``model`` over every row of ``X``: one vectorized call, or chunks on ``workers`` processes"""
+    if not workers or workers < 2:
+        return _evaluate_chunk(model, X)
+    chunks = np.array_split(X, workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return np.concatenate(list(executor.map(_evaluate_chunk, [model] * len(chunks), chunks)))
+
+
+def _indices(fA, fB, fAB):
+    """First-order (Saltelli 2010) and total (Jansen) indices along the last axis"""
+    both = np.concatenate([fA, fB], axis=-1)
+    variance = np.var(both, axis=-1)
+    # Centering fB leaves the estimate unbiased but removes the mean's noise from it
+    centered = fB - np.mean(both, axis=-1, keepdims=True)
+    first = np.mean(centered * (fAB - fA), axis=-1) / variance
+    total = 0.5 * np.mean((fA - fAB) ** 2, axis=-1) / variance
+    return first, total
+
+
+def sobol_indices(outputs, k, bootstrap=BOOTSTRAP, confidence=CONFIDENCE, rng=None):
+    """Indices and bootstrap confidence intervals from stacked Saltelli outputs.
+
+    Returns a DataFrame with one row per factor: S1 and ST with their
+    percentile interval bounds.
+    """
+    rng = rng or np.random.default_rng()
+    outputs = np.asarray(outputs, dtype=float).reshape(k + 2, -1)
+    fA, fB, fAB = outputs[0], outputs[1], outputs[2:]
+    first, total = _indices(fA, fB, fAB)
+
+    samples = len(fA)
+    first_boot, total_boot = [], []
+    for start in range(0, bootstrap, BOOTSTRAP_BATCH):
+        resample = rng.integers(0, samples, (min(BOOTSTRAP_BATCH, bootstrap - start), samples))
+        # (k, replicates) indices from (replicates, samples) resamples of every matrix at once
+        batch_first, batch_total = _indices(fA[resample], fB[resample], fAB[:, resample])
+        first_boot.append(batch_first)
+        total_boot.append(batch_total)
+    tails = [(1 - confidence) / 2, (1 + confidence) / 2]
+    first_low, first_high = np.quantile(np.concatenate(first_boot, axis=1), tails, axis=1)
+    total_low, total_high = np.quantile(np.concatenate(total_boot, axis=1), tails, axis=1)
+    return pd.DataFrame({'S1': first, 'S1_low': first_low, 'S1_high': first_high,
+                         'ST': total, 'ST_low': total_low, 'ST_high': total_high})
+
+
+def sensitivity_analysis(model, factors=PROCESS_FACTORS, base_samples=BASE_SAMPLES, bootstrap=BOOTSTRAP,
+                         workers=None, rng=None):
+    """Sobol indices of ``model`` (called with one array per factor) over the factor ranges"""
+    rng = rng or np.random.default_rng()
+    X = saltelli_sample(factors, base_samples, rng)
+    indices = sobol_indices(evaluate(model, X, workers), len(factors), bootstrap, rng=rng)
+    indices.index = list(factors)
+    return indices
+
+
+@functools.lru_cache(maxsize=None)
+def process_sensitivity(response):
+    """Sobol indices of one of the RESPONSES over PROCESS_FACTORS, reproducible per response"""
+    return sensitivity_analysis(RESPONSES[response], rng=chart_rng(f'sensitivity_{response}'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sobol sensitivity of the film model to the DOE factors")
+    parser.add_argument('responses', nargs='*', default=list(RESPONSES), help="responses to analyse")
+    parser.add_argument('--samples', type=int, default=BASE_SAMPLES, help="base samples N")
+    parser.add_argument('--bootstrap', type=int, default=BOOTSTRAP, help="bootstrap replicates")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes for the model runs")
+    args = parser.parse_args()
+
+    for response in args.responses:
+        if response not in RESPONSES:
+            print(f"Warning: unknown response '{response}'; available: {', '.join(RESPONSES)}")
+            continue
+        start = time.perf_counter()
+        indices = sensitivity_analysis(RESPONSES[response], PROCESS_FACTORS, args.samples, args.bootstrap,
+                                       args.workers, chart_rng(f'sensitivity_{response}'))
+        elapsed = time.perf_counter() - start
+        print(f"\n{response}")
+        print(indices.round(3).to_string())
+        runs = args.samples * (len(PROCESS_FACTORS) + 2)
+        print(f"✅ {runs:,} model runs, {args.bootstrap} bootstrap replicates in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
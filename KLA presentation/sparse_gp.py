@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Sparse Gaussian-Process Surrogate
+Inducing-point approximation of the optimizer's GP for long run histories.
+Runs are summarized by m inducing points chosen greedily from the data, so
+adding a run costs O(m^2) and training grows linearly with the number of runs;
+hyperparameters are fitted by marginal likelihood on random mini-batches and
+predictions over large candidate sets are plain chunked matrix products
+"""
+
+import time
+import argparse
+import numpy as np
+from chart_rng import chart_rng
+from gp_optimizer import GaussianProcess, BayesianOptimization, LENGTH_SCALES
+from process_model import deposition_model, DEPOSITION_BOUNDS
+from run_store import RunStore
+
+INDUCING_POINTS = 256
+# A run becomes an inducing point when more than this share of its prior variance
+# is left unexplained by the current ones
+RESIDUAL_THRESHOLD = 1e-4
+# Noise variances (standardized targets) tried with each length scale
+NOISE_LEVELS = np.array([1e-6, 1e-4, 1e-3, 1e-2, 1e-1])
+BATCH_SIZE = 256
+MINI_BATCHES = 4
+# Rows of data or candidates per kernel block (bounds the n x m intermediates)
+CHUNK_ROWS = 1 << 14
+JITTER = 1e-8
+
+
+class SparseGaussianProcess(GaussianProcess):
+    """GP regression on unit-cube inputs through at most ``max_inducing`` inducing points.
+
+    The projected-process (DTC) approximation: with inducing inputs Z, the
+    posterior only needs K_zn K_nz, K_zn y and K_zn 1, which are accumulated as
+    runs arrive. A run is promoted to an inducing point when it is poorly
+    explained by the current ones; L^-1 of K_zz grows by one row per promotion,
+    as in the exact GP. The length scale and noise are re-tuned whenever the data
+    doubles, each on a few random mini-batches of ``batch_size`` runs, after
+    which the inducing set is reselected in one linear pass.
+    """
+
+    def __init__(self, dims, max_inducing=INDUCING_POINTS, length_scale=0.3, noise=1e-4,
+                 threshold=RESIDUAL_THRESHOLD, batch_size=BATCH_SIZE, capacity=64):
+        super().__init__(dims, length_scale, noise, capacity=0)
+        self.max_inducing = max_inducing
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.X = np.empty((capacity, dims))
+        self.y = np.empty(capacity)
+        self.L_inv = np.zeros((max_inducing, max_inducing))
+        self._reset()
+
+    def _reset(self):
+        """Forget the inducing points and statistics (the stored runs are kept)"""
+        m = self.max_inducing
+        self.Z = np.empty((m, self.dims))
+        self.sources = np.empty(m, dtype=np.int64)
+        self.inducing = 0
+        self.accounted = 0
+        self.A = np.zeros((m, m))
+        self.b = np.zeros(m)
+        self.c = np.zeros(m)
+        self._posterior = None
+
+    def _grow(self, needed):
+        capacity = len(self.y)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        for name in ('X', 'y'):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:])
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def _whitened(self, C):
+        """L^-1 K_zc: candidates in the inducing points' whitened coordinates"""
+        m = self.inducing
+        return self.L_inv[:m, :m] @ self.kernel(self.Z[:m], C)
+
+    def _residual(self, C):
+        """Prior variance of each row of ``C`` left unexplained by the inducing points"""
+        if not self.inducing:
+            return np.ones(len(C))
+        return 1.0 + JITTER - np.sum(self._whitened(C) ** 2, axis=0)
+
+    def _promote(self, index):
+        """Make run ``index`` an inducing point and extend the statistics by its row"""
+        m = self.inducing
+        z = self.X[index]
+        k = self.kernel(self.Z[:m], z[None, :])[:, 0]
+        l = self.L_inv[:m, :m] @ k
+        d = np.sqrt(max(1.0 + JITTER - l @ l, JITTER))
+        self.L_inv[m, :m] = -(l @ self.L_inv[:m, :m]) / d
+        self.L_inv[m, m] = 1.0 / d
+        self.Z[m] = z
+        self.sources[m] = index
+        self.inducing += 1
+        # New row and column of K_zn K_nz over the runs already accumulated
+        row, projection, total = np.zeros(m + 1), 0.0, 0.0
+        for start in range(0, self.accounted, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, self.accounted)
+            K = self.kernel(self.X[start:stop], self.Z[:m + 1])
+            row += K.T @ K[:, m]
+            projection += K[:, m] @ self.y[start:stop]
+            total += K[:, m].sum()
+        self.A[m, :m + 1] = row
+        self.A[:m + 1, m] = row
+        self.b[m] = projection
+        self.c[m] = total
+
+    def _accumulate(self, start, stop, sign=1.0):
+        """Add (or with ``sign`` = -1 remove) runs [start, stop) to the statistics"""
+        m = self.inducing
+        for chunk in range(start, stop, CHUNK_ROWS):
+            end = min(chunk + CHUNK_ROWS, stop)
+            K = self.kernel(self.X[chunk:end], self.Z[:m])
+            self.A[:m, :m] += sign * (K.T @ K)
+            self.b[:m] += sign * (K.T @ self.y[chunk:end])
+            self.c[:m] += sign * K.sum(axis=0)
+
+    def _absorb(self):
+        """Select inducing points among, and accumulate, the runs added since the last call"""
+        start, stop = self.accounted, self.count
+        if self.inducing < self.max_inducing:
+            # Residuals only shrink as inducing points are added, so runs already below
+            # the threshold never need a second look
+            candidates = np.flatnonzero(self._residual(self.X[start:stop]) > self.threshold)
+            for index in start + candidates:
+                if self.inducing == self.max_inducing:
+                    break
+                if self._residual(self.X[index:index + 1])[0] > self.threshold:
+                    self._promote(index)
+        self._accumulate(start, stop)
+        self.accounted = stop
+        self._posterior = None
+
+    def add(self, X, y, tune=True):
+        """Add observations (rows of unit-cube ``X`` with targets ``y``)"""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        self._grow(self.count + len(y))
+        self.X[self.count:self.count + len(y)] = X
+        self.y[self.count:self.count + len(y)] = y
+        self.count += len(y)
+        self._absorb()
+        if tune and self.count >= 2 * max(self.tuned_at, 2):
+            self.tune()
+
+    def truncate(self, count):
+        """Forget every observation after the first ``count``.
+
+        Inducing points are promoted in run order, so those taken from the
+        dropped runs are the last ones; the leading blocks of L^-1 and the
+        statistics stay valid once the dropped runs' contributions are removed.
+        """
+        if count >= self.count:
+            return
+        self.inducing = int(np.searchsorted(self.sources[:self.inducing], count))
+        self._accumulate(count, self.count, sign=-1.0)
+        self.count = self.accounted = count
+        self._posterior = None
+
+    def log_marginal_likelihood(self, length_scale, noise=None, rows=None):
+        """Exact log evidence of the standardized targets of ``rows`` (default: every run)"""
+        noise = self.noise if noise is None else noise
+        rows = np.arange(self.count) if rows is None else rows
+        y = self._standardized()[rows]
+        X = self.X[rows]
+        K = self.kernel(X, X, length_scale) + noise * np.eye(len(rows))
+        try:
+            L = np.linalg.cholesky(K)
+        except np.linalg.LinAlgError:
+            return -np.inf
+        alpha = np.linalg.solve(L, y)
+        return -0.5 * alpha @ alpha - np.log(np.diag(L)).sum() - 0.5 * len(rows) * np.log(2 * np.pi)
+
+    def tune(self):
+        """Pick the length scale and noise with the best mini-batch evidence and reselect Z.
+
+        Batches are drawn with a generator seeded by the run count, so a fit is
+        reproducible from its data.
+        """
+        rng = np.random.default_rng(self.count)
+        size = min(self.batch_size, self.count)
+        batches = [rng.choice(self.count, size, replace=False) for _ in range(MINI_BATCHES)]
+        candidates = [(scale, noise) for scale in LENGTH_SCALES for noise in NOISE_LEVELS]
+        scores = [sum(self.log_marginal_likelihood(scale, noise, rows) for rows in batches)
+                  for scale, noise in candidates]
+        self.length_scale, self.noise = candidates[int(np.argmax(scores))]
+        self.tuned_at = self.count
+        self._reset()
+        self._absorb()
+
+    def _posterior_terms(self):
+        """Cholesky factor of noise*I + L^-1 A L^-T and the whitened weights, cached per state"""
+        if self._posterior is None:
+            m = self.inducing
+            self._standardized()
+            projection = (self.b[:m] - self.y_mean * self.c[:m]) / self.y_std
+            U = self.L_inv[:m, :m]
+            M = self.noise * np.eye(m) + U @ self.A[:m, :m] @ U.T
+            # Near-duplicate inducing points leave M numerically semidefinite; add jitter until it factors
+            jitter = JITTER * max(np.trace(M) / m, 1.0)
+            while True:
+                try:
+                    L = np.linalg.cholesky(M + jitter * np.eye(m))
+                    break
+                except np.linalg.LinAlgError:
+                    jitter *= 10
+            weights = np.linalg.solve(L.T, np.linalg.solve(L, U @ projection))
+            self._posterior = (L, weights)
+        return self._posterior
+
+    def predict(self, C):
+        """Posterior mean and standard deviation at the rows of ``C``, in target units"""
+        C = np.atleast_2d(np.asarray(C, dtype=float))
+        L, weights = self._posterior_terms()
+        mean = np.empty(len(C))
+        variance = np.empty(len(C))
+        for start in range(0, len(C), CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, len(C))
+            phi = self._whitened(C[start:stop])
+            v = np.linalg.solve(L, phi)
+            mean[start:stop] = phi.T @ weights
+            # Prior variance not captured by Z, plus the posterior variance within it
+            variance[start:stop] = 1.0 - np.sum(phi * phi, axis=0) + self.noise * np.sum(v * v, axis=0)
+        std = np.sqrt(np.maximum(variance, 1e-12))
+        return self.y_mean + self.y_std * mean, self.y_std * std
+
+
+def benchmark(sizes, noise=0.5, test_points=20_000, rng=None):
+    """Training and prediction time of the sparse and exact GP on noisy deposition-model runs.
+
+    Returns one row per size: (n, sparse fit s, exact fit s or None, sparse
+    predict s, sparse RMSE, inducing points). The exact GP is only timed up to
+    4,000 runs.
+    """
+    rng = rng or np.random.default_rng()
+    low = np.array([DEPOSITION_BOUNDS[name][0] for name in DEPOSITION_BOUNDS], dtype=float)
+    high = np.array([DEPOSITION_BOUNDS[name][1] for name in DEPOSITION_BOUNDS], dtype=float)
+    test = rng.random((test_points, len(low)))
+    truth = deposition_model(*(low + test * (high - low)).T)
+    rows = []
+    for n in sizes:
+        X = rng.random((n, len(low)))
+        y = deposition_model(*(low + X * (high - low)).T) + rng.normal(0, noise, n)
+        timings = []
+        for model in (SparseGaussianProcess, GaussianProcess):
+            if model is GaussianProcess and n > 4000:
+                timings.append(None)
+                continue
+            gp = model(len(low))
+            start = time.perf_counter()
+            # Runs arrive one at a time, as from an optimizer or a warm start
+            for x, target in zip(X, y):
+                gp.add(x, target)
+            timings.append(time.perf_counter() - start)
+            if model is SparseGaussianProcess:
+                sparse = gp
+        start = time.perf_counter()
+        mean, _ = sparse.predict(test)
+        predict_time = time.perf_counter() - start
+        rmse = float(np.sqrt(np.mean((mean - truth) ** 2)))
+        rows.append((n, timings[0], timings[1], predict_time, rmse, sparse.inducing))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sparse GP surrogate: scaling benchmark or warm-started optimization")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 2000, 4000, 8000, 16000],
+                        help="run-history sizes to benchmark")
+    parser.add_argument('--warm-start', default=None, metavar='STUDY',
+                        help="instead, optimize the deposition model from every run of this run-store study")
+    parser.add_argument('--iterations', type=int, default=15, help="GP-guided probes after the warm start")
+    args = parser.parse_args()
+
+    if args.warm_start:
+        start = time.perf_counter()
+        optimizer = BayesianOptimization(deposition_model, DEPOSITION_BOUNDS, seed=chart_rng('sparse_gp'),
+                                         surrogate=SparseGaussianProcess)
+        with RunStore() as store:
+            warm = store.warm_start(optimizer, study=args.warm_start, limit=None)
+        if not warm:
+            print(f"Warning: no usable runs in study '{args.warm_start}'")
+            return
+        best = optimizer.maximize(0, args.iterations)
+        print(f"✅ Best target {best['target']:.3f} at "
+              + ', '.join(f"{name}={value:.2f}" for name, value in best['params'].items())
+              + f" from {warm:,} stored runs + {args.iterations} probes "
+                f"({optimizer.gp.inducing} inducing points, {time.perf_counter() - start:.2f}s)")
+        return
+
+    print(f"{'Runs':>7} {'Sparse fit':>11} {'Exact fit':>10} {'Predict':>9} {'RMSE':>7} {'Inducing':>9}")
+    for n, sparse_time, exact_time, predict_time, rmse, inducing in benchmark(args.sizes, rng=chart_rng('sparse_gp')):
+        exact = f'{exact_time:.2f}s' if exact_time is not None else '-'
+        print(f"{n:>7,} {sparse_time:>10.2f}s {exact:>10} {predict_time:>8.3f}s {rmse:>7.3f} {inducing:>9}")
+    print("\n✅ Sparse GP benchmark complete (prediction over 20,000 candidates)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,25 +4,18 @@ Update Experience Snapshot with specific text changes and perfect formatting
 """
 
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Rectangle, Circle
-import numpy as np
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from chart_engine import cached_chart, save_chart, diagram_canvas, experience_card, alignment_panel
 
+@cached_chart
 def create_updated_experience_snapshot():
     """Create experience snapshot with updated text and perfect formatting"""
     
     # Create figure with optimal size for clarity
-    fig, ax = plt.subplots(figsize=(18, 14))
-    ax.set_xlim(0, 18)
-    ax.set_ylim(0, 14)
-    ax.axis('off')
-    
-    # Set clean background
-    fig.patch.set_facecolor('white')
+    fig, ax = diagram_canvas((18, 14))
     
     # Title with perfect spacing
     ax.text(9, 13.2, 'EXPERIENCE SNAPSHOT', ha='center', va='center',
@@ -96,56 +89,10 @@ def create_updated_experience_snapshot():
     
     # Draw experience boxes with perfect spacing and alignment
     for exp in experiences:
-        x, y = exp['position']
-        w, h = exp['size']
-        
-        # Main background box with proper padding
-        main_box = FancyBboxPatch((x-w/2, y-h/2), w, h, 
-                                 boxstyle="round,pad=0.2", 
-                                 facecolor=exp['color'], alpha=0.15,
-                                 edgecolor=exp['color'], linewidth=3)
-        ax.add_patch(main_box)
-        
-        # Header box with perfect sizing
-        header_height = 0.8
-        header_y = y + h/2 - header_height - 0.05
-        header_box = FancyBboxPatch((x-w/2+0.15, header_y), 
-                                   w-0.3, header_height,
-                                   boxstyle="round,pad=0.1",
-                                   facecolor=exp['color'], alpha=0.95)
-        ax.add_patch(header_box)
-        
-        # Title text (perfectly centered in header)
-        title_y = header_y + header_height/2
-        ax.text(x, title_y, exp['title'], 
-               ha='center', va='center',
-               fontsize=13, fontweight='bold', color=exp['text_color'])
-        
-        # Content area with optimal spacing
-        content_start_y = y + h/2 - header_height - 0.45
-        item_y = content_start_y
-        line_spacing = 0.26
-        
-        # Draw items with perfect alignment
-        for item in exp['items']:
-            ax.text(x-w/2+0.4, item_y, item, ha='left', va='top',
-                   fontsize=11, color=exp['color'], fontweight='600')
-            item_y -= line_spacing
+        experience_card(ax, exp['position'], exp['size'], exp['title'], exp['items'],
+                        exp['color'], exp['text_color'], items_offset=0.45, line_spacing=0.26)
     
     # KLA alignment section with perfect formatting
-    kla_y = 1.9
-    kla_height = 2.2
-    kla_box = FancyBboxPatch((1, kla_y-kla_height/2), 16, kla_height, 
-                            boxstyle="round,pad=0.3",
-                            facecolor='#1f4e79', alpha=0.12,
-                            edgecolor='#1f4e79', linewidth=3)
-    ax.add_patch(kla_box)
-    
-    # KLA header with perfect positioning
-    ax.text(9, kla_y+0.7, 'KLA SENSARRAY ALIGNMENT', ha='center', va='center',
-           fontsize=16, fontweight='bold', color='#1f4e79')
-    
-    # Alignment points in perfectly balanced columns
     left_alignment = [
         '✓ In-Situ Process Monitoring & Control',
         '✓ Semiconductor Deposition Tool Experience', 
@@ -158,23 +105,13 @@ def create_updated_experience_snapshot():
         '✓ CAD Design & Thermal Analysis'
     ]
     
-    # Left column with perfect spacing
-    point_y = kla_y + 0.2
-    for point in left_alignment:
-        ax.text(2.8, point_y, point, ha='left', va='center',
-               fontsize=12, color='#1f4e79', fontweight='600')
-        point_y -= 0.35
-    
-    # Right column with perfect spacing
-    point_y = kla_y + 0.2
-    for point in right_alignment:
-        ax.text(9.8, point_y, point, ha='left', va='center',
-               fontsize=12, color='#1f4e79', fontweight='600')
-        point_y -= 0.35
+    alignment_panel(ax, center=9, y=1.9, height=2.2, width=16,
+                    title='KLA SENSARRAY ALIGNMENT', columns=(left_alignment, right_alignment),
+                    column_x=(2.8, 9.8), title_offset=0.7, points_offset=0.2)
     
     # Save with optimal quality and margins
     plt.tight_layout()
-    plt.savefig('experience_snapshot_updated.png', dpi=300, bbox_inches='tight',
+    save_chart('experience_snapshot_updated.png', width=9.6, height=7,
                facecolor='white', edgecolor='none', pad_inches=0.4)
     plt.close()
     
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Interactive Web Chart Export
+Writes compact JSON chart specs for the portfolio site, drawn in the browser by
+assets/js/chart-spec-renderer.js on top of the vendored Chart.js. Long series are
+decimated with Largest-Triangle-Three-Buckets (LTTB) so they keep their visual
+shape, peaks and spikes at a few hundred points
+"""
+
+import os
+import json
+import time
+import argparse
+import functools
+import numpy as np
+from matplotlib.colors import to_hex
+from chart_data import (IMPACT_METRICS, IMPACT_BEFORE, IMPACT_AFTER, COOLING_ENERGY_LABELS,
+                        COOLING_ENERGY_SPLIT, COOLING_ENERGY_COLORS, COOLING_METRICS, COOLING_RESULTS)
+from chart_rng import chart_rng
+from gp_optimizer import slide8_runs
+from monte_carlo import RECIPES
+from pareto import pareto_front, process_objectives, OBJECTIVES
+
+# Where the site loads chart specs from
+WEB_CHART_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'assets', 'charts')
+# Points kept per series; about one per horizontal pixel of a site chart
+MAX_POINTS = 600
+# Significant digits written for every number
+SIGNIFICANT_DIGITS = 5
+SPEC_VERSION = 1
+
+
+def lttb(x, y, threshold):
+    """Indices of the ``threshold`` points that Largest-Triangle-Three-Buckets keeps.
+
+    The first and last points are always kept. The points in between are split
+    into equal buckets; from each bucket the point forming the largest triangle
+    with the previously kept point and the next bucket's average is kept.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    count = len(x)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    # Bucket i covers [edges[i], edges[i + 1]) of the points between the two ends
+    every = (count - 2) / (threshold - 2)
+    edges = (np.arange(threshold - 1) * every).astype(np.int64) + 1
+    edges[-1] = count - 1
+    sizes = np.diff(edges)
+    mean_x = np.append(np.add.reduceat(x[:-1], edges[:-1]) / sizes, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:-1], edges[:-1]) / sizes, y[-1])
+
+    kept = np.empty(threshold, np.int64)
+    kept[0], kept[-1] = 0, count - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        anchor_x, anchor_y = x[previous], y[previous]
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs((anchor_x - mean_x[bucket + 1]) * (y[start:stop] - anchor_y)
+                      - (anchor_x - x[start:stop]) * (mean_y[bucket + 1] - anchor_y))
+        previous = start + int(np.argmax(area))
+        kept[bucket + 1] = previous
+    return kept
+
+
+def _compact(values, digits=SIGNIFICANT_DIGITS):
+    """JSON-ready numbers rounded to ``digits`` significant digits, integers without '.0'"""
+    rounded = []
+    for value in np.asarray(values, dtype=float).tolist():
+        value = float(f'{value:.{digits}g}')
+        rounded.append(int(value) if value.is_integer() else value)
+    return rounded
+
+
+def series(name, y, x=None, color=None, max_points=MAX_POINTS, **style):
+    """One chart series, decimated to ``max_points`` with LTTB when it is longer.
+
+    ``style`` passes renderer options through unchanged: ``lineWidth``,
+    ``dash`` (a [dash, gap] list), ``points`` (draw markers), ``step``, ``fill``
+    and ``colors`` (one per pie slice).
+    """
+    y = np.asarray(y, dtype=float)
+    entry = {'name': name}
+    if x is not None:
+        x = np.asarray(x, dtype=float)
+        kept = lttb(x, y, max_points) if max_points else np.arange(len(y))
+        entry['x'] = _compact(x[kept])
+        entry['y'] = _compact(y[kept])
+        if len(kept) < len(y):
+            entry['sourcePoints'] = len(y)
+    else:
+        entry['y'] = _compact(y)
+    if color is not None:
+        entry['color'] = to_hex(color)
+    entry.update(style)
+    return entry
+
+
+def chart_spec(kind, series_list, title=None, x_label=None, y_label=None, labels=None):
+    """Chart spec for the site renderer; ``kind`` is 'line', 'scatter', 'bar' or 'pie'"""
+    spec = {'version': SPEC_VERSION, 'type': kind}
+    if title:
+        spec['title'] = title
+    if x_label:
+        spec['xLabel'] = x_label
+    if y_label:
+        spec['yLabel'] = y_label
+    if labels is not None:
+        # Line breaks used for matplotlib tick labels read badly on the web
+        spec['labels'] = [label.replace('\n', ' ') for label in labels]
+    spec['series'] = series_list
+    return spec
+
+
+def write_spec(spec, path):
+    """Write ``spec`` as minified JSON and return the file size in bytes"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = json.dumps(spec, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def convergence_spec():
+    """Slide 8 Bayesian optimization convergence"""
+    targets = slide8_runs()['deposition_rate'].to_numpy()
+    iterations = np.arange(1, len(targets) + 1)
+    return chart_spec('line', [
+        series('Iteration Results', targets, iterations, 'lightblue', points=True),
+        series('Best Found So Far', np.maximum.accumulate(targets), iterations, 'red',
+               lineWidth=3, points=False),
+    ], title='Bayesian Optimization Convergence', x_label='Iteration Number',
+        y_label='Deposition Rate (Target Value)')
+
+
+def impact_spec():
+    """Thermal calibration project results before and after"""
+    return chart_spec('bar', [
+        series('Before', IMPACT_BEFORE, color='lightcoral'),
+        series('After', IMPACT_AFTER, color='lightgreen'),
+    ], title='Performance Improvements', y_label='Performance Score (%)', labels=IMPACT_METRICS)
+
+
+def thermal_trace_spec(samples=1_000_000, rate=100):
+    """Chamber thermocouple trace of a full calibration run at ``rate`` Hz.
+
+    Synthetic: setpoint steps with an underdamped controller response, sensor
+    noise and a few short spikes. The spikes survive the decimation.
+    """
+    rng = chart_rng('thermal_trace')
+    seconds = np.arange(samples) / rate
+    duration = samples / rate
+    steps = [(0.0, 25.0), (0.05, 300.0), (0.35, 400.0), (0.65, 450.0), (0.85, 25.0)]
+
+    setpoint = np.empty(samples)
+    temperature = np.empty(samples)
+    level = steps[0][1]
+    for (start, target), end in zip(steps, [step[0] for step in steps[1:]] + [1.0]):
+        window = (seconds >= start * duration) & (seconds < end * duration)
+        elapsed = seconds[window] - start * duration
+        setpoint[window] = target
+        # Overshoot and settle: decaying oscillation around the new setpoint
+        temperature[window] = target + (level - target) * np.exp(-elapsed / 60) * np.cos(elapsed / 90)
+        level = temperature[window][-1]
+    temperature += rng.normal(0, 0.4, samples)
+    spikes = rng.choice(samples, 6, replace=False)
+    temperature[spikes] += rng.choice([-1, 1], 6) * rng.uniform(15, 30, 6)
+
+    minutes = seconds / 60
+    # The setpoint is piecewise constant: its change points describe it exactly
+    changes = np.append(np.flatnonzero(np.diff(setpoint, prepend=np.nan)), samples - 1)
+    return chart_spec('line', [
+        series('Thermocouple', temperature, minutes, '#ff6600'),
+        series('Setpoint', setpoint[changes], minutes[changes], '#0066cc', dash=[6, 4], step=True,
+               points=False),
+    ], title='Chamber Temperature During Calibration', x_label='Time (min)', y_label='Temperature (°C)')
+
+
+def pareto_spec(points=400):
+    """Rate vs uniformity Pareto front, thinned to ``points`` recipes, with the deck's two recipes"""
+    front = pareto_front().sort_values('Uniformity')
+    kept = np.unique(np.linspace(0, len(front) - 1, min(points, len(front))).astype(int))
+    rate, uniformity = OBJECTIVES[0][0], OBJECTIVES[1][0]
+    recipes = process_objectives(np.array([list(settings.values()) for settings in RECIPES.values()], dtype=float))
+    return chart_spec('scatter', [
+        series('Pareto-optimal recipes', front[rate].values[kept], front[uniformity].values[kept], '#2ca02c',
+               max_points=None),
+        series('Baseline', recipes[:1, 0], recipes[:1, 1], 'lightcoral', max_points=None),
+        series('Optimized', recipes[1:, 0], recipes[1:, 1], '#0066cc', max_points=None),
+    ], title='Deposition Rate vs Uniformity Trade-off', x_label='Film Uniformity (%)',
+        y_label='Deposition Rate (nm/min)')
+
+
+def cooling_energy_spec(system):
+    """Data center facility energy split for one cooling ``system`` of COOLING_ENERGY_SPLIT"""
+    shares = COOLING_ENERGY_SPLIT[system]
+    labels = [f'{label} ({share}%)' for label, share in zip(COOLING_ENERGY_LABELS, shares)]
+    return chart_spec('pie', [series('Facility Energy (%)', shares, colors=COOLING_ENERGY_COLORS)],
+                      title=system, labels=labels)
+
+
+def cooling_performance_spec():
+    """Data center air vs liquid cooling results"""
+    return chart_spec('bar', [
+        series(system, values, color=color)
+        for (system, values), color in zip(COOLING_RESULTS.items(), ['#ff6600', '#0066cc'])
+    ], title='Cooling Performance Comparison', labels=COOLING_METRICS)
+
+
+WEB_CHARTS = {
+    'bayesian-convergence': convergence_spec,
+    'thermal-impact': impact_spec,
+    'chamber-thermal-trace': thermal_trace_spec,
+    'pareto-front': pareto_spec,
+    'air-cooled-energy': functools.partial(cooling_energy_spec, 'Traditional Air-Cooled System'),
+    'liquid-cooled-energy': functools.partial(cooling_energy_spec, 'Target: Liquid-Cooled Hybrid'),
+    'cooling-performance': cooling_performance_spec,
+}
+
+
+def export_web_charts(names=None, output_dir=WEB_CHART_DIR):
+    """Write the named (default: all) chart specs to ``output_dir`` as <name>.json"""
+    written = []
+    for name in names or WEB_CHARTS:
+        if name not in WEB_CHARTS:
+            print(f"Warning: unknown web chart '{name}'; available: {', '.join(WEB_CHARTS)}")
+            continue
+        start = time.perf_counter()
+        spec = WEB_CHARTS[name]()
+        path = os.path.join(output_dir, f'{name}.json')
+        size = write_spec(spec, path)
+        points = sum(entry.get('sourcePoints', len(entry['y'])) for entry in spec['series'])
+        print(f"✅ {name}.json: {points:,} points -> {size / 1024:.1f} KB "
+              f"({time.perf_counter() - start:.2f}s)")
+        written.append(path)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export chart data as JSON specs for the site")
+    parser.add_argument('charts', nargs='*', help=f"charts to export (default: all of {', '.join(WEB_CHARTS)})")
+    parser.add_argument('-o', '--output-dir', default=WEB_CHART_DIR, help="folder for the .json specs")
+    args = parser.parse_args()
+    export_web_charts(args.charts, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+PDF Byte-Budget Analyzer
+Breaks a generated PDF down by page and project section into images, fonts, content
+streams and overhead, lists the largest XObjects and enforces size budgets
+"""
+
+import io
+import os
+import sys
+import json
+import argparse
+from PIL import Image as PILImage
+from pypdf import PdfReader
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject
+
+CATEGORIES = ('images', 'fonts', 'content', 'overhead')
+
+# Budgets in KB; None disables a check. Sized a little above the current portfolio.
+DEFAULT_BUDGET = {
+    'total_kb': 24 * 1024,
+    'page_kb': 4 * 1024,
+    'section_kb': 8 * 1024,
+    'xobject_kb': 4 * 1024,
+}
+
+
+def _object_size(obj):
+    """Serialized size of a single object, excluding the objects it references"""
+    buffer = io.BytesIO()
+    obj.write_to_stream(buffer)
+    return buffer.tell()
+
+
+class PageWalker:
+    """Attributes every indirect object to the first page that uses it.
+
+    Shared objects (fonts, page furniture forms, images reused on several pages)
+    are charged once, to the page where a reader first needs them.
+    """
+
+    def __init__(self, reader):
+        self.reader = reader
+        self.seen = set()
+
+    def _charge(self, ref, category, totals, xobjects, name=None):
+        if not isinstance(ref, IndirectObject) or ref.idnum in self.seen:
+            return None
+        self.seen.add(ref.idnum)
+        obj = ref.get_object()
+        size = _object_size(obj)
+        totals[category] += size
+        if name is not None:
+            xobjects.append({'name': name, 'idnum': ref.idnum, 'bytes': size, 'category': category,
+                             'width': obj.get('/Width'), 'height': obj.get('/Height')})
+        return obj
+
+    def _charge_tree(self, obj, category, totals):
+        """Charge everything reachable from ``obj`` (font programs, widths, encodings)"""
+        if isinstance(obj, IndirectObject):
+            obj = self._charge(obj, category, totals, None)
+            if obj is None:
+                return
+        if isinstance(obj, DictionaryObject):
+            for key, value in obj.items():
+                if key != '/Parent':
+                    self._charge_tree(value, category, totals)
+        elif isinstance(obj, ArrayObject):
+            for value in obj:
+                self._charge_tree(value, category, totals)
+
+    def _walk_resources(self, resources, totals, xobjects, depth=0):
+        resources = resources.get_object() if resources is not None else None
+        if not isinstance(resources, DictionaryObject):
+            return
+        for font_ref in resources.get('/Font', DictionaryObject()).get_object().values():
+            self._charge_tree(font_ref, 'fonts', totals)
+
+        for name, ref in resources.get('/XObject', DictionaryObject()).get_object().items():
+            xobj = ref.get_object()
+            if xobj.get('/Subtype') == '/Image':
+                if self._charge(ref, 'images', totals, xobjects, name) is not None and '/SMask' in xobj:
+                    self._charge(xobj.raw_get('/SMask'), 'images', totals, xobjects, name + '/SMask')
+            elif self._charge(ref, 'content', totals, xobjects, name) is not None and depth < 8:
+                self._walk_resources(xobj.get('/Resources'), totals, xobjects, depth + 1)
+
+        for key in ('/ExtGState', '/ColorSpace', '/Pattern', '/Shading'):
+            if key in resources:
+                self._charge_tree(resources.raw_get(key), 'overhead', totals)
+
+    def walk(self, page):
+        """Return (category byte totals, XObjects first drawn on this page)"""
+        totals = dict.fromkeys(CATEGORIES, 0)
+        xobjects = []
+        totals['overhead'] += _object_size(page)
+        contents = page.raw_get('/Contents') if '/Contents' in page else None
+        for ref in (contents.get_object() if isinstance(contents, IndirectObject) and
+                    isinstance(contents.get_object(), ArrayObject) else [contents]):
+            self._charge(ref, 'content', totals, xobjects)
+        self._walk_resources(page.get('/Resources'), totals, xobjects)
+        return totals, xobjects
+
+
+def _sections_from_outline(reader):
+    """Fall back to the PDF's top-level bookmarks when no manifest is available"""
+    starts = []
+    for item in reader.outline:
+        if not isinstance(item, list):
+            starts.append({'title': item.title, 'first_page': reader.get_destination_page_number(item) + 1})
+    starts.sort(key=lambda section: section['first_page'])
+    for section, following in zip(starts, starts[1:]):
+        section['last_page'] = following['first_page'] - 1
+    if starts:
+        starts[-1]['last_page'] = len(reader.pages)
+    return starts
+
+
+def _match_sources(xobjects, sources):
+    """Pair each image XObject on a page with the source file of the same pixel size"""
+    sizes = []
+    for path in sources:
+        try:
+            with PILImage.open(path) as img:
+                sizes.append((img.size, path))
+        except OSError:
+            continue
+    for xobject in xobjects:
+        if xobject['category'] != 'images' or xobject['name'].endswith('/SMask'):
+            continue
+        for i, (size, path) in enumerate(sizes):
+            if size == (xobject['width'], xobject['height']):
+                xobject['source'] = path
+                del sizes[i]
+                break
+
+
+def analyze_pdf(pdf_path, manifest_path=None):
+    """Return the per-page, per-section and per-XObject size breakdown of ``pdf_path``"""
+    reader = PdfReader(pdf_path)
+    manifest_path = manifest_path or os.path.splitext(pdf_path)[0] + '.manifest.json'
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    page_images = manifest.get('page_images', {})
+
+    walker = PageWalker(reader)
+    pages, xobjects = [], []
+    for number, page in enumerate(reader.pages, 1):
+        totals, page_xobjects = walker.walk(page)
+        _match_sources(page_xobjects, page_images.get(str(number), []))
+        for xobject in page_xobjects:
+            xobject['page'] = number
+        xobjects.extend(page_xobjects)
+        pages.append(dict(totals, page=number, total=sum(totals.values())))
+
+    # Whatever is not reachable from a page (xref, trailer, outline, info) is overhead
+    file_bytes = os.path.getsize(pdf_path)
+    document_overhead = file_bytes - sum(page['total'] for page in pages)
+
+    sections = []
+    for section in manifest.get('sections') or _sections_from_outline(reader):
+        covered = pages[section['first_page'] - 1:section['last_page']]
+        totals = {category: sum(page[category] for page in covered) for category in CATEGORIES}
+        sections.append(dict(totals, title=section['title'], first_page=section['first_page'],
+                             last_page=section['last_page'], total=sum(totals.values())))
+
+    xobjects.sort(key=lambda xobject: xobject['bytes'], reverse=True)
+    return {'file': pdf_path, 'bytes': file_bytes, 'document_overhead': document_overhead,
+            'pages': pages, 'sections': sections, 'xobjects': xobjects}
+
+
+def check_budget(report, budget=None):
+    """Return a list of budget violations (empty when the document fits)"""
+    budget = dict(DEFAULT_BUDGET, **(budget or {}))
+    violations = []
+    if budget['total_kb'] is not None and report['bytes'] > budget['total_kb'] * 1024:
+        violations.append(f"document is {report['bytes'] / 1024:.0f} KB (budget {budget['total_kb']} KB)")
+    for kind, entries, label in (('page_kb', report['pages'], lambda e: f"page {e['page']}"),
+                                 ('section_kb', report['sections'], lambda e: f"section '{e['title']}'"),
+                                 ('xobject_kb', report['xobjects'],
+                                  lambda e: f"XObject {e.get('source', e['name'])} on page {e['page']}")):
+        if budget[kind] is None:
+            continue
+        for entry in entries:
+            size = entry['total'] if 'total' in entry else entry['bytes']
+            if size > budget[kind] * 1024:
+                violations.append(f"{label(entry)} is {size / 1024:.0f} KB (budget {budget[kind]} KB)")
+    return violations
+
+
+def print_report(report, top=10):
+    kb = lambda n: f"{n / 1024:9.1f}"
+    header = f"{'':<48}{'images':>10}{'fonts':>10}{'content':>10}{'overhead':>10}{'total':>10}"
+
+    print(f"\n{report['file']}: {report['bytes'] / 1024:.1f} KB, {len(report['pages'])} pages\n")
+    print(header)
+    for section in report['sections']:
+        label = f"{section['title'][:36]} (p{section['first_page']}-{section['last_page']})"
+        print(f"{label:<48}" + ' '.join(kb(section[c]) for c in CATEGORIES) + ' ' + kb(section['total']))
+
+    print(f"\n{header}")
+    for page in report['pages']:
+        print(f"{'Page ' + str(page['page']):<48}" + ' '.join(kb(page[c]) for c in CATEGORIES) + ' ' + kb(page['total']))
+    print(f"{'Document overhead (xref, outline, info)':<48}{kb(report['document_overhead']):>50}")
+
+    print(f"\nLargest XObjects:")
+    for xobject in report['xobjects'][:top]:
+        source = xobject.get('source', xobject['name'])
+        dims = f"{xobject['width']}x{xobject['height']}" if xobject['width'] else 'form'
+        print(f"{kb(xobject['bytes'])} KB  page {xobject['page']:>3}  {dims:>11}  {source}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Break down and budget the size of a PDF")
+    parser.add_argument('pdf', nargs='?', default="Varad_Lad_Portfolio_Projects.pdf")
+    parser.add_argument('--manifest', help="section/image manifest written by the generator")
+    parser.add_argument('--top', type=int, default=10, help="number of XObjects to list")
+    parser.add_argument('--json', help="also write the full report to this file")
+    for key, value in DEFAULT_BUDGET.items():
+        parser.add_argument('--max-' + key.replace('_', '-'), dest=key, type=float, default=value,
+                            help=f"budget in KB (default {value})")
+    args = parser.parse_args()
+
+    report = analyze_pdf(args.pdf, args.manifest)
+    print_report(report, args.top)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    violations = check_budget(report, {key: getattr(args, key) for key in DEFAULT_BUDGET})
+    if violations:
+        print("\nBudget exceeded:")
+        for violation in violations:
+            print(f"  - {violation}")
+        sys.exit(1)
+    print("\nWithin budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+/*
+ * Chart spec renderer
+ *
+ * Draws the JSON chart specs written by "KLA presentation/web_chart_export.py"
+ * with Chart.js (assets/js/chart.min.js, loaded first):
+ *
+ *   <div class="chart-spec"><canvas data-chart-spec="assets/charts/chamber-thermal-trace.json"></canvas></div>
+ *
+ * Specs are already decimated, so charts are drawn once without animation or
+ * data parsing. Text and grid colours follow the surrounding CSS colour.
+ * Canvases inside a .project-item are templates for the project modal and are
+ * drawn when the modal copies them: script.js calls renderChartSpecs(modalBody).
+ */
+(function () {
+    'use strict';
+
+    // Above this many points a line is drawn without point markers
+    const MARKER_LIMIT = 100;
+
+    function withAlpha(color, alpha) {
+        if (/^#[0-9a-f]{6}$/i.test(color)) {
+            return color + Math.round(alpha * 255).toString(16).padStart(2, '0');
+        }
+        const match = color.match(/rgba?\(([^)]+)\)/);
+        if (!match) return color;
+        const [r, g, b] = match[1].split(',').map(part => part.trim());
+        return `rgba(${r}, ${g}, ${b}, ${alpha})`;
+    }
+
+    function buildDataset(series, spec) {
+        const color = series.colors || series.color || undefined;
+        const dataset = {
+            label: series.name,
+            borderColor: color,
+            backgroundColor: spec.type === 'bar' || spec.type === 'pie' ? color
+                : (series.fill ? withAlpha(color, 0.3) : color),
+            borderWidth: series.lineWidth || (spec.type === 'bar' ? 1 : 2),
+            fill: Boolean(series.fill)
+        };
+
+        if (series.x) {
+            // Columnar arrays -> Chart.js' internal {x, y} format, so parsing can be skipped
+            const points = new Array(series.y.length);
+            for (let i = 0; i < series.y.length; i++) {
+                points[i] = { x: series.x[i], y: series.y[i] };
+            }
+            dataset.data = points;
+        } else {
+            dataset.data = series.y;
+        }
+
+        if (spec.type === 'line' || spec.type === 'scatter') {
+            const markers = series.points !== undefined ? series.points : series.y.length <= MARKER_LIMIT;
+            dataset.pointRadius = spec.type === 'scatter' ? 3 : (markers ? 3 : 0);
+            dataset.pointHoverRadius = 4;
+            dataset.borderDash = series.dash || [];
+            dataset.stepped = series.step ? 'before' : false;
+            dataset.showLine = spec.type !== 'scatter';
+        }
+        return dataset;
+    }
+
+    function buildConfig(spec, textColor) {
+        const gridColor = withAlpha(textColor, 0.1);
+        const numeric = spec.series.every(series => Array.isArray(series.x));
+        const axis = (label, type) => ({
+            type: type,
+            title: { display: Boolean(label), text: label, color: textColor, font: { weight: 'bold' } },
+            ticks: { color: textColor },
+            grid: { color: gridColor }
+        });
+
+        const pie = spec.type === 'pie';
+        return {
+            type: pie ? 'pie' : (spec.type === 'bar' ? 'bar' : 'line'),
+            data: {
+                labels: spec.labels,
+                datasets: spec.series.map(series => buildDataset(series, spec))
+            },
+            options: {
+                animation: false,
+                parsing: numeric ? false : undefined,
+                normalized: numeric,
+                maintainAspectRatio: false,
+                interaction: { mode: 'nearest', intersect: false },
+                plugins: {
+                    title: {
+                        display: Boolean(spec.title),
+                        text: spec.title,
+                        color: textColor,
+                        font: { size: 16, weight: 'bold' }
+                    },
+                    legend: {
+                        // A pie's legend names its slices
+                        display: pie || spec.series.length > 1,
+                        position: 'bottom',
+                        labels: { color: textColor }
+                    }
+                },
+                scales: pie ? {} : {
+                    x: axis(spec.xLabel, numeric ? 'linear' : 'category'),
+                    y: axis(spec.yLabel, 'linear')
+                }
+            }
+        };
+    }
+
+    function renderChartSpec(canvas, spec) {
+        if (typeof Chart === 'undefined') {
+            console.error('chart-spec-renderer: Chart.js is not loaded');
+            return null;
+        }
+        const textColor = getComputedStyle(canvas.parentElement || canvas).color;
+        return new Chart(canvas, buildConfig(spec, textColor));
+    }
+
+    function loadChartSpec(canvas) {
+        return fetch(canvas.dataset.chartSpec)
+            .then(response => {
+                if (!response.ok) throw new Error(`${response.status} ${response.statusText}`);
+                return response.json();
+            })
+            .then(spec => renderChartSpec(canvas, spec))
+            .catch(error => console.error(`chart-spec-renderer: ${canvas.dataset.chartSpec}: ${error.message}`));
+    }
+
+    function renderChartSpecs(root) {
+        (root || document).querySelectorAll('canvas[data-chart-spec]').forEach(canvas => {
+            if (canvas.dataset.chartRendered || canvas.closest('.project-item')) return;
+            canvas.dataset.chartRendered = 'true';
+            loadChartSpec(canvas);
+        });
+    }
+
+    window.renderChartSpec = renderChartSpec;
+    window.renderChartSpecs = renderChartSpecs;
+
+    document.addEventListener('DOMContentLoaded', function () {
+        renderChartSpecs(document);
+    });
+})();
@@ -1228,6 +1228,9 @@ function initVisualizations() {
   initDataCenterCharts();
   initMermaidDiagrams();
   drawPodSankey();
+  if (typeof renderChartSpecs === 'function') {
+    renderChartSpecs(document.getElementById('project-modal-body'));
+  }
   
   chartsInitialized = true;
   console.log('Visualization initialization completed');
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Application Packet Builder
+Concatenates the cover letter, resume, portfolio and internship report into one PDF
+by copying page objects, without rasterizing or re-rendering any page
+"""
+
+import os
+import time
+import hashlib
+import argparse
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+DOCUMENTS_DIR = "KLA presentation"
+PORTFOLIO_PDF = "Varad_Lad_Portfolio_Projects.pdf"
+
+# (outline title, path) in packet order
+DEFAULT_PACKET = [
+    ("Cover Letter", os.path.join(DOCUMENTS_DIR, "Varad Lad Cover Letter.pdf")),
+    ("Resume", os.path.join(DOCUMENTS_DIR, "Varad Lad Resume.pdf")),
+    ("Engineering Portfolio", PORTFOLIO_PDF),
+    ("Rayn Innovation Internship Report", os.path.join(DOCUMENTS_DIR, "Rayn Innovation Internship Report.pdf")),
+]
+
+# Indirect dictionaries that are safe to share between documents. Pages, page
+# trees and outline items are never merged even when they happen to be equal.
+SHAREABLE_TYPES = {'/Font', '/FontDescriptor', '/Encoding', '/ExtGState'}
+
+
+def _object_key(obj, remap):
+    """Hashable fingerprint of a PDF object with references already remapped.
+
+    Streams are compared by their raw (still encoded) bytes, so fonts and images
+    are never decompressed just to be fingerprinted.
+    """
+    if isinstance(obj, IndirectObject):
+        return ('ref', remap.get(obj.idnum, obj.idnum))
+    if isinstance(obj, StreamObject):
+        header = tuple(sorted((k, _object_key(v, remap)) for k, v in obj.items() if k != '/Length'))
+        return ('stream', header, hashlib.sha1(obj._data).digest())
+    if isinstance(obj, DictionaryObject):
+        return ('dict', tuple(sorted((k, _object_key(v, remap)) for k, v in obj.items())))
+    if isinstance(obj, ArrayObject):
+        return ('array', tuple(_object_key(v, remap) for v in obj))
+    return (type(obj).__name__, str(obj))
+
+
+def _is_shareable(obj):
+    if isinstance(obj, (StreamObject, ArrayObject)):
+        return True
+    return isinstance(obj, DictionaryObject) and obj.get('/Type') in SHAREABLE_TYPES
+
+
+def _rewrite_references(obj, writer, remap):
+    """Point references to merged duplicates at the surviving object, in place"""
+    if isinstance(obj, DictionaryObject):
+        items = obj.items()
+    elif isinstance(obj, ArrayObject):
+        items = enumerate(obj)
+    else:
+        return
+    for key, value in list(items):
+        if isinstance(value, IndirectObject):
+            if value.idnum in remap:
+                obj[key] = IndirectObject(remap[value.idnum], 0, writer)
+        else:
+            _rewrite_references(value, writer, remap)
+
+
+def deduplicate_objects(writer):
+    """Write byte-identical shared resources (fonts, images, widths) only once.
+
+    Merging repeats until stable so that, for example, two font dictionaries
+    become equal once their identical embedded font programs have been merged.
+    Returns the number of objects removed.
+    """
+    objects = writer._objects
+    remap = {}
+    while True:
+        canonical = {}
+        merged = 0
+        for idnum, obj in enumerate(objects, 1):
+            if obj is None or idnum in remap or not _is_shareable(obj):
+                continue
+            key = _object_key(obj, remap)
+            if key in canonical:
+                remap[idnum] = canonical[key]
+                merged += 1
+            else:
+                canonical[key] = idnum
+        if not merged:
+            break
+
+    for idnum in remap:
+        objects[idnum - 1] = None
+    for obj in objects:
+        if obj is not None:
+            _rewrite_references(obj, writer, remap)
+    return len(remap)
+
+
+def build_packet(documents, output_filename="Varad_Lad_Application_Packet.pdf"):
+    """Merge ``documents`` ([(title, path), ...]) into ``output_filename``.
+
+    Each document gets a top-level outline entry; its own bookmarks (such as the
+    portfolio's per-project outline) are nested beneath it. Byte-identical
+    objects shared between the inputs, typically standard font dictionaries,
+    embedded font programs and repeated images, are written only once.
+    """
+    writer = PdfWriter()
+    for title, path in documents:
+        if not os.path.exists(path):
+            print(f"Warning: Packet document not found, skipping: {path}")
+            continue
+        writer.append(PdfReader(path), outline_item=title, import_outline=True)
+
+    removed = deduplicate_objects(writer)
+    print(f"Deduplicated {removed} shared objects")
+    writer.add_metadata({'/Title': 'Varad Lad - Application Packet', '/Author': 'Varad Lad'})
+    writer.page_mode = '/UseOutlines'
+
+    with open(output_filename, 'wb') as f:
+        writer.write(f)
+    return len(writer.pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the application packet PDF")
+    parser.add_argument('-o', '--output', default="Varad_Lad_Application_Packet.pdf")
+    parser.add_argument('--generate', action='store_true',
+                        help="regenerate the portfolio PDF before merging")
+    args = parser.parse_args()
+
+    if args.generate:
+        from improved_portfolio_pdf import RefactoredPortfolioPDFGenerator
+        RefactoredPortfolioPDFGenerator(PORTFOLIO_PDF).generate_pdf()
+
+    start = time.perf_counter()
+    page_count = build_packet(DEFAULT_PACKET, args.output)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    input_bytes = sum(os.path.getsize(path) for _, path in DEFAULT_PACKET if os.path.exists(path))
+    output_bytes = os.path.getsize(args.output)
+    print(f"Application packet created: {args.output} ({page_count} pages, {elapsed_ms:.0f} ms)")
+    print(f"Inputs {input_bytes / 1024:.0f} KB -> packet {output_bytes / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,10 @@ from reportlab.pdfgen import canvas
 from PIL import Image as PILImage
 import textwrap
 from datetime import datetime
+from pdf_page_templates import PageFurniture
 
 class PortfolioPDFGenerator:
-    def __init__(self, output_filename="Varad_Lad_Portfolio_Projects.pdf"):
+    def __init__(self, output_filename="Varad_Lad_Portfolio_Projects.pdf", draft=False):
         self.output_filename = output_filename
         self.doc = SimpleDocTemplate(
             output_filename,
@@ -29,6 +30,7 @@ class PortfolioPDFGenerator:
         )
         self.styles = self._create_styles()
         self.story = []
+        self.furniture = PageFurniture(pagesize=letter, draft=draft)
         
     def _create_styles(self):
         """Create custom styles for the PDF"""
@@ -427,7 +429,9 @@ class PortfolioPDFGenerator:
             )
         
         # Build PDF
-        self.doc.build(self.story)
+        self.doc.build(self.story,
+                       onFirstPage=self.furniture.on_first_page,
+                       onLaterPages=self.furniture.on_later_pages)
         print(f"Portfolio PDF generated successfully: {self.output_filename}")
 
 if __name__ == "__main__":
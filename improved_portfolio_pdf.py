@@ -16,11 +16,17 @@ from PIL import Image as PILImage
 import textwrap
 from datetime import datetime
 import re
+import sys
+from pdf_page_templates import PageFurniture
+from pdf_sections import SectionDocTemplate, split_sections, write_manifest
+from analyze_pdf_size import analyze_pdf, check_budget
 
 class RefactoredPortfolioPDFGenerator:
-    def __init__(self, output_filename="Varad_Lad_Portfolio_Projects.pdf"):
+    def __init__(self, output_filename="Varad_Lad_Portfolio_Projects.pdf", draft=False,
+                 split_dir="portfolio-projects"):
         self.output_filename = output_filename
-        self.doc = SimpleDocTemplate(
+        self.split_dir = split_dir  # None disables the per-project PDFs
+        self.doc = SectionDocTemplate(
             output_filename,
             pagesize=letter,
             rightMargin=0.75*inch,
@@ -30,6 +36,7 @@ class RefactoredPortfolioPDFGenerator:
         )
         self.styles = self._create_styles()
         self.story = []
+        self.furniture = PageFurniture(pagesize=letter, draft=draft)
         self.page_width = letter[0] - 1.5*inch  # Available width
         
     def _create_styles(self):
@@ -984,8 +991,16 @@ class RefactoredPortfolioPDFGenerator:
         self._add_cad_models_collection()
         
         # Build PDF
-        self.doc.build(self.story)
+        self.doc.build(self.story,
+                       onFirstPage=self.furniture.on_first_page,
+                       onLaterPages=self.furniture.on_later_pages)
+        write_manifest(self.doc, self.output_filename)
         print(f"Refactored portfolio PDF generated successfully: {self.output_filename}")
+        
+        # Per-project PDFs reuse the pages laid out above
+        if self.split_dir:
+            manifest = split_sections(self.output_filename, self.doc.sections, self.split_dir)
+            print(f"Split {len(manifest)} project PDFs into {self.split_dir}/")
     
     def _add_cad_models_collection(self):
         """Add CAD Models Collection with all images in proper grid layout"""
@@ -1085,3 +1100,10 @@ class RefactoredPortfolioPDFGenerator:
 if __name__ == "__main__":
     generator = RefactoredPortfolioPDFGenerator()
     generator.generate_pdf()
+    
+    # Fail the build as soon as the output outgrows its byte budget
+    violations = check_budget(analyze_pdf(generator.output_filename))
+    for violation in violations:
+        print(f"Budget exceeded: {violation}")
+    if violations:
+        sys.exit(1)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+PDF Image Optimizer
+Downsamples embedded images that exceed a target DPI at their placed size, re-encodes
+them with the smaller of JPEG and Flate, and rewrites each file in parallel
+"""
+
+import io
+import os
+import math
+import zlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from PIL import Image as PILImage
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ContentStream, NameObject, NumberObject
+
+DOCUMENTS_DIR = "KLA presentation"
+DEFAULT_INPUTS = [
+    os.path.join(DOCUMENTS_DIR, "RAYN-INNOVATION "),
+    os.path.join(DOCUMENTS_DIR, "Varad Lad Resume.pdf"),
+    os.path.join(DOCUMENTS_DIR, "Varad Lad Cover Letter.pdf"),
+]
+
+IDENTITY = (1, 0, 0, 1, 0, 0)
+JPEG_QUALITY = 85
+# Leave images alone unless they carry at least this much more resolution than needed
+OVERSAMPLE_TOLERANCE = 1.25
+UNCOMPRESSED_FILTERS = {'/ASCIIHexDecode', '/ASCII85Decode'}
+
+
+def _multiply(m, n):
+    """Concatenate two PDF transformation matrices (m applied first)"""
+    a, b, c, d, e, f = m
+    A, B, C, D, E, F = n
+    return (a*A + b*C, a*B + b*D, c*A + d*C, c*B + d*D, e*A + f*C + E, e*B + f*D + F)
+
+
+def _collect_placements(content, resources, pdf, ctm, placements, depth=0):
+    """Record the largest placed size, in points, of every image XObject.
+
+    Walks the content stream tracking q/Q/cm and descends into form XObjects, so
+    an image reused at several sizes keeps its largest placement.
+    """
+    xobjects = resources.get('/XObject', {}) if resources else {}
+    xobjects = xobjects.get_object() if hasattr(xobjects, 'get_object') else xobjects
+    stack = []
+    for operands, operator in ContentStream(content, pdf).operations:
+        if operator == b'q':
+            stack.append(ctm)
+        elif operator == b'Q' and stack:
+            ctm = stack.pop()
+        elif operator == b'cm':
+            ctm = _multiply(tuple(float(x) for x in operands), ctm)
+        elif operator == b'Do' and operands[0] in xobjects:
+            ref = xobjects.raw_get(operands[0])
+            xobj = ref.get_object()
+            if xobj.get('/Subtype') == '/Image':
+                width = math.hypot(ctm[0], ctm[1])
+                height = math.hypot(ctm[2], ctm[3])
+                prev_w, prev_h = placements.get(ref.idnum, (0, 0))
+                placements[ref.idnum] = (max(prev_w, width), max(prev_h, height))
+            elif xobj.get('/Subtype') == '/Form' and depth < 8:
+                matrix = tuple(float(x) for x in xobj.get('/Matrix', IDENTITY))
+                _collect_placements(xobj, xobj.get('/Resources'), pdf, _multiply(matrix, ctm),
+                                    placements, depth + 1)
+
+
+def _components(xobj):
+    """Number of colour components of a plain gray/RGB image, else None.
+
+    Masks, palettes, CMYK, non-8-bit images and images with a /Decode array
+    (whose samples are remapped, e.g. inverted, when drawn) are left as they are.
+    """
+    if xobj.get('/ImageMask') or '/Mask' in xobj or xobj.get('/BitsPerComponent') != 8:
+        return None
+    if '/Decode' in xobj:
+        return None
+    colorspace = xobj.get('/ColorSpace')
+    if colorspace == '/DeviceRGB':
+        return 3
+    if colorspace == '/DeviceGray':
+        return 1
+    colorspace = colorspace.get_object() if colorspace is not None else None
+    if isinstance(colorspace, list) and colorspace and colorspace[0] == '/ICCBased':
+        components = colorspace[1].get_object().get('/N')
+        return components if components in (1, 3) else None
+    return None
+
+
+def _filters(xobj):
+    filters = xobj.get('/Filter')
+    if filters is None:
+        return []
+    filters = filters.get_object()
+    return list(filters) if isinstance(filters, list) else [filters]
+
+
+def _decode_image(xobj, components):
+    """Decode an image XObject to a PIL image without touching any other object"""
+    filters = _filters(xobj)
+    if filters and filters[-1] in ('/DCTDecode', '/JPXDecode'):
+        data = xobj._data if len(filters) == 1 else xobj.get_data()
+        image = PILImage.open(io.BytesIO(data))
+        image.load()
+    else:
+        mode = 'L' if components == 1 else 'RGB'
+        image = PILImage.frombytes(mode, (xobj['/Width'], xobj['/Height']), xobj.get_data())
+    return image.convert('L' if components == 1 else 'RGB')
+
+
+def _encode(image):
+    """Return (filter, data) for whichever of JPEG and Flate is smaller.
+
+    Flat-colour images (diagrams, scanned text) are always kept lossless.
+    """
+    raw = image.tobytes()
+    candidates = [('/FlateDecode', zlib.compress(raw, 9))]
+    if image.getcolors(256) is None:
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+        candidates.append(('/DCTDecode', buffer.getvalue()))
+    return min(candidates, key=lambda candidate: len(candidate[1]))
+
+
+def _replace_stream(xobj, image, image_filter, data):
+    """Swap the encoded pixels of an image XObject in place"""
+    xobj._data = data
+    xobj[NameObject('/Filter')] = NameObject(image_filter)
+    xobj[NameObject('/Width')] = NumberObject(image.width)
+    xobj[NameObject('/Height')] = NumberObject(image.height)
+    for key in ('/DecodeParms', '/Length'):
+        if key in xobj:
+            del xobj[key]
+
+
+def optimize_pdf(input_path, output_path, target_dpi=150):
+    """Optimize one PDF; returns (input_path, bytes_before, bytes_after, images_rewritten)"""
+    writer = PdfWriter(clone_from=PdfReader(input_path))
+
+    placements = {}
+    for page in writer.pages:
+        if page.get_contents() is not None:
+            _collect_placements(page.get_contents(), page.get('/Resources'), writer,
+                                IDENTITY, placements)
+
+    rewritten = 0
+    for idnum, (placed_w, placed_h) in placements.items():
+        xobj = writer.get_object(idnum)
+        components = _components(xobj)
+        if components is None:
+            continue
+
+        # Decide from the dictionary alone so untouched images are never decoded
+        needed_w = max(1, math.ceil(placed_w / 72 * target_dpi))
+        needed_h = max(1, math.ceil(placed_h / 72 * target_dpi))
+        downsample = xobj['/Width'] > needed_w * OVERSAMPLE_TOLERANCE
+        uncompressed = all(f in UNCOMPRESSED_FILTERS for f in _filters(xobj))
+        if not downsample and not uncompressed:
+            continue
+
+        # A soft mask is resampled with its image so both stay the same size
+        smask = xobj['/SMask'].get_object() if '/SMask' in xobj else None
+        if smask is not None and downsample:
+            if _components(smask) != 1 or (smask['/Width'], smask['/Height']) != (xobj['/Width'], xobj['/Height']):
+                continue
+
+        image = _decode_image(xobj, components)
+        if downsample:
+            image = image.resize((needed_w, needed_h), PILImage.LANCZOS)
+        image_filter, data = _encode(image)
+        if len(data) >= len(xobj._data):
+            continue
+
+        _replace_stream(xobj, image, image_filter, data)
+        if smask is not None and downsample:
+            mask = _decode_image(smask, 1).resize(image.size, PILImage.LANCZOS)
+            _replace_stream(smask, mask, '/FlateDecode', zlib.compress(mask.tobytes(), 9))
+        rewritten += 1
+
+    writer.compress_identical_objects(remove_duplicates=False, remove_unreferenced=True)
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+
+    before = os.path.getsize(input_path)
+    after = os.path.getsize(output_path)
+    if after >= before:
+        # Nothing worth keeping; ship the original bytes unchanged
+        with open(input_path, 'rb') as src, open(output_path, 'wb') as dst:
+            dst.write(src.read())
+        after, rewritten = before, 0
+    return input_path, before, after, rewritten
+
+
+def _expand_inputs(paths):
+    """Expand directories into the PDFs they contain"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                if name.lower().endswith('.pdf')))
+        elif os.path.exists(path):
+            files.append(path)
+        else:
+            print(f"Warning: PDF not found: {path}")
+    return files
+
+
+def optimize_pdfs(paths, output_dir="optimized-pdfs", target_dpi=150, in_place=False, max_workers=None):
+    """Optimize every PDF in ``paths`` across worker processes and print the savings"""
+    jobs = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for path in _expand_inputs(paths):
+            if in_place:
+                output_path = path + '.optimized'
+            else:
+                output_path = os.path.join(output_dir, os.path.basename(path))
+            jobs[pool.submit(optimize_pdf, path, output_path, target_dpi)] = output_path
+
+        results = []
+        for future in as_completed(jobs):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"Error optimizing {jobs[future]}: {e}")
+            else:
+                if in_place:
+                    os.replace(jobs[future], results[-1][0])
+
+    total_before = total_after = 0
+    for path, before, after, rewritten in sorted(results):
+        total_before += before
+        total_after += after
+        saved = 100 * (before - after) / before if before else 0
+        print(f"{os.path.basename(path)[:60]:<60} {before / 1024:>8.0f} KB -> {after / 1024:>8.0f} KB "
+              f"({saved:4.1f}% saved, {rewritten} images)")
+    if total_before:
+        print(f"{'Total':<60} {total_before / 1024:>8.0f} KB -> {total_after / 1024:>8.0f} KB "
+              f"({100 * (total_before - total_after) / total_before:4.1f}% saved)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Downsample oversized images in existing PDFs")
+    parser.add_argument('paths', nargs='*', default=DEFAULT_INPUTS, help="PDF files or folders")
+    parser.add_argument('-o', '--output-dir', default="optimized-pdfs")
+    parser.add_argument('--dpi', type=int, default=150, help="target resolution at placed size")
+    parser.add_argument('--in-place', action='store_true', help="overwrite the input files")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+    optimize_pdfs(args.paths, args.output_dir, args.dpi, args.in_place, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
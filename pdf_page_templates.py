@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Page Templates for the Portfolio PDF Generators
+Renders repeated page furniture (header, footer, accent rules, DRAFT watermark) once
+as Form XObjects and references them from every page
+"""
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib.colors import HexColor, gray
+
+ACCENT_COLOR = HexColor('#fbd109')
+HEADER_COLOR = HexColor('#2c3e50')
+
+
+class PageFurniture:
+    """Page decorations shared by every page of a portfolio document.
+
+    Each piece of furniture is drawn into a named form the first time a page is
+    started; later pages only emit a ``Do`` operator per form, so the content
+    stream of a page carries the body text plus a handful of bytes of furniture.
+    Only the page number changes from page to page and is drawn directly.
+    """
+
+    HEADER_FORM = 'FurnitureHeader'
+    FOOTER_FORM = 'FurnitureFooter'
+    WATERMARK_FORM = 'FurnitureWatermark'
+
+    def __init__(self, pagesize=letter, left_margin=0.75*inch, right_margin=0.75*inch,
+                 header_text="Varad Lad | Engineering Portfolio",
+                 footer_text="varadlad.github.io/varadlad-portfolio",
+                 draft=False):
+        self.page_width, self.page_height = pagesize
+        self.left = left_margin
+        self.right = self.page_width - right_margin
+        self.header_text = header_text
+        self.footer_text = footer_text
+        self.draft = draft
+
+        # Baselines sit inside the generators' 1" top and 0.75" bottom margins
+        self.header_y = self.page_height - 0.6*inch
+        self.footer_y = 0.45*inch
+
+    def _define_forms(self, canv):
+        """Render the furniture into the canvas' form cache once per document"""
+        if canv.hasForm(self.HEADER_FORM):
+            return
+
+        canv.beginForm(self.HEADER_FORM)
+        canv.setFont('Helvetica-Bold', 9)
+        canv.setFillColor(HEADER_COLOR)
+        canv.drawString(self.left, self.header_y, self.header_text)
+        canv.setStrokeColor(ACCENT_COLOR)
+        canv.setLineWidth(2)
+        canv.line(self.left, self.header_y - 6, self.right, self.header_y - 6)
+        canv.endForm()
+
+        canv.beginForm(self.FOOTER_FORM)
+        canv.setStrokeColor(ACCENT_COLOR)
+        canv.setLineWidth(1)
+        canv.line(self.left, self.footer_y + 12, self.right, self.footer_y + 12)
+        canv.setFont('Helvetica', 8)
+        canv.setFillColor(gray)
+        canv.drawString(self.left, self.footer_y, self.footer_text)
+        canv.endForm()
+
+        canv.beginForm(self.WATERMARK_FORM)
+        canv.setFont('Helvetica-Bold', 110)
+        canv.setFillColor(gray)
+        canv.setFillAlpha(0.12)
+        canv.translate(self.page_width / 2, self.page_height / 2)
+        canv.rotate(45)
+        canv.drawCentredString(0, -40, "DRAFT")
+        canv.endForm()
+
+    def _draw(self, canv, doc, header):
+        """Place the shared forms and the per-page number"""
+        self._define_forms(canv)
+        canv.saveState()
+        if self.draft:
+            canv.doForm(self.WATERMARK_FORM)
+        if header:
+            canv.doForm(self.HEADER_FORM)
+        canv.doForm(self.FOOTER_FORM)
+        canv.setFont('Helvetica', 8)
+        canv.setFillColor(gray)
+        canv.drawRightString(self.right, self.footer_y, str(doc.page))
+        canv.restoreState()
+
+    def on_first_page(self, canv, doc):
+        """onFirstPage callback: the title page carries no running header"""
+        self._draw(canv, doc, header=False)
+
+    def on_later_pages(self, canv, doc):
+        """onLaterPages callback: full header, footer and rules"""
+        self._draw(canv, doc, header=True)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Section Tracking and Splitting for the Portfolio PDF
+Records where each project starts while the combined document is laid out, then
+copies those already-rendered pages into standalone per-project PDFs
+"""
+
+import os
+import re
+import json
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Image, Table
+from pypdf import PdfReader, PdfWriter
+
+
+class SectionDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate that bookmarks every paragraph drawn in the section style.
+
+    The page range of each section is collected during the normal single-pass
+    build, so splitting never needs a second layout. The source file of every
+    image is recorded against the page it was drawn on for the size analyzer.
+    """
+
+    def __init__(self, filename, section_style='ProjectTitle', **kw):
+        SimpleDocTemplate.__init__(self, filename, **kw)
+        self.section_style = section_style
+        self.sections = []
+        self.page_images = {}
+
+    def build(self, flowables, **kw):
+        self.sections = []
+        self.page_images = {}
+        SimpleDocTemplate.build(self, flowables, **kw)
+
+        # Close each section at the page before the next one starts
+        for section, following in zip(self.sections, self.sections[1:]):
+            section['last_page'] = following['first_page'] - 1
+        if self.sections:
+            self.sections[-1]['last_page'] = self.page
+
+    def _record_images(self, flowable):
+        if isinstance(flowable, Image):
+            self.page_images.setdefault(self.page, []).append(flowable.filename)
+        elif isinstance(flowable, Table):
+            for row in flowable._cellvalues:
+                for cell in row:
+                    for item in (cell if isinstance(cell, (list, tuple)) else [cell]):
+                        self._record_images(item)
+
+    def afterFlowable(self, flowable):
+        """Bookmark section titles and remember the page they landed on"""
+        self._record_images(flowable)
+        if not isinstance(flowable, Paragraph) or flowable.style.name != self.section_style:
+            return
+        title = flowable.getPlainText()
+        key = f"section-{len(self.sections) + 1}"
+        self.canv.bookmarkPage(key)
+        self.canv.addOutlineEntry(title, key, level=0)
+        self.sections.append({'title': title, 'first_page': self.page})
+
+
+def write_manifest(doc, pdf_path):
+    """Save section page ranges and per-page image sources next to the PDF"""
+    manifest_path = os.path.splitext(pdf_path)[0] + '.manifest.json'
+    with open(manifest_path, 'w') as f:
+        json.dump({
+            'source': os.path.basename(pdf_path),
+            'sections': doc.sections,
+            'page_images': {str(page): paths for page, paths in sorted(doc.page_images.items())},
+        }, f, indent=2)
+    return manifest_path
+
+
+def _slugify(text):
+    """Lower-case, dash-separated file name fragment"""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def split_sections(pdf_path, sections, output_dir, prefix="Varad_Lad_Portfolio"):
+    """Write one PDF per section by copying page objects from the combined file.
+
+    Returns the manifest entries (title, page range, file name and size) and
+    writes them next to the split files as ``sections.json`` for the website.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    reader = PdfReader(pdf_path)
+    manifest = []
+
+    for number, section in enumerate(sections, 1):
+        writer = PdfWriter()
+        for page_number in range(section['first_page'], section['last_page'] + 1):
+            writer.add_page(reader.pages[page_number - 1])
+        writer.add_outline_item(section['title'], 0)
+        writer.add_metadata({'/Title': section['title'], '/Author': 'Varad Lad'})
+
+        filename = f"{prefix}_{number:02d}_{_slugify(section['title'])}.pdf"
+        path = os.path.join(output_dir, filename)
+        with open(path, 'wb') as f:
+            writer.write(f)
+
+        manifest.append({
+            'title': section['title'],
+            'first_page': section['first_page'],
+            'last_page': section['last_page'],
+            'file': filename,
+            'bytes': os.path.getsize(path),
+        })
+
+    with open(os.path.join(output_dir, 'sections.json'), 'w') as f:
+        json.dump({'source': os.path.basename(pdf_path), 'sections': manifest}, f, indent=2)
+
+    return manifest